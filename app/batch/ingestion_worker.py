@@ -0,0 +1,268 @@
+import argparse
+import json
+import os
+import signal
+import socket
+import sys
+import threading
+import time
+import uuid
+from typing import Any, Callable, Optional
+
+from content.infrastructure.client.youtube_quota import PRIORITIES, quota_scope
+from content.infrastructure.queue.redis_work_queue import RedisWorkQueue, WorkItem
+
+
+def channel_dedupe_key(payload: dict) -> str:
+    return f"{payload.get('kind')}:{payload.get('platform', 'youtube')}:{payload['channel_id']}"
+
+
+def enqueue_channels(
+    queue: RedisWorkQueue,
+    channel_ids: list[str],
+    kind: str = "channel_tags",
+    platform: str = "youtube",
+    params: dict | None = None,
+    priority: str | None = None,
+) -> dict:
+    """
+    채널 id 목록을 작업 큐에 넣는다(생산자). kind: channel_tags(영상 메타/태그만) | channel_bundle(댓글/AI 분석 포함).
+    priority 는 YouTube 쿼터 우선순위(생략하면 kind 별 기본값, DEFAULT_PRIORITIES).
+    """
+    if kind not in HANDLERS:
+        raise ValueError(f"unknown work item kind: {kind}")
+    payloads = [
+        {
+            "kind": kind,
+            "platform": platform,
+            "channel_id": channel_id,
+            "params": params or {},
+            "priority": priority or DEFAULT_PRIORITIES[kind],
+        }
+        for channel_id in dict.fromkeys(channel_ids)
+    ]
+    return queue.enqueue(payloads, dedupe_key=channel_dedupe_key)
+
+
+class _HandlerContext:
+    """
+    워커 프로세스 하나가 재사용하는 저장소/클라이언트. 처음 쓰일 때 만든다.
+    """
+
+    def __init__(self):
+        self._repository = None
+        self._client = None
+        self._sentiment_usecase = None
+
+    @property
+    def repository(self):
+        if self._repository is None:
+            from content.infrastructure.repository.content_repository_impl import ContentRepositoryImpl
+
+            self._repository = ContentRepositoryImpl()
+        return self._repository
+
+    def client(self, platform: str):
+        if platform != "youtube":
+            raise ValueError(f"unsupported platform: {platform}")
+        if self._client is None:
+            from config.settings import YouTubeSettings
+            from content.infrastructure.client.youtube_client import YouTubeClient
+
+            self._client = YouTubeClient(YouTubeSettings())
+        return self._client
+
+    @property
+    def sentiment_usecase(self):
+        if self._sentiment_usecase is None:
+            from config.settings import OpenAISettings
+            from content.application.usecase.sentiment_usecase import SentimentUseCase
+
+            settings = OpenAISettings()
+            if settings.api_key:
+                self._sentiment_usecase = SentimentUseCase(settings)
+        return self._sentiment_usecase
+
+
+def _handle_channel_tags(context: _HandlerContext, payload: dict) -> dict:
+    from app.batch.youtube_tag_batch import _ingest_channel_tags_only
+
+    params = payload.get("params") or {}
+    videos = _ingest_channel_tags_only(
+        client=context.client(payload.get("platform", "youtube")),
+        repository=context.repository,
+        channel_id=payload["channel_id"],
+        max_videos=int(params.get("max_videos", os.getenv("YOUTUBE_TAG_MAX_VIDEOS", "10"))),
+    )
+    return {"channel_id": payload["channel_id"], "video_count": len(videos)}
+
+
+def _handle_channel_bundle(context: _HandlerContext, payload: dict) -> dict:
+    from content.application.usecase.ingestion_usecase import IngestionUseCase
+
+    params = payload.get("params") or {}
+    usecase = IngestionUseCase(context.repository, context.sentiment_usecase)
+    return usecase.ingest_channel_bundle(
+        context.client(payload.get("platform", "youtube")),
+        payload["channel_id"],
+        include_comments=bool(params.get("include_comments", False)),
+        max_videos=int(params.get("max_videos", 10)),
+        max_comments=int(params.get("max_comments", 50)),
+    )
+
+
+HANDLERS: dict[str, Callable[[_HandlerContext, dict], dict]] = {
+    "channel_tags": _handle_channel_tags,
+    "channel_bundle": _handle_channel_bundle,
+}
+
+# 항목에 priority 가 없을 때 쓰는 kind 별 YouTube 쿼터 우선순위
+DEFAULT_PRIORITIES = {
+    "channel_tags": "discovery",
+    "channel_bundle": "normal",
+}
+
+
+class IngestionWorker:
+    """
+    RedisWorkQueue 에서 항목을 하나씩 꺼내 처리하는 워커. 처리량은 워커 프로세스를 늘려(노드 무관) 확장한다.
+    - 처리 중에는 가시성 마감의 1/3 주기로 마감을 연장해, 오래 걸리는 채널도 다른 워커에게 넘어가지 않게 한다.
+    - SIGTERM/SIGINT 를 받으면 현재 항목까지만 처리하고 종료한다.
+    """
+
+    def __init__(
+        self,
+        queue: RedisWorkQueue,
+        worker_id: Optional[str] = None,
+        shards: Optional[list[int]] = None,
+        idle_sleep_seconds: float | None = None,
+        handlers: dict[str, Callable[[Any, dict], dict]] | None = None,
+        context: Any = None,
+    ):
+        self.queue = queue
+        self.worker_id = worker_id or f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:6]}"
+        self.shards = shards if shards is not None else list(range(queue.shards))
+        self.idle_sleep_seconds = idle_sleep_seconds or float(os.getenv("INGESTION_WORKER_IDLE_SECONDS", "2"))
+        self.handlers = handlers or HANDLERS
+        self.context = context if context is not None else _HandlerContext()
+        self._stop = threading.Event()
+        self._rotation = 0
+        self.summary = {"succeeded": 0, "retried": 0, "dead": 0, "stale": 0}
+
+    def stop(self, *_args) -> None:
+        self._stop.set()
+
+    def run(self, max_items: int | None = None, exit_when_empty: bool = False) -> dict:
+        print(f"[INGESTION-WORKER] started | worker_id={self.worker_id}, shards={self.shards}")
+        processed = 0
+        while not self._stop.is_set() and (max_items is None or processed < max_items):
+            if self.process_one():
+                processed += 1
+                continue
+            if exit_when_empty:
+                break
+            self._stop.wait(self.idle_sleep_seconds)
+        print(f"[INGESTION-WORKER] stopped | worker_id={self.worker_id}, summary={self.summary}")
+        return self.summary
+
+    def process_one(self) -> bool:
+        # 담당 샤드의 시작 위치를 매번 바꿔 특정 샤드만 먼저 비워지지 않게 한다.
+        shards = self.shards[self._rotation:] + self.shards[: self._rotation]
+        self._rotation = (self._rotation + 1) % max(len(self.shards), 1)
+        item = self.queue.claim(self.worker_id, shards)
+        if item is None:
+            return False
+
+        heartbeat_stop = threading.Event()
+        heartbeat = threading.Thread(target=self._heartbeat, args=(item, heartbeat_stop), daemon=True)
+        heartbeat.start()
+        started = time.perf_counter()
+        try:
+            kind = item.payload.get("kind")
+            handler = self.handlers.get(kind)
+            if handler is None:
+                raise ValueError(f"unknown work item kind: {kind}")
+            priority = item.payload.get("priority") or DEFAULT_PRIORITIES.get(kind, "normal")
+            with quota_scope(f"work:{kind}", priority=priority) as quota:
+                result = handler(self.context, item.payload)
+        except Exception as exc:  # pylint: disable=broad-except
+            heartbeat_stop.set()
+            heartbeat.join()
+            outcome = self.queue.fail(item, f"{type(exc).__name__}: {exc}")
+            self.summary["retried" if outcome == "retry" else outcome] += 1
+            print(
+                f"[INGESTION-WORKER] item {outcome} | item_id={item.item_id}, attempt={item.attempts}, "
+                f"payload={item.payload}: {exc}"
+            )
+            return True
+
+        heartbeat_stop.set()
+        heartbeat.join()
+        outcome = "succeeded" if self.queue.ack(item, result) else "stale"
+        self.summary[outcome] += 1
+        print(
+            f"[INGESTION-WORKER] item {outcome} | item_id={item.item_id}, "
+            f"duration_ms={int((time.perf_counter() - started) * 1000)}, quota_units={quota.total}"
+        )
+        return True
+
+    def _heartbeat(self, item: WorkItem, stop: threading.Event) -> None:
+        interval = max(self.queue.visibility_ms / 3000, 1.0)
+        while not stop.wait(interval):
+            if not self.queue.extend(item):
+                print(f"[INGESTION-WORKER] lost visibility lease | item_id={item.item_id}")
+                return
+
+
+def _parse_shards(value: str) -> list[int]:
+    return [int(part) for part in value.split(",") if part.strip()]
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Redis 작업 큐 기반 수집 워커/생산자")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    worker = sub.add_parser("worker", help="작업 큐에서 채널을 꺼내 수집한다")
+    worker.add_argument("--worker-id")
+    worker.add_argument("--shards", type=_parse_shards, help="담당 샤드 목록(예: 0,2). 기본은 전체")
+    worker.add_argument("--max-items", type=int)
+    worker.add_argument("--exit-when-empty", action="store_true")
+
+    enqueue = sub.add_parser("enqueue", help="채널 id 를 작업 큐에 넣는다")
+    enqueue.add_argument("channel_ids", nargs="+")
+    enqueue.add_argument("--kind", choices=sorted(HANDLERS), default="channel_tags")
+    enqueue.add_argument("--platform", default="youtube")
+    enqueue.add_argument("--params", type=json.loads, default={}, help='예: {"max_videos": 20}')
+    enqueue.add_argument("--priority", choices=PRIORITIES, help="YouTube 쿼터 우선순위. 기본은 kind 별 값")
+
+    status = sub.add_parser("status", help="배치 진행 상황/항목별 결과를 출력한다")
+    status.add_argument("batch_id")
+
+    sub.add_parser("stats", help="샤드별 대기/처리 중 항목 수를 출력한다")
+
+    args = parser.parse_args(argv)
+    queue = RedisWorkQueue()
+    if args.command == "worker":
+        runner = IngestionWorker(queue, worker_id=args.worker_id, shards=args.shards)
+        signal.signal(signal.SIGTERM, runner.stop)
+        signal.signal(signal.SIGINT, runner.stop)
+        summary = runner.run(max_items=args.max_items, exit_when_empty=args.exit_when_empty)
+        return 0 if summary["dead"] == 0 else 1
+    if args.command == "enqueue":
+        output = enqueue_channels(
+            queue, args.channel_ids, kind=args.kind, platform=args.platform, params=args.params, priority=args.priority
+        )
+    elif args.command == "status":
+        output = queue.batch_status(args.batch_id)
+    else:
+        output = queue.stats()
+    print(json.dumps(output, ensure_ascii=False, indent=2, default=str))
+    return 0
+
+
+if __name__ == "__main__":
+    # 예:
+    #   python -m app.batch.ingestion_worker enqueue UCxxxx UCyyyy --kind channel_bundle
+    #   python -m app.batch.ingestion_worker worker --shards 0,1
+    #   python -m app.batch.ingestion_worker status <BATCH_ID>
+    sys.exit(main())
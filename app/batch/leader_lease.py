@@ -0,0 +1,189 @@
+import os
+import socket
+import threading
+import time
+import uuid
+from typing import Optional
+
+import redis
+
+# 토큰이 일치할 때만 만료 시간을 연장/삭제한다. 다른 인스턴스가 잡은 리스를 건드리지 않기 위함.
+_RENEW_SCRIPT = """
+if redis.call('GET', KEYS[1]) == ARGV[1] then
+    return redis.call('PEXPIRE', KEYS[1], ARGV[2])
+end
+return 0
+"""
+
+_RELEASE_SCRIPT = """
+if redis.call('GET', KEYS[1]) == ARGV[1] then
+    return redis.call('DEL', KEYS[1])
+end
+return 0
+"""
+
+
+class JobRunLock:
+    """
+    배치 잡 한 번의 실행 동안 잡는 Redis 락. 실행 중에는 TTL 의 1/3 주기로 연장한다.
+    리더가 실행 도중 리스를 잃어도 이 락이 남아 있으므로 새 리더가 같은 잡을 동시에 시작하지 못한다.
+    프로세스가 죽으면 연장이 멈춰 TTL 뒤에 풀린다.
+    """
+
+    def __init__(self, client: redis.Redis, key: str, ttl_ms: int, owner_id: str, renew, release):
+        self.client = client
+        self.key = key
+        self.ttl_ms = ttl_ms
+        self.owner_id = owner_id
+        self._renew = renew
+        self._release = release
+        self._stop = threading.Event()
+        self._heartbeat: Optional[threading.Thread] = None
+
+    def acquire(self) -> bool:
+        try:
+            acquired = bool(self.client.set(self.key, self.owner_id, nx=True, px=self.ttl_ms))
+        except redis.RedisError as exc:
+            # 실행 여부를 확인할 수 없으면 실행하지 않는다(중복 실행보다 미실행이 안전).
+            print(f"[BATCH-LEADER] job lock check failed | key={self.key}: {exc}")
+            return False
+        if acquired:
+            self._heartbeat = threading.Thread(target=self._keep_alive, daemon=True)
+            self._heartbeat.start()
+        return acquired
+
+    def release(self) -> None:
+        self._stop.set()
+        if self._heartbeat is not None:
+            self._heartbeat.join()
+        try:
+            self._release(keys=[self.key], args=[self.owner_id])
+        except redis.RedisError as exc:
+            print(f"[BATCH-LEADER] job lock release failed | key={self.key}: {exc}")
+
+    def _keep_alive(self) -> None:
+        interval = max(self.ttl_ms / 3000, 1.0)
+        while not self._stop.wait(interval):
+            try:
+                if not self._renew(keys=[self.key], args=[self.owner_id, self.ttl_ms]):
+                    print(f"[BATCH-LEADER] job lock lost | key={self.key}, owner={self.owner_id}")
+                    return
+            except redis.RedisError as exc:
+                print(f"[BATCH-LEADER] job lock renew failed | key={self.key}: {exc}")
+
+
+class RedisLeaderLease:
+    """
+    Redis 키 하나를 리스(lease)로 사용하는 리더 선출.
+    - SET NX PX 로 리스를 잡은 인스턴스만 리더가 되고, 리더는 주기적으로 만료 시간을 연장한다.
+    - 리더가 죽거나 연장에 실패하면 TTL 이 지난 뒤 다른 인스턴스가 리스를 가져간다(자동 failover).
+    - Redis 에 접근할 수 없으면 리더가 아닌 것으로 간주한다(배치 중복 실행보다 미실행이 안전).
+    - 리스는 실행 시작 시점에만 확인하므로, 실행 도중 리스를 잃는 경우는 job_lock(잡별 실행 락)으로 막는다.
+      실행 중인 배치를 중단하지는 않으므로, 이전 리더의 실행은 끝까지 진행되고 새 리더는 그동안 같은 잡을 건너뛴다.
+    """
+
+    def __init__(
+        self,
+        client: Optional[redis.Redis] = None,
+        key: Optional[str] = None,
+        ttl_seconds: Optional[float] = None,
+        owner_id: Optional[str] = None,
+    ):
+        if client is None:
+            from config.redis_config import get_redis
+
+            client = get_redis()
+        self.client = client
+        self.key = key or os.getenv("BATCH_LEADER_KEY", "batch:leader")
+        self.ttl_ms = int(float(ttl_seconds or os.getenv("BATCH_LEADER_TTL_SECONDS", "60")) * 1000)
+        self.owner_id = owner_id or f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+        self.is_leader = False
+        self.acquired_at: Optional[float] = None
+        self._renew = self.client.register_script(_RENEW_SCRIPT)
+        self._release = self.client.register_script(_RELEASE_SCRIPT)
+
+    @property
+    def renew_interval_seconds(self) -> float:
+        """
+        TTL 의 1/3 주기로 연장해 한두 번 연장에 실패해도 리스를 잃지 않도록 한다.
+        """
+        return max(self.ttl_ms / 3000, 1.0)
+
+    def try_acquire_or_renew(self) -> bool:
+        """
+        리더이면 리스를 연장하고, 아니면 빈 리스를 잡아본다. 호출 후의 리더 여부를 반환한다.
+        """
+        was_leader = self.is_leader
+        try:
+            if was_leader and self._renew(keys=[self.key], args=[self.owner_id, self.ttl_ms]):
+                return True
+            acquired = bool(self.client.set(self.key, self.owner_id, nx=True, px=self.ttl_ms))
+        except redis.RedisError as exc:
+            if was_leader:
+                print(f"[BATCH-LEADER] lease check failed, stepping down | owner={self.owner_id}: {exc}")
+            self.is_leader = False
+            self.acquired_at = None
+            return False
+
+        self.is_leader = acquired
+        if acquired and not was_leader:
+            self.acquired_at = time.time()
+            print(f"[BATCH-LEADER] lease acquired | key={self.key}, owner={self.owner_id}")
+        elif was_leader and not acquired:
+            self.acquired_at = None
+            print(f"[BATCH-LEADER] lease lost | key={self.key}, owner={self.owner_id}")
+        return acquired
+
+    def release(self) -> None:
+        if not self.is_leader:
+            return
+        try:
+            self._release(keys=[self.key], args=[self.owner_id])
+            print(f"[BATCH-LEADER] lease released | key={self.key}, owner={self.owner_id}")
+        except redis.RedisError as exc:
+            print(f"[BATCH-LEADER] lease release failed | owner={self.owner_id}: {exc}")
+        finally:
+            self.is_leader = False
+            self.acquired_at = None
+
+    def job_lock(self, job_name: str) -> JobRunLock:
+        """잡 실행 동안 잡을 락. 리더 리스와 별개로, 실행이 끝날 때까지 유지된다."""
+        return JobRunLock(self.client, f"{self.key}:run:{job_name}", self.ttl_ms, self.owner_id, self._renew, self._release)
+
+    def current_holder(self) -> Optional[str]:
+        try:
+            return self.client.get(self.key)
+        except redis.RedisError:
+            return None
+
+    def status(self) -> dict:
+        return {
+            "key": self.key,
+            "owner_id": self.owner_id,
+            "is_leader": self.is_leader,
+            "holder": self.current_holder(),
+            "ttl_seconds": self.ttl_ms / 1000,
+        }
+
+
+def build_leader_lease() -> Optional[RedisLeaderLease]:
+    """
+    BATCH_LEADER_ELECTION=true 일 때만 리더 선출을 사용한다(단일 인스턴스 개발 환경은 끈 채로 사용).
+    """
+    if os.getenv("BATCH_LEADER_ELECTION", "false").lower() != "true":
+        return None
+    return RedisLeaderLease()
+
+
+if __name__ == "__main__":
+    # 로컬 Redis 로 failover 확인: 터미널 두 곳에서 실행한 뒤 리더 쪽을 종료하면
+    # TTL 이 지난 뒤 다른 쪽이 리더가 된다.
+    #   BATCH_LEADER_TTL_SECONDS=5 python -m app.batch.leader_lease
+    lease = RedisLeaderLease()
+    try:
+        while True:
+            leader = lease.try_acquire_or_renew()
+            print(f"[BATCH-LEADER] owner={lease.owner_id} leader={leader} holder={lease.current_holder()}")
+            time.sleep(lease.renew_interval_seconds)
+    except KeyboardInterrupt:
+        lease.release()
@@ -0,0 +1,335 @@
+import asyncio
+import inspect
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from typing import Any, Callable, Optional
+
+from sqlalchemy import text
+
+from app.batch.leader_lease import RedisLeaderLease
+from config.database.session import SessionLocal
+from content.infrastructure.client.youtube_quota import quota_scope
+
+
+class CronSchedule:
+    """
+    5필드 cron 표현식(분 시 일 월 요일)의 최소 구현. `*`, `*/n`, `a-b`, `a-b/n`, `a,b,c` 를 지원한다.
+    요일은 0(또는 7)=일요일. 일/요일이 모두 지정되면 둘 중 하나만 맞아도 실행한다(표준 cron 규칙).
+    """
+
+    _RANGES = ((0, 59), (0, 23), (1, 31), (1, 12), (0, 7))
+
+    def __init__(self, expression: str):
+        parts = expression.split()
+        if len(parts) != 5:
+            raise ValueError(f"cron expression must have 5 fields: {expression!r}")
+        self.expression = expression
+        self.minutes, self.hours, self.days, self.months, weekdays = (
+            self._parse_field(part, lo, hi) for part, (lo, hi) in zip(parts, self._RANGES)
+        )
+        self.weekdays = {0 if d == 7 else d for d in weekdays}
+        self.day_restricted = parts[2] != "*"
+        self.weekday_restricted = parts[4] != "*"
+
+    @staticmethod
+    def _parse_field(part: str, lo: int, hi: int) -> set[int]:
+        values: set[int] = set()
+        for item in part.split(","):
+            step = 1
+            if "/" in item:
+                item, step_str = item.split("/", 1)
+                step = int(step_str)
+            if item == "*":
+                start, end = lo, hi
+            elif "-" in item:
+                start_str, end_str = item.split("-", 1)
+                start, end = int(start_str), int(end_str)
+            else:
+                start = end = int(item)
+            if start < lo or end > hi or start > end or step < 1:
+                raise ValueError(f"cron field out of range: {part!r}")
+            values.update(range(start, end + 1, step))
+        return values
+
+    def _day_matches(self, dt: datetime) -> bool:
+        day_ok = dt.day in self.days
+        weekday_ok = (dt.weekday() + 1) % 7 in self.weekdays
+        if self.day_restricted and self.weekday_restricted:
+            return day_ok or weekday_ok
+        return day_ok and weekday_ok
+
+    def next_after(self, dt: datetime) -> datetime:
+        candidate = dt.replace(second=0, microsecond=0) + timedelta(minutes=1)
+        # 윤년(2월 29일)까지 고려해 4년치만 탐색한다(2월 30일처럼 존재하지 않는 조합은 예외).
+        limit = candidate + timedelta(days=366 * 4)
+        while candidate <= limit:
+            if candidate.month not in self.months:
+                candidate = (candidate.replace(day=1, hour=0, minute=0) + timedelta(days=32)).replace(day=1)
+                continue
+            if not self._day_matches(candidate):
+                candidate = candidate.replace(hour=0, minute=0) + timedelta(days=1)
+                continue
+            if candidate.hour not in self.hours:
+                candidate = candidate.replace(minute=0) + timedelta(hours=1)
+                continue
+            if candidate.minute not in self.minutes:
+                candidate += timedelta(minutes=1)
+                continue
+            return candidate
+        raise ValueError(f"cron expression never fires: {self.expression!r}")
+
+
+class IntervalSchedule:
+    """
+    고정 주기 스케줄. run_on_start=True 이면 스케줄러 기동 직후 한 번 실행한다.
+    """
+
+    def __init__(self, minutes: float, run_on_start: bool = True):
+        if minutes <= 0:
+            raise ValueError("interval minutes must be positive")
+        self.interval = timedelta(minutes=minutes)
+        self.run_on_start = run_on_start
+
+    def first_run(self, now: datetime) -> datetime:
+        return now if self.run_on_start else now + self.interval
+
+    def next_after(self, dt: datetime) -> datetime:
+        return dt + self.interval
+
+
+@dataclass
+class BatchJob:
+    name: str
+    func: Callable[[], Any]
+    schedule: CronSchedule | IntervalSchedule
+    next_run_at: Optional[datetime] = None
+    running: bool = False
+    last_run: Optional[dict] = None
+    history: list[dict] = field(default_factory=list)
+
+
+def build_schedule(cron_env: str, interval_env: str, default_interval_minutes: int) -> CronSchedule | IntervalSchedule:
+    """
+    cron 환경변수가 있으면 cron 스케줄, 없으면 분 단위 주기 스케줄을 만든다.
+    """
+    cron = os.getenv(cron_env)
+    if cron:
+        return CronSchedule(cron)
+    return IntervalSchedule(float(os.getenv(interval_env, str(default_interval_minutes))))
+
+
+class BatchScheduler:
+    """
+    asyncio 이벤트 루프에서는 스케줄 계산만 하고, 배치 본문은 워커 스레드 풀에서 실행하는 스케줄러.
+    - 같은 잡의 이전 실행이 끝나지 않았으면 새 실행을 건너뛴다(skipped 로 기록).
+    - 실행마다 소요 시간/결과/YouTube 쿼터 사용량을 batch_run 테이블과 메모리 이력(최근 BATCH_HISTORY_SIZE 건)에 남긴다.
+    - leader 가 주어지면 리스를 보유한 인스턴스에서만 배치를 실행한다(여러 레플리카 중 한 곳).
+      리스는 실행 시작 시점에만 확인하므로, 실행 동안에는 잡별 실행 락(leader.job_lock)을 잡아
+      리더가 바뀌어도 같은 잡이 두 인스턴스에서 동시에 돌지 않게 한다(락을 못 잡으면 skipped).
+    """
+
+    def __init__(
+        self,
+        max_workers: int | None = None,
+        session_factory=SessionLocal,
+        leader: RedisLeaderLease | None = None,
+    ):
+        self.max_workers = max_workers or int(os.getenv("BATCH_MAX_WORKERS", "2"))
+        self.session_factory = session_factory
+        self.history_size = int(os.getenv("BATCH_HISTORY_SIZE", "20"))
+        self.jobs: dict[str, BatchJob] = {}
+        self._executor: ThreadPoolExecutor | None = None
+        self._task: asyncio.Task | None = None
+        self._inflight: set[asyncio.Future] = set()
+        self.leader = leader
+        self._leader_checked_at = 0.0
+
+    def add_job(
+        self, name: str, func: Callable[[], Any], schedule: CronSchedule | IntervalSchedule
+    ) -> BatchJob:
+        job = BatchJob(name=name, func=func, schedule=schedule)
+        self.jobs[name] = job
+        return job
+
+    def start(self) -> None:
+        if self._task is not None or not self.jobs:
+            return
+        self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="batch")
+        now = datetime.now()
+        for job in self.jobs.values():
+            if isinstance(job.schedule, IntervalSchedule):
+                job.next_run_at = job.schedule.first_run(now)
+            else:
+                job.next_run_at = job.schedule.next_after(now)
+            print(f"[BATCH-SCHEDULER] job registered | name={job.name}, next_run_at={job.next_run_at}")
+        self._task = asyncio.create_task(self._run_loop())
+
+    async def shutdown(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        if self._executor is not None:
+            # 진행 중인 배치는 중단할 수 없으므로 기다리지 않고 새 작업만 막는다.
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+        if self.leader is not None:
+            await asyncio.to_thread(self.leader.release)
+        print("[BATCH-SCHEDULER] scheduler stopped")
+
+    def leader_status(self) -> dict | None:
+        return self.leader.status() if self.leader is not None else None
+
+    def status(self) -> list[dict]:
+        return [
+            {
+                "name": job.name,
+                "running": job.running,
+                "next_run_at": job.next_run_at.isoformat() if job.next_run_at else None,
+                "last_run": job.last_run,
+                "history": list(job.history),
+            }
+            for job in self.jobs.values()
+        ]
+
+    async def _run_loop(self) -> None:
+        while True:
+            is_leader = await self._check_leader()
+            now = datetime.now()
+            for job in self.jobs.values():
+                if job.next_run_at is None or job.next_run_at > now:
+                    continue
+                job.next_run_at = job.schedule.next_after(now)
+                if not is_leader:
+                    # 리더가 아닌 레플리카는 실행 시각만 넘기고, 실행은 리더에게 맡긴다.
+                    continue
+                if job.running:
+                    self._record(
+                        job,
+                        {"status": "skipped", "started_at": now.isoformat(), "message": "previous run still in progress"},
+                    )
+                    print(f"[BATCH-SCHEDULER] skip overlapping run | name={job.name}")
+                    continue
+                self._dispatch(job)
+
+            next_due = min((j.next_run_at for j in self.jobs.values() if j.next_run_at), default=None)
+            sleep_seconds = 30.0
+            if next_due is not None:
+                sleep_seconds = min(max((next_due - datetime.now()).total_seconds(), 0.5), 30.0)
+            if self.leader is not None:
+                # 배치 실행 여부와 무관하게 리스 연장 주기에 맞춰 깨어난다.
+                sleep_seconds = min(sleep_seconds, self.leader.renew_interval_seconds)
+            await asyncio.sleep(sleep_seconds)
+
+    async def _check_leader(self) -> bool:
+        if self.leader is None:
+            return True
+        if time.monotonic() - self._leader_checked_at >= self.leader.renew_interval_seconds:
+            # Redis 호출은 블로킹이므로 이벤트 루프 밖에서 수행한다.
+            await asyncio.to_thread(self.leader.try_acquire_or_renew)
+            self._leader_checked_at = time.monotonic()
+        return self.leader.is_leader
+
+    def _dispatch(self, job: BatchJob) -> None:
+        job.running = True
+        loop = asyncio.get_running_loop()
+        future = loop.run_in_executor(self._executor, self._execute, job.name, job.func)
+        self._inflight.add(future)
+
+        def _done(fut: asyncio.Future) -> None:
+            self._inflight.discard(fut)
+            job.running = False
+            if fut.cancelled():
+                return
+            self._record(job, fut.result())
+
+        future.add_done_callback(_done)
+
+    def _execute(self, name: str, func: Callable[[], Any]) -> dict:
+        """
+        워커 스레드에서 배치 본문을 실행한다. async 함수는 스레드 전용 이벤트 루프에서 돌린다.
+        """
+        run_lock = self.leader.job_lock(name) if self.leader is not None else None
+        if run_lock is not None and not run_lock.acquire():
+            print(f"[BATCH-SCHEDULER] skip run held by another instance | name={name}")
+            return {
+                "status": "skipped",
+                "started_at": datetime.utcnow().isoformat(),
+                "message": "run in progress on another instance",
+            }
+        try:
+            return self._run(name, func)
+        finally:
+            if run_lock is not None:
+                run_lock.release()
+
+    def _run(self, name: str, func: Callable[[], Any]) -> dict:
+        started_at = datetime.utcnow()
+        started = time.perf_counter()
+        print(f"[BATCH-SCHEDULER] run started | name={name}")
+        # 배치 안에서 발생한 YouTube 호출의 쿼터 사용량을 모은다(우선순위는 배치가 quota_scope 로 지정).
+        with quota_scope(f"batch:{name}") as quota:
+            try:
+                result = func()
+                if inspect.isawaitable(result):
+                    result = asyncio.run(result)
+                status, message = "success", self._summarize(result)
+            except Exception as exc:  # pylint: disable=broad-except
+                # 한 번 실패해도 다음 주기에 재시도할 수 있도록 예외를 기록만 한다.
+                status, message = "failed", f"{type(exc).__name__}: {exc}"
+        finished_at = datetime.utcnow()
+        record = {
+            "status": status,
+            "started_at": started_at.isoformat(),
+            "finished_at": finished_at.isoformat(),
+            "duration_ms": int((time.perf_counter() - started) * 1000),
+            "message": message,
+            "quota_units": quota.total,
+            "quota_by_method": dict(quota.by_method),
+        }
+        print(
+            f"[BATCH-SCHEDULER] run {status} | name={name}, duration_ms={record['duration_ms']}, "
+            f"quota_units={quota.total}"
+        )
+        self._persist(name, record, started_at, finished_at)
+        return record
+
+    def _persist(self, name: str, record: dict, started_at: datetime, finished_at: datetime) -> None:
+        try:
+            with self.session_factory() as db:
+                db.execute(
+                    text(
+                        """
+                        INSERT INTO batch_run (job_name, status, started_at, finished_at, duration_ms, message, quota_units)
+                        VALUES (:job_name, :status, :started_at, :finished_at, :duration_ms, :message, :quota_units)
+                        """
+                    ),
+                    {
+                        "job_name": name,
+                        "status": record["status"],
+                        "started_at": started_at,
+                        "finished_at": finished_at,
+                        "duration_ms": record["duration_ms"],
+                        "message": record["message"],
+                        "quota_units": record["quota_units"],
+                    },
+                )
+                db.commit()
+        except Exception as exc:  # pylint: disable=broad-except
+            print(f"[BATCH-SCHEDULER] failed to record run | name={name}: {exc}")
+
+    def _record(self, job: BatchJob, record: dict) -> None:
+        job.last_run = record
+        job.history.append(record)
+        del job.history[: -self.history_size]
+
+    @staticmethod
+    def _summarize(result: Any) -> str:
+        text_value = str(result)
+        return text_value if len(text_value) <= 2000 else text_value[:2000] + "..."
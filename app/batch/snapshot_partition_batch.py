@@ -0,0 +1,46 @@
+import argparse
+import os
+from datetime import date
+
+from app.batch.scheduler import BatchScheduler, build_schedule
+from content.infrastructure.repository.snapshot_partition_repository import SnapshotPartitionRepository
+
+
+def run_snapshot_partition_maintenance(as_of: date | None = None) -> dict:
+    """
+    video_metrics_snapshot 파티션 유지보수 단일 실행: 다음 달 파티션 미리 생성 -> 보존 기간 지난 파티션 정리.
+    """
+    as_of = as_of or date.today()
+    repository = SnapshotPartitionRepository()
+    created = repository.ensure_partitions(as_of=as_of)
+    retention = repository.apply_retention(as_of=as_of)
+    return {"as_of": as_of.isoformat(), "created": created, "retention": retention}
+
+
+def register_snapshot_partition_batch(scheduler: BatchScheduler) -> None:
+    """
+    - ENABLE_SNAPSHOT_PARTITION_BATCH (기본 true) 가 true 인 경우에만 등록한다.
+    - SNAPSHOT_PARTITION_BATCH_CRON 이 있으면 cron, 없으면 SNAPSHOT_PARTITION_BATCH_INTERVAL_MINUTES (기본 1440) 주기.
+      주기 스케줄은 기동 직후 한 번 실행되어 이번 달/다음 달 파티션이 바로 준비된다.
+    """
+    if os.getenv("ENABLE_SNAPSHOT_PARTITION_BATCH", "true").lower() != "true":
+        return
+
+    scheduler.add_job(
+        "snapshot_partition_batch",
+        run_snapshot_partition_maintenance,
+        build_schedule("SNAPSHOT_PARTITION_BATCH_CRON", "SNAPSHOT_PARTITION_BATCH_INTERVAL_MINUTES", 1440),
+    )
+
+
+if __name__ == "__main__":
+    # 수동 실행:
+    #   python -m app.batch.snapshot_partition_batch
+    #   python -m app.batch.snapshot_partition_batch --migrate-legacy   (파티션 이전 일반 테이블을 월 단위로 이전, 1회성)
+    parser = argparse.ArgumentParser(description="video_metrics_snapshot 파티션 유지보수 / 1회성 파티션 이전")
+    parser.add_argument("--migrate-legacy", action="store_true", help="일반 테이블을 월별 파티션 테이블로 이전")
+    args = parser.parse_args()
+
+    if args.migrate_legacy:
+        print(SnapshotPartitionRepository().migrate_unpartitioned())
+    print(run_snapshot_partition_maintenance())
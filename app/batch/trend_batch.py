@@ -1,8 +1,11 @@
+import argparse
 import asyncio
 import os
+from datetime import date, timedelta
 
 from sqlalchemy import text
 
+from app.batch.scheduler import BatchScheduler, build_schedule
 from content.application.usecase.trend_aggregation_usecase import TrendAggregationUseCase
 from content.infrastructure.repository.content_repository_impl import ContentRepositoryImpl
 from config.database.session import SessionLocal
@@ -10,19 +13,63 @@ from config.database.session import SessionLocal
 
 async def run_trend_batch_once(as_of: date | None = None, window_days: int = 7, platform: str | None = None) -> dict:
     """
+    트렌드 배치 단일 실행: 스냅샷 적재 -> video_velocity 단계 -> 일별 팩트 적재 -> 키워드/카테고리 집계.
+    - TREND_INCREMENTAL=true 이면 마지막 성공 집계 이후 변경된 영상이 건드린 키워드/카테고리만 재계산한다.
     """
-    snapshot_video_metrics(as_of=as_of or date.today(), platform=platform)
+    as_of = as_of or date.today()
+    snapshot_rows = snapshot_video_metrics(as_of=as_of, platform=platform)
+    print("[TREND-BATCH] changed video snapshots written:", snapshot_rows)
     usecase = TrendAggregationUseCase(ContentRepositoryImpl())
-    return usecase.aggregate(as_of=as_of, window_days=window_days, platform=platform)
+    incremental = os.getenv("TREND_INCREMENTAL", "false").lower() == "true"
+    if not incremental:
+        velocity = usecase.refresh_video_velocity(as_of=as_of, window_days=window_days, platform=platform)
+        print("[TREND-BATCH] video_velocity refreshed:", velocity)
+    # 일별 팩트는 최근 일자(TREND_FACT_REFRESH_DAYS)와 지난 적재 이후 팩트 값이 바뀐 게시일만 다시 적재한다.
+    facts = usecase.refresh_daily_facts(as_of=as_of, platform=platform)
+    print("[TREND-BATCH] daily facts refreshed:", facts)
+    # 증분 모드에서는 aggregate 가 변경 영상만 골라 video_velocity 를 갱신한다.
+    result = usecase.aggregate(
+        as_of=as_of,
+        window_days=window_days,
+        platform=platform,
+        refresh_velocity=incremental,
+        incremental=incremental,
+    )
+
+    # BATCH_TREND_LOOKBACK_DAYS=N 이면 as_of 이전 N-1일치도 집합 기반 백필로 함께 재계산한다.
+    lookback_days = int(os.getenv("BATCH_TREND_LOOKBACK_DAYS", "1"))
+    if lookback_days > 1:
+        result["lookback"] = usecase.backfill(
+            from_date=as_of - timedelta(days=lookback_days - 1),
+            to_date=as_of - timedelta(days=1),
+            window_days=window_days,
+            platform=platform,
+        )
+    return result
+
+
+def run_trend_backfill(
+    from_date: date,
+    to_date: date,
+    window_days: int = 7,
+    platform: str | None = None,
+) -> dict:
+    """
+    기간 전체의 keyword_trend / category_trend 를 한 번에 재구축한다. (스키마 변경 후 히스토리 재생성용)
+    """
+    usecase = TrendAggregationUseCase(ContentRepositoryImpl())
+    return usecase.backfill(from_date=from_date, to_date=to_date, window_days=window_days, platform=platform)
 
 
-def snapshot_video_metrics(as_of: date, platform: str | None = None) -> None:
+def snapshot_video_metrics(as_of: date, platform: str | None = None) -> int:
     """
     영상 메트릭(조회/좋아요/댓글)을 일별 스냅샷 테이블에 적재해 속도 계산의 기준점을 만듭니다.
-    하루 1회 호출을 가정합니다.
+    직전 스냅샷과 값이 같은 영상은 건너뛰고, 처음 보는 영상과 지표가 바뀐 영상만 기록합니다.
+    읽는 쪽은 기준일 이전의 최신 스냅샷을 사용하므로 빈 날짜는 마지막 값이 이어지는 것과 같습니다.
+    (ingestion 의 upsert_video 도 지표 변경 시 스냅샷을 남기므로, 이 배치는 누락분을 메우는 역할입니다.)
     """
     with SessionLocal() as db:
-        db.execute(
+        result = db.execute(
             text(
                 """
                 INSERT INTO video_metrics_snapshot (video_id, platform, snapshot_date, view_count, like_count, comment_count)
@@ -34,40 +81,84 @@ def snapshot_video_metrics(as_of: date, platform: str | None = None) -> None:
                     v.like_count,
                     v.comment_count
                 FROM video v
+                LEFT JOIN LATERAL (
+                    SELECT s.view_count, s.like_count, s.comment_count
+                    FROM video_metrics_snapshot s
+                    WHERE s.video_id = v.video_id
+                      AND s.platform = v.platform
+                      AND s.snapshot_date <= :snapshot_date
+                    ORDER BY s.snapshot_date DESC
+                    LIMIT 1
+                ) last ON true
                 WHERE (:platform IS NULL OR v.platform = :platform)
+                  AND v.view_count IS NOT NULL
+                  AND (
+                      last.view_count IS NULL
+                      OR (last.view_count, last.like_count, last.comment_count)
+                         IS DISTINCT FROM (v.view_count, v.like_count, v.comment_count)
+                  )
                 ON CONFLICT (video_id, snapshot_date, platform)
                 DO UPDATE SET
                     view_count = EXCLUDED.view_count,
                     like_count = EXCLUDED.like_count,
-                    comment_count = EXCLUDED.comment_count
+                    comment_count = EXCLUDED.comment_count,
+                    captured_at = EXCLUDED.captured_at
+                WHERE (video_metrics_snapshot.view_count, video_metrics_snapshot.like_count, video_metrics_snapshot.comment_count)
+                      IS DISTINCT FROM (EXCLUDED.view_count, EXCLUDED.like_count, EXCLUDED.comment_count)
                 """
             ),
             {"snapshot_date": as_of, "platform": platform},
         )
         db.commit()
+    return result.rowcount
 
 
-async def start_trend_scheduler():
+def register_trend_batch(scheduler: BatchScheduler) -> None:
     """
-    - BATCH_TREND_INTERVAL_MINUTES (기본 60), BATCH_TREND_WINDOW_DAYS (기본 7) 사용.
-    - BATCH_TREND_LOOKBACK_DAYS: 오늘을 anchor로 N일치 as_of를 역순 실행(예: 3이면 오늘, 어제, 그제)
+    - ENABLE_TREND_BATCH=true 인 경우에만 스케줄러에 등록한다.
+    - BATCH_TREND_CRON(예: "5 * * * *")이 있으면 cron, 없으면 BATCH_TREND_INTERVAL_MINUTES (기본 60) 주기.
+    - BATCH_TREND_WINDOW_DAYS (기본 7) 사용.
+    - BATCH_TREND_LOOKBACK_DAYS: 오늘을 anchor로 N일치 as_of를 함께 재계산(예: 3이면 오늘, 어제, 그제)
     """
     if os.getenv("ENABLE_TREND_BATCH", "false").lower() != "true":
         return
 
-    interval_minutes = int(os.getenv("BATCH_TREND_INTERVAL_MINUTES", "60"))
     window_days = int(os.getenv("BATCH_TREND_WINDOW_DAYS", "7"))
-    try:
-        while True:
-            try:
-                print("[TREND-BATCH] run started")
-            except Exception as exc:
-                print("[TREND-BATCH] failed:", exc)
-            await asyncio.sleep(interval_minutes * 60)
-    except asyncio.CancelledError:
-        print("[TREND-BATCH] scheduler stopped")
-        raise
+    scheduler.add_job(
+        "trend_batch",
+        lambda: run_trend_batch_once(window_days=window_days),
+        build_schedule("BATCH_TREND_CRON", "BATCH_TREND_INTERVAL_MINUTES", 60),
+    )
 
 
 if __name__ == "__main__":
-    asyncio.run(run_trend_batch_once())
+    # 수동 실행:
+    #   python -m app.batch.trend_batch
+    #   python -m app.batch.trend_batch --backfill-from 2025-09-01 --backfill-to 2025-11-30 --window-days 7
+    #   python -m app.batch.trend_batch --verify-facts --as-of 2025-11-30   (저장된 팩트 vs single_pass 비교)
+    parser = argparse.ArgumentParser(description="트렌드 배치 수동 실행 / 기간 백필")
+    parser.add_argument("--backfill-from", type=date.fromisoformat, default=None)
+    parser.add_argument("--backfill-to", type=date.fromisoformat, default=None)
+    parser.add_argument("--window-days", type=int, default=7)
+    parser.add_argument("--platform", default=None)
+    parser.add_argument("--verify-facts", action="store_true", help="저장된 팩트 집계를 single_pass 와 비교(읽기 전용)")
+    parser.add_argument("--as-of", type=date.fromisoformat, default=None)
+    args = parser.parse_args()
+
+    if args.verify_facts:
+        check = TrendAggregationUseCase(ContentRepositoryImpl()).verify_facts_mode(
+            as_of=args.as_of, window_days=args.window_days, platform=args.platform
+        )
+        print(check)
+        raise SystemExit(0 if check["matched"] else 1)
+    if args.backfill_from:
+        print(
+            run_trend_backfill(
+                from_date=args.backfill_from,
+                to_date=args.backfill_to or date.today(),
+                window_days=args.window_days,
+                platform=args.platform,
+            )
+        )
+    else:
+        print(asyncio.run(run_trend_batch_once(window_days=args.window_days, platform=args.platform)))
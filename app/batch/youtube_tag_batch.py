@@ -1,12 +1,16 @@
 import asyncio
 import os
+import time
+from datetime import datetime
 from typing import Any, Dict
 
 from sqlalchemy import text
 
+from app.batch.scheduler import BatchScheduler, build_schedule
 from config.database.session import SessionLocal
 from config.settings import YouTubeSettings
 from content.infrastructure.client.youtube_client import YouTubeClient
+from content.infrastructure.client.youtube_quota import quota_scope
 from content.infrastructure.repository.content_repository_impl import ContentRepositoryImpl
 
 
@@ -24,6 +28,9 @@ async def run_youtube_tag_batch_once() -> Dict[str, Any]:
       해당 category 로 분석된 영상들(video_sentiment.category)을 통해 관련 channel_id 를 찾는다.
     - 이렇게 얻은 (category, channel_id) 쌍 각각에 대해 IngestionUseCase.ingest_channel_bundle 을 호출한다.
     - Video.snippet.tags 는 IngestionUseCase 내부에서 keyword_mapping 까지 자동 반영된다.
+    - YOUTUBE_TAG_BATCH_MODE=queue 이면 채널 수집을 이 프로세스에서 하지 않고 Redis 작업 큐에 넣은 뒤,
+      워커(python -m app.batch.ingestion_worker worker)들이 처리를 끝낼 때까지
+      최대 YOUTUBE_TAG_QUEUE_WAIT_SECONDS(기본 1800초) 기다렸다가 카테고리 태그를 집계한다.
     """
     # 1) category_trend 에 존재하는 모든 카테고리 목록을 조회 (날짜와 무관하게 중복 제거)
     with SessionLocal() as db:
@@ -70,6 +77,14 @@ async def run_youtube_tag_batch_once() -> Dict[str, Any]:
 
     repository = ContentRepositoryImpl()
     client = YouTubeClient(YouTubeSettings())
+    # 여러 카테고리에 걸친 채널도 한 번만 수집한다.
+    channel_ids = list(dict.fromkeys(ch_id for channels in category_channels.values() for ch_id in channels))
+    if os.getenv("YOUTUBE_TAG_BATCH_MODE", "inline").lower() == "queue":
+        video_counts = await _ingest_channels_via_queue(channel_ids, max_videos)
+    else:
+        # 신규 영상 탐색 작업이므로 쿼터가 모자라면 지표 갱신(critical)/API 요청(normal)에 양보한다.
+        with quota_scope("youtube_tag_batch", priority="discovery"):
+            video_counts = _ingest_tags_for_channels(client, repository, channel_ids, max_videos)
 
     summary: Dict[str, Any] = {
         "total_categories": 0,
@@ -84,20 +99,14 @@ async def run_youtube_tag_batch_once() -> Dict[str, Any]:
         cat_channels_info: list[Dict[str, Any]] = []
 
         for channel_id in channels:
-            print(f"[YOUTUBE-TAG-BATCH] ingest channel(tags only) | category={category}, channel_id={channel_id}")
-            videos = _ingest_channel_tags_only(
-                client=client,
-                repository=repository,
-                channel_id=channel_id,
-                max_videos=max_videos,
-            )
-            cat_video_count += len(videos)
-            summary["total_videos"] += len(videos)
+            video_count = video_counts.get(channel_id, 0)
+            cat_video_count += video_count
+            summary["total_videos"] += video_count
             summary["total_channels"] += 1
             cat_channels_info.append(
                 {
                     "channel_id": channel_id,
-                    "video_count": len(videos),
+                    "video_count": video_count,
                 }
             )
 
@@ -114,6 +123,71 @@ async def run_youtube_tag_batch_once() -> Dict[str, Any]:
     return summary
 
 
+async def _ingest_channels_via_queue(channel_ids: list[str], max_videos: int) -> Dict[str, int]:
+    """
+    채널 목록을 작업 큐에 넣고 워커들의 처리 결과를 기다린다. 반환값은 채널별 적재 영상 수.
+    이전 배치에서 대기/실행 중인 채널은 새로 넣지 않고 그 항목이 끝날 때까지 함께 기다린다(배치 total 에 포함).
+    제한 시간 안에 끝나지 않은 채널은 결과에서 빠지며, 다음 배치에서 이미 대기 중인 항목과 합쳐진다.
+    """
+    from app.batch.ingestion_worker import enqueue_channels
+    from content.infrastructure.queue.redis_work_queue import RedisWorkQueue
+
+    queue = RedisWorkQueue()
+    batch_id = enqueue_channels(queue, channel_ids, kind="channel_tags", params={"max_videos": max_videos})["batch_id"]
+    deadline = time.monotonic() + float(os.getenv("YOUTUBE_TAG_QUEUE_WAIT_SECONDS", "1800"))
+    poll_seconds = float(os.getenv("YOUTUBE_TAG_QUEUE_POLL_SECONDS", "5"))
+    status = queue.batch_status(batch_id, include_results=False)
+    while status["total"] and not status["done"] and time.monotonic() < deadline:
+        await asyncio.sleep(poll_seconds)
+        status = queue.batch_status(batch_id, include_results=False)
+
+    status = queue.batch_status(batch_id)
+    print(
+        f"[YOUTUBE-TAG-BATCH] queue batch {'done' if status['done'] else 'timed out'} | batch_id={batch_id}, "
+        f"total={status['total']}, coalesced={status['coalesced']}, succeeded={status['succeeded']}, "
+        f"dead={status['dead']}"
+    )
+    return {
+        record["result"]["channel_id"]: record["result"]["video_count"]
+        for record in status["results"]
+        if record["status"] == "succeeded"
+    }
+
+
+def _ingest_tags_for_channels(
+    client: YouTubeClient,
+    repository: ContentRepositoryImpl,
+    channel_ids: list[str],
+    max_videos: int,
+) -> Dict[str, int]:
+    """
+    _ingest_channel_tags_only 의 여러 채널 버전. 채널마다 videos.list 를 따로 부르지 않고
+    YouTubeClient.fetch_videos_for_channels 로 채널 경계 없이 50개 단위로 묶어 조회하며,
+    받는 대로 YOUTUBE_TAG_UPSERT_CHUNK(기본 200)개씩 upsert 한다. 반환값은 채널별 적재 영상 수.
+    """
+    chunk_size = int(os.getenv("YOUTUBE_TAG_UPSERT_CHUNK", "200"))
+    video_counts: Dict[str, int] = {}
+    buffer = []
+    written = 0
+    print(f"[YOUTUBE-TAG-BATCH] ingest channels(tags only) | channels={len(channel_ids)}")
+    for video in client.fetch_videos_for_channels(channel_ids, max_results=max_videos):
+        video.platform = client.platform
+        # 수집 시각을 채워 증분 트렌드 집계가 변경 영상으로 인식하도록 한다.
+        video.crawled_at = video.crawled_at or datetime.utcnow()
+        video_counts[video.channel_id] = video_counts.get(video.channel_id, 0) + 1
+        buffer.append(video)
+        if len(buffer) >= chunk_size:
+            written += repository.upsert_videos(buffer)
+            buffer = []
+    if buffer:
+        written += repository.upsert_videos(buffer)
+    # ETag 304 로 변경 없음이 확인되고 저장된 지표도 같은 영상은 upsert_videos 가 건너뛴다.
+    print(
+        f"[YOUTUBE-TAG-BATCH] ingested channels(tags only) | videos={sum(video_counts.values())}, written={written}"
+    )
+    return video_counts
+
+
 def _ingest_channel_tags_only(
     client: YouTubeClient,
     repository: ContentRepositoryImpl,
@@ -129,8 +203,10 @@ def _ingest_channel_tags_only(
 
     for video in videos:
         video.platform = client.platform
-        repository.upsert_video(video)
+        # 수집 시각을 채워 증분 트렌드 집계가 변경 영상으로 인식하도록 한다.
+        video.crawled_at = video.crawled_at or datetime.utcnow()
         ingested_videos.append(video.video_id)
+    repository.upsert_videos(videos)
 
     return ingested_videos
 
@@ -195,33 +271,23 @@ def _insert_category_trend_tags(category: str) -> None:
         db.commit()
 
 
-async def start_youtube_tag_scheduler():
+def register_youtube_tag_batch(scheduler: BatchScheduler) -> None:
     """
-    간단한 asyncio 기반 YouTube 태그 적재 스케줄러.
+    YouTube 태그 적재 배치를 스케줄러에 등록한다.
 
     - ENABLE_YOUTUBE_TAG_BATCH=true 인 경우에만 동작
-    - YOUTUBE_TAG_BATCH_INTERVAL_MINUTES (기본 60분) 주기로 run_youtube_tag_batch_once 실행
+    - YOUTUBE_TAG_BATCH_CRON 이 있으면 cron, 없으면 YOUTUBE_TAG_BATCH_INTERVAL_MINUTES (기본 60분) 주기로
+      run_youtube_tag_batch_once 실행
     """
     if os.getenv("ENABLE_YOUTUBE_TAG_BATCH", "false").lower() != "true":
         # 비활성화된 경우 조용히 반환하여 애플리케이션 기동에 영향 주지 않음
         return
 
-    interval_minutes = int(os.getenv("YOUTUBE_TAG_BATCH_INTERVAL_MINUTES", "60"))
-    print(f"[YOUTUBE-TAG-BATCH] scheduler started | interval={interval_minutes}m")
-
-    try:
-        while True:
-            try:
-                print("[YOUTUBE-TAG-BATCH] run started")
-                result = await run_youtube_tag_batch_once()
-                print("[YOUTUBE-TAG-BATCH] run success:", result)
-            except Exception as exc:  # pylint: disable=broad-except
-                # 배치 한 번 실패하더라도 다음 주기에는 재시도할 수 있도록 예외를 삼킨다.
-                print("[YOUTUBE-TAG-BATCH] run failed:", exc)
-            await asyncio.sleep(interval_minutes * 60)
-    except asyncio.CancelledError:
-        print("[YOUTUBE-TAG-BATCH] scheduler stopped")
-        raise
+    scheduler.add_job(
+        "youtube_tag_batch",
+        run_youtube_tag_batch_once,
+        build_schedule("YOUTUBE_TAG_BATCH_CRON", "YOUTUBE_TAG_BATCH_INTERVAL_MINUTES", 60),
+    )
 
 
 if __name__ == "__main__":
@@ -1,18 +1,23 @@
 import os
 import boto3
-import asyncio
 from contextlib import asynccontextmanager
 from dotenv import load_dotenv
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
 from account.adapter.input.web.account_router import account_router
-from content.adapter.input.web.ingestion_router import ingestion_router
+from content.adapter.input.web.ingestion_router import ingestion_jobs, ingestion_router
 from content.adapter.input.web.topic_router import topic_router
 from content.adapter.input.web.trend_router import trend_router
 from social_oauth.adapter.input.web.google_oauth2_router import authentication_router
-from app.batch.trend_batch import start_trend_scheduler
+from app.batch.leader_lease import build_leader_lease
+from app.batch.scheduler import BatchScheduler
+from app.batch.snapshot_partition_batch import register_snapshot_partition_batch
+from app.batch.trend_batch import register_trend_batch
+from app.batch.youtube_tag_batch import register_youtube_tag_batch
 from config.database.session import init_db_schema
+from config.settings import YouTubeSettings
+from content.infrastructure.client.youtube_key_pool import get_key_pool
 from social_oauth.adapter.input.web.logout_router import logout_router
 
 load_dotenv()
@@ -28,13 +33,20 @@ async def lifespan(app: FastAPI):
     """
     # DB 스키마 미존재 시 자동 생성하여 UndefinedTable 오류를 예방합니다.
     init_db_schema()
-    app.state.trend_task = asyncio.create_task(start_trend_scheduler())
+    # 배치는 워커 스레드에서 실행되므로 이벤트 루프(요청 처리)를 막지 않는다.
+    # 여러 레플리카가 떠 있어도 Redis 리스를 잡은 한 곳에서만 배치가 실행된다.
+    scheduler = BatchScheduler(leader=build_leader_lease())
+    register_trend_batch(scheduler)
+    register_youtube_tag_batch(scheduler)
+    register_snapshot_partition_batch(scheduler)
+    scheduler.start()
+    app.state.batch_scheduler = scheduler
     try:
         yield
     finally:
-        task = getattr(app.state, "trend_task", None)
-        if task:
-            task.cancel()
+        await scheduler.shutdown()
+        # 대기 중인 수집 작업은 취소한다(실행 중인 작업은 워커 스레드에서 끝까지 실행된다).
+        ingestion_jobs.shutdown()
 
 
 app = FastAPI(title="Apple Mango AI Server", version="0.1.0", lifespan=lifespan)
@@ -65,6 +77,28 @@ def health_check() -> dict[str, str]:
     return {"status": "ok"}
 
 
+@app.get("/health/batches")
+def batch_status() -> dict:
+    """
+    배치 스케줄러의 잡별 다음 실행 시각, 실행 중 여부, 최근 실행 결과를 반환합니다.
+    """
+    scheduler = getattr(app.state, "batch_scheduler", None)
+    if scheduler is None:
+        return {"leader": None, "jobs": []}
+    return {"leader": scheduler.leader_status(), "jobs": scheduler.status()}
+
+
+@app.get("/health/youtube-quota")
+def youtube_quota_status() -> dict:
+    """
+    오늘(태평양 시간 기준) YouTube API 쿼터 사용량을 API 키별, 메서드/우선순위별로 반환합니다.
+    """
+    keys = YouTubeSettings().key_pool()
+    if not keys:
+        return {"keys": []}
+    return get_key_pool(keys).status()
+
+
 if __name__ == "__main__":
     import uvicorn
 
@@ -0,0 +1,102 @@
+"""
+video.activity_date(게시일, 없으면 수집일) 저장형 생성 컬럼을 기존 DB 에 추가하는 1회성 마이그레이션.
+
+- 저장형 생성 컬럼 추가는 video 테이블 전체를 다시 쓰며 그동안 ACCESS EXCLUSIVE 잠금을 잡는다.
+  그래서 앱 기동(init_db_schema)에서 하지 않고, 점검 시간에 이 스크립트로 명시적으로 실행한다.
+  컬럼이 없는 DB 에서는 앱 기동이 이 스크립트를 실행하라는 오류로 멈춘다.
+- 컬럼 추가는 스키마 advisory lock 을 잡고 lock_timeout 안에 잠금을 얻지 못하면 실패한다(다시 실행하면 된다).
+- ix_video_activity_date 인덱스는 CREATE INDEX CONCURRENTLY 로 만들고, 대체된 식 인덱스
+  ix_video_activity_date_platform 은 DROP INDEX CONCURRENTLY 로 지운다. 이미 적용된 단계는 건너뛴다.
+
+사용법:
+    python -m app.tools.migrate_video_activity_date --lock-timeout 10s
+"""
+import argparse
+import time
+
+from sqlalchemy import text
+
+from config.database.session import SCHEMA_LOCK_KEY, engine
+
+ACTIVITY_DATE_DDL = (
+    "ALTER TABLE video ADD COLUMN IF NOT EXISTS activity_date DATE "
+    "GENERATED ALWAYS AS (COALESCE(published_at::date, crawled_at::date)) STORED"
+)
+INDEX_NAME = "ix_video_activity_date"
+INDEX_DDL = f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {INDEX_NAME} ON video (activity_date, platform)"
+# activity_date 컬럼 인덱스로 대체된 이전 식 인덱스
+LEGACY_INDEX_NAME = "ix_video_activity_date_platform"
+
+
+def has_activity_date(conn) -> bool:
+    return bool(
+        conn.execute(
+            text(
+                """
+                SELECT 1
+                FROM information_schema.columns
+                WHERE table_schema = current_schema()
+                  AND table_name = 'video'
+                  AND column_name = 'activity_date'
+                """
+            )
+        ).scalar()
+    )
+
+
+def index_is_valid(conn, index_name: str) -> bool | None:
+    """
+    인덱스가 없으면 None. CONCURRENTLY 생성이 중간에 실패하면 INVALID 인덱스가 남으므로 이를 구분한다.
+    """
+    return conn.execute(
+        text(
+            """
+            SELECT i.indisvalid
+            FROM pg_index i
+            JOIN pg_class c ON c.oid = i.indexrelid
+            JOIN pg_namespace n ON n.oid = c.relnamespace
+            WHERE c.relname = :name AND n.nspname = current_schema()
+            """
+        ),
+        {"name": index_name},
+    ).scalar()
+
+
+def add_activity_date_column(lock_timeout: str) -> bool:
+    with engine.begin() as conn:
+        if has_activity_date(conn):
+            return False
+        conn.execute(text("SELECT set_config('lock_timeout', :timeout, true)"), {"timeout": lock_timeout})
+        conn.execute(text("SELECT pg_advisory_xact_lock(:key)"), {"key": SCHEMA_LOCK_KEY})
+        started = time.perf_counter()
+        conn.execute(text(ACTIVITY_DATE_DDL))
+    print(f"[MIGRATE-ACTIVITY-DATE] video.activity_date added | elapsed={time.perf_counter() - started:.1f}s")
+    return True
+
+
+def build_activity_date_index() -> bool:
+    # CONCURRENTLY 는 트랜잭션 밖에서만 실행할 수 있다.
+    with engine.connect() as conn:
+        conn = conn.execution_options(isolation_level="AUTOCOMMIT")
+        valid = index_is_valid(conn, INDEX_NAME)
+        if not valid:
+            if valid is False:
+                conn.execute(text(f"DROP INDEX CONCURRENTLY IF EXISTS {INDEX_NAME}"))
+            started = time.perf_counter()
+            conn.execute(text(INDEX_DDL))
+            print(f"[MIGRATE-ACTIVITY-DATE] {INDEX_NAME} built | elapsed={time.perf_counter() - started:.1f}s")
+        conn.execute(text(f"DROP INDEX CONCURRENTLY IF EXISTS {LEGACY_INDEX_NAME}"))
+    return not valid
+
+
+def migrate(lock_timeout: str = "10s") -> dict:
+    column_added = add_activity_date_column(lock_timeout)
+    index_built = build_activity_date_index()
+    return {"column_added": column_added, "index_built": index_built}
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="video.activity_date 생성 컬럼/인덱스 1회성 마이그레이션")
+    parser.add_argument("--lock-timeout", default="10s", help="video 테이블 잠금 대기 한도 (Postgres lock_timeout 형식)")
+    args = parser.parse_args()
+    print(migrate(lock_timeout=args.lock_timeout))
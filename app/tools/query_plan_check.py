@@ -0,0 +1,538 @@
+"""
+ContentRepositoryImpl / TrendAggregationUseCase 가 실행하는 SQL 을 모두 캡처해 EXPLAIN 으로 검사하는 도구.
+
+- 로컬 Postgres(SQL_* 환경변수)에 SEED_PLATFORM 플랫폼으로 가짜 데이터를 적재한 뒤 각 메서드를 실제로 호출한다.
+- 호출 중 실행된 SELECT/INSERT/UPDATE/DELETE 를 enable_seqscan=off 상태로 EXPLAIN 한다.
+  인덱스로 대체할 수 없는 스캔만 Seq Scan 으로 남으므로, Seq Scan 이 하나라도 있으면 실패(exit 1)한다.
+- ContentRepositoryImpl / SnapshotPartitionRepository 의 공개 메서드를 모두 열거해, 시나리오가 없는 메서드가
+  있으면 역시 실패한다(의도적으로 빼는 메서드는 SKIPPED_METHODS 에 사유와 함께 등록).
+- 스냅샷 파티션 유지보수(파티션 생성/보존 기간 정리)는 되돌리는 트랜잭션 안에서 실행해 DB 를 바꾸지 않는다.
+- 끝나면 시드 데이터와 집계 결과를 지운다(--keep 으로 유지 가능).
+
+사용법:
+    python -m app.tools.query_plan_check --seed-videos 500
+"""
+import argparse
+import json
+import sys
+from contextlib import contextmanager
+from datetime import date, datetime, timedelta
+
+from sqlalchemy import event, text
+from sqlalchemy.orm import Session
+
+from config.database.session import SessionLocal, engine, init_db_schema
+from content.application.usecase.trend_aggregation_usecase import TrendAggregationUseCase
+from content.domain.category_trend import CategoryTrend
+from content.domain.channel import Channel
+from content.domain.comment_sentiment import CommentSentiment
+from content.domain.crawl_log import CrawlLog
+from content.domain.creator_account import CreatorAccount
+from content.domain.keyword_mapping import KeywordMapping
+from content.domain.keyword_trend import KeywordTrend
+from content.domain.video import Video
+from content.domain.video_comment import VideoComment
+from content.domain.video_metrics_snapshot import VideoMetricsSnapshot
+from content.domain.video_score import VideoScore
+from content.domain.video_sentiment import VideoSentiment
+from content.infrastructure.repository.content_repository_impl import ContentRepositoryImpl
+from content.infrastructure.repository.snapshot_partition_repository import SnapshotPartitionRepository
+
+SEED_PLATFORM = "plan_check"
+
+# 의도적으로 테이블 전체를 읽는 문장이 생기면 (relation -> 사유) 로 등록한다.
+ALLOWED_SEQ_SCANS: dict[str, str] = {}
+
+# 시나리오 없이 두는 공개 메서드 (클래스명.메서드명 -> 사유)
+SKIPPED_METHODS: dict[str, str] = {
+    "ContentRepositoryImpl.unit_of_work": "트랜잭션 경계만 제공하고 SQL 을 실행하지 않는다",
+    "ContentRepositoryImpl.close": "세션 종료",
+    "SnapshotPartitionRepository.list_partitions": "ensure_partitions/apply_retention 안에서 실행된다",
+    "SnapshotPartitionRepository.relkind": "ensure_partitions/apply_retention 안에서 실행된다",
+    "SnapshotPartitionRepository.migrate_unpartitioned": "1회성 마이그레이션(전체 복사)이라 검사 대상이 아니다",
+}
+
+# 시드/집계 결과 정리 대상 (platform 컬럼 기준)
+_SEEDED_TABLES = (
+    "trend_video_key",
+    "keyword_trend",
+    "category_trend",
+    "keyword_daily_fact",
+    "category_daily_fact",
+    "video_velocity",
+    "video_metrics_snapshot",
+    "keyword_mapping",
+    "video_score",
+    "comment_sentiment",
+    "video_sentiment",
+    "video_comment",
+    "trend_watermark",
+    "video",
+    "channel",
+    "creator_account",
+)
+
+
+class StatementRecorder:
+    """
+    engine 의 before_cursor_execute 이벤트로 현재 시나리오 라벨과 함께 실행 SQL 을 모은다.
+    """
+
+    def __init__(self):
+        self.label: str | None = None
+        self.statements: list[tuple[str, str, object]] = []
+        # rolled_back_transaction 안에서 되돌리기 전에 바로 EXPLAIN 한 문장 수와 그 결과
+        self.explained_inline = 0
+        self.inline_violations: list[dict] = []
+        self._inline_conn = None
+
+    def __call__(self, conn, cursor, statement, parameters, context, executemany):
+        if self.label is None:
+            return
+        if statement.lstrip().split(None, 1)[0].upper() not in ("SELECT", "WITH", "INSERT", "UPDATE", "DELETE"):
+            return
+        if executemany and parameters:
+            parameters = parameters[0]
+        self.statements.append((self.label, statement, parameters))
+
+    @contextmanager
+    def scenario(self, label: str):
+        self.label = label
+        first = len(self.statements)
+        try:
+            yield
+            if self._inline_conn is not None:
+                self._explain_inline(first)
+        finally:
+            self.label = None
+
+    @contextmanager
+    def rolled_back_transaction(self):
+        """
+        블록 전체를 한 트랜잭션으로 묶어 끝나면 되돌리고, 그 안에서 쓸 세션 팩토리를 돌려준다.
+        세션의 commit 은 savepoint 해제로만 끝나므로 파티션 생성/삭제 같은 유지보수 SQL 을 실제로 실행해 캡처하되
+        결과는 남기지 않는다. 이 안에서 만든/지운 파티션은 나중에 EXPLAIN 할 수 없으므로 시나리오가 끝날 때마다
+        같은 연결에서 바로 EXPLAIN 한다.
+        """
+        with engine.connect() as conn:
+            transaction = conn.begin()
+            self._inline_conn = conn
+            try:
+                yield lambda: Session(bind=conn, join_transaction_mode="create_savepoint")
+            finally:
+                self._inline_conn = None
+                transaction.rollback()
+
+    def _explain_inline(self, first: int) -> None:
+        statements = self.statements[first:]
+        del self.statements[first:]
+        label, self.label = self.label, None
+        self._inline_conn.exec_driver_sql("SET LOCAL enable_seqscan = off")
+        self.inline_violations.extend(explain_seq_scans(self._inline_conn, statements))
+        self._inline_conn.exec_driver_sql("SET LOCAL enable_seqscan = on")
+        self.label = label
+        self.explained_inline += len(statements)
+
+
+def seed(video_count: int, as_of: date) -> None:
+    categories = [f"{SEED_PLATFORM}_category_{i}" for i in range(10)]
+    keywords = [f"{SEED_PLATFORM}_keyword_{i}" for i in range(50)]
+    with SessionLocal() as db:
+        for i in range(video_count):
+            video_id = f"{SEED_PLATFORM}_{i}"
+            published_at = datetime.combine(as_of - timedelta(days=i % 30), datetime.min.time())
+            db.execute(
+                text(
+                    """
+                    INSERT INTO video (video_id, channel_id, platform, title, category_id, published_at,
+                                       view_count, like_count, comment_count, crawled_at)
+                    VALUES (:video_id, :channel_id, :platform, :title, 10, :published_at,
+                            :views, :likes, :comments, :published_at)
+                    ON CONFLICT (video_id) DO NOTHING
+                    """
+                ),
+                {
+                    "video_id": video_id,
+                    "channel_id": f"{SEED_PLATFORM}_channel_{i % 20}",
+                    "platform": SEED_PLATFORM,
+                    "title": f"plan check video {i}",
+                    "published_at": published_at,
+                    "views": 1000 + i * 10,
+                    "likes": 100 + i,
+                    "comments": 10 + i % 7,
+                },
+            )
+            db.execute(
+                text(
+                    """
+                    INSERT INTO video_sentiment (video_id, platform, category, trend_score, sentiment_score)
+                    VALUES (:video_id, :platform, :category, 0.5, 0.5)
+                    ON CONFLICT (video_id) DO NOTHING
+                    """
+                ),
+                {"video_id": video_id, "platform": SEED_PLATFORM, "category": categories[i % len(categories)]},
+            )
+            db.execute(
+                text(
+                    """
+                    INSERT INTO video_score (video_id, platform, engagement_score, total_score)
+                    VALUES (:video_id, :platform, 1.0, 1.0)
+                    ON CONFLICT (video_id) DO NOTHING
+                    """
+                ),
+                {"video_id": video_id, "platform": SEED_PLATFORM},
+            )
+            for offset in range(3):
+                db.execute(
+                    text(
+                        """
+                        INSERT INTO keyword_mapping (video_id, channel_id, platform, keyword, weight)
+                        VALUES (:video_id, :channel_id, :platform, :keyword, 1.0)
+                        ON CONFLICT DO NOTHING
+                        """
+                    ),
+                    {
+                        "video_id": video_id,
+                        "channel_id": f"{SEED_PLATFORM}_channel_{i % 20}",
+                        "platform": SEED_PLATFORM,
+                        "keyword": keywords[(i + offset * 7) % len(keywords)],
+                    },
+                )
+            for days_ago in (14, 7, 1):
+                db.execute(
+                    text(
+                        """
+                        INSERT INTO video_metrics_snapshot
+                            (video_id, platform, snapshot_date, view_count, like_count, comment_count)
+                        VALUES (:video_id, :platform, :snapshot_date, :views, :likes, :comments)
+                        ON CONFLICT DO NOTHING
+                        """
+                    ),
+                    {
+                        "video_id": video_id,
+                        "platform": SEED_PLATFORM,
+                        "snapshot_date": as_of - timedelta(days=days_ago),
+                        "views": 1000 + i * 10 - days_ago * 5,
+                        "likes": 100 + i,
+                        "comments": 10 + i % 7,
+                    },
+                )
+        db.commit()
+    # 통계가 없으면 플래너 선택이 실제와 달라지므로 시드 직후 ANALYZE 한다.
+    with engine.connect() as conn:
+        conn.execution_options(isolation_level="AUTOCOMMIT").exec_driver_sql("ANALYZE")
+
+
+def cleanup() -> None:
+    with SessionLocal() as db:
+        for table in _SEEDED_TABLES:
+            db.execute(text(f"DELETE FROM {table} WHERE platform = :platform"), {"platform": SEED_PLATFORM})
+        # crawl_log 에는 platform 컬럼이 없어 대상 id 접두어로 지운다.
+        db.execute(text("DELETE FROM crawl_log WHERE target_id LIKE :prefix"), {"prefix": f"{SEED_PLATFORM}_%"})
+        db.commit()
+
+
+def run_scenarios(recorder: StatementRecorder, as_of: date) -> list[str]:
+    repository = ContentRepositoryImpl()
+    usecase = TrendAggregationUseCase(repository)
+    category = f"{SEED_PLATFORM}_category_0"
+    keyword = f"{SEED_PLATFORM}_keyword_0"
+    video_id = f"{SEED_PLATFORM}_0"
+    channel_id = f"{SEED_PLATFORM}_channel_0"
+    now = datetime.utcnow()
+
+    def seeded_video(i: int, **overrides) -> Video:
+        values = dict(
+            video_id=f"{SEED_PLATFORM}_{i}",
+            channel_id=f"{SEED_PLATFORM}_channel_{i % 20}",
+            title=f"plan check video {i}",
+            platform=SEED_PLATFORM,
+            view_count=1000 + i * 10,
+            like_count=100 + i,
+            comment_count=10 + i % 7,
+            crawled_at=now,
+        )
+        values.update(overrides)
+        return Video(**values)
+
+    def channel(i: int, **overrides) -> Channel:
+        values = dict(
+            channel_id=f"{SEED_PLATFORM}_channel_{i}", title=f"plan check channel {i}", platform=SEED_PLATFORM,
+            subscriber_count=100 + i, view_count=1000 + i, video_count=10, crawled_at=now,
+        )
+        values.update(overrides)
+        return Channel(**values)
+
+    def comment(i: int) -> VideoComment:
+        return VideoComment(
+            comment_id=f"{SEED_PLATFORM}_comment_{i}", video_id=video_id, platform=SEED_PLATFORM,
+            author="plan check", content=f"comment {i}", like_count=i, published_at=now,
+        )
+
+    def account(i: int) -> CreatorAccount:
+        return CreatorAccount(
+            account_id=f"{SEED_PLATFORM}_account_{i}", platform=SEED_PLATFORM, display_name=f"account {i}",
+            follower_count=i, post_count=i, crawled_at=now,
+        )
+
+    scenarios = [
+        ("fetch_videos_by_category", lambda: repository.fetch_videos_by_category(category)),
+        ("fetch_videos_by_keyword", lambda: repository.fetch_videos_by_keyword(keyword)),
+        ("fetch_top_keywords_by_category", lambda: repository.fetch_top_keywords_by_category(category)),
+        ("fetch_top_keywords_by_keyword", lambda: repository.fetch_top_keywords_by_keyword(keyword)),
+        ("fetch_video_with_scores", lambda: repository.fetch_video_with_scores(video_id)),
+        ("fetch_hot_category_trends", lambda: repository.fetch_hot_category_trends(platform=SEED_PLATFORM)),
+        (
+            "fetch_recommended_videos_by_category",
+            lambda: repository.fetch_recommended_videos_by_category(category, platform=SEED_PLATFORM),
+        ),
+        ("fetch_distinct_categories", lambda: repository.fetch_distinct_categories()),
+        ("upsert_channel", lambda: repository.upsert_channel(channel(0))),
+        # not_modified 힌트가 있는 채널은 저장된 지표 비교 SELECT 경로를 탄다.
+        ("upsert_channels", lambda: repository.upsert_channels([channel(0, not_modified=True), channel(1), channel(2)])),
+        ("upsert_account", lambda: repository.upsert_account(account(0))),
+        ("upsert_accounts", lambda: repository.upsert_accounts([account(0), account(1)])),
+        (
+            "upsert_videos",
+            lambda: repository.upsert_videos(
+                [seeded_video(0, not_modified=True), seeded_video(1, view_count=5_000_000), seeded_video(10_000)]
+            ),
+        ),
+        ("upsert_comments", lambda: repository.upsert_comments([comment(0), comment(1)])),
+        (
+            "upsert_video_sentiment",
+            lambda: repository.upsert_video_sentiment(
+                VideoSentiment(video_id=video_id, platform=SEED_PLATFORM, category=category, analyzed_at=now)
+            ),
+        ),
+        (
+            "upsert_video_sentiments",
+            lambda: repository.upsert_video_sentiments(
+                [VideoSentiment(video_id=f"{SEED_PLATFORM}_{i}", platform=SEED_PLATFORM, category=category) for i in range(3)]
+            ),
+        ),
+        (
+            "upsert_comment_sentiments",
+            lambda: repository.upsert_comment_sentiments(
+                [CommentSentiment(comment_id=f"{SEED_PLATFORM}_comment_{i}", platform=SEED_PLATFORM) for i in range(2)]
+            ),
+        ),
+        (
+            "upsert_video_scores",
+            lambda: repository.upsert_video_scores(
+                [VideoScore(video_id=f"{SEED_PLATFORM}_{i}", platform=SEED_PLATFORM, total_score=2.0) for i in range(3)]
+            ),
+        ),
+        (
+            "upsert_keyword_mappings",
+            lambda: repository.upsert_keyword_mappings(
+                [KeywordMapping(None, f"{SEED_PLATFORM}_{i}", channel_id, SEED_PLATFORM, keyword, 1.0) for i in range(3)]
+            ),
+        ),
+        (
+            "upsert_keyword_trend",
+            lambda: repository.upsert_keyword_trend(KeywordTrend(keyword=keyword, date=as_of, platform=SEED_PLATFORM)),
+        ),
+        (
+            "upsert_category_trend",
+            lambda: repository.upsert_category_trend(
+                CategoryTrend(category=category, date=as_of, platform=SEED_PLATFORM)
+            ),
+        ),
+        (
+            "bulk_upsert_keyword_trends",
+            lambda: repository.bulk_upsert_keyword_trends(
+                [KeywordTrend(keyword=f"{SEED_PLATFORM}_keyword_{i}", date=as_of, platform=SEED_PLATFORM) for i in range(3)]
+            ),
+        ),
+        (
+            "bulk_upsert_category_trends",
+            lambda: repository.bulk_upsert_category_trends(
+                [
+                    CategoryTrend(category=f"{SEED_PLATFORM}_category_{i}", date=as_of, platform=SEED_PLATFORM)
+                    for i in range(3)
+                ]
+            ),
+        ),
+        (
+            "log_crawl",
+            lambda: repository.log_crawl(
+                CrawlLog(id=None, target_type="channel", target_id=channel_id, status="success", crawled_at=now)
+            ),
+        ),
+        (
+            "upsert_video",
+            lambda: repository.upsert_video(
+                Video(
+                    video_id=video_id,
+                    channel_id=f"{SEED_PLATFORM}_channel_0",
+                    title="plan check video 0",
+                    platform=SEED_PLATFORM,
+                    view_count=999_999,
+                    like_count=1,
+                    comment_count=1,
+                    crawled_at=datetime.utcnow(),
+                )
+            ),
+        ),
+        (
+            "upsert_keyword_mapping",
+            lambda: repository.upsert_keyword_mapping(
+                KeywordMapping(None, video_id, f"{SEED_PLATFORM}_channel_0", SEED_PLATFORM, keyword, 1.0)
+            ),
+        ),
+        (
+            "upsert_video_score",
+            lambda: repository.upsert_video_score(VideoScore(video_id=video_id, platform=SEED_PLATFORM, total_score=1.0)),
+        ),
+        (
+            "upsert_video_metrics_snapshot",
+            lambda: repository.upsert_video_metrics_snapshot(
+                VideoMetricsSnapshot(
+                    video_id=video_id,
+                    platform=SEED_PLATFORM,
+                    snapshot_date=as_of,
+                    view_count=1_000_000,
+                    like_count=1,
+                    comment_count=1,
+                )
+            ),
+        ),
+        ("refresh_video_velocity", lambda: usecase.refresh_video_velocity(as_of=as_of, platform=SEED_PLATFORM)),
+        ("refresh_daily_facts", lambda: usecase.refresh_daily_facts(as_of=as_of, platform=SEED_PLATFORM)),
+        (
+            "aggregate[single_pass]",
+            lambda: usecase.aggregate(as_of=as_of, platform=SEED_PLATFORM, mode="single_pass", incremental=False),
+        ),
+        (
+            "aggregate[legacy]",
+            lambda: usecase.aggregate(as_of=as_of, platform=SEED_PLATFORM, mode="legacy", incremental=False),
+        ),
+        (
+            "aggregate[facts]",
+            lambda: usecase.aggregate(as_of=as_of, platform=SEED_PLATFORM, mode="facts", incremental=False),
+        ),
+        (
+            "aggregate[incremental]",
+            lambda: usecase.aggregate(as_of=as_of, platform=SEED_PLATFORM, mode="single_pass", incremental=True),
+        ),
+        ("aggregate_windows", lambda: usecase.aggregate_windows(as_of=as_of, platform=SEED_PLATFORM)),
+        ("verify_facts_mode", lambda: usecase.verify_facts_mode(as_of=as_of, platform=SEED_PLATFORM)),
+        (
+            "backfill",
+            lambda: usecase.backfill(
+                from_date=as_of - timedelta(days=3), to_date=as_of - timedelta(days=1), platform=SEED_PLATFORM
+            ),
+        ),
+    ]
+    for label, call in scenarios:
+        with recorder.scenario(label):
+            call()
+    repository.db.close()
+
+    with recorder.rolled_back_transaction() as session_factory:
+        # 보존 기간 1개월 + 두 달 뒤 기준일이면 방금 만든 기준 월 파티션이 만료 대상이 되어 체크포인트/삭제 경로를 모두 탄다.
+        partitions = SnapshotPartitionRepository(session_factory=session_factory, retention_months=1)
+        maintenance = [
+            ("ensure_partitions", lambda: partitions.ensure_partitions(as_of=as_of)),
+            ("apply_retention", lambda: partitions.apply_retention(as_of=as_of + timedelta(days=62))),
+        ]
+        for label, call in maintenance:
+            with recorder.scenario(label):
+                call()
+    return [label for label, _ in scenarios + maintenance]
+
+
+def uncovered_methods(labels: list[str]) -> list[str]:
+    """
+    시나리오 라벨(메서드명 또는 "메서드명[변형]")로 호출되지 않은 공개 메서드 목록.
+    """
+    covered = {label.split("[", 1)[0] for label in labels}
+    missing = []
+    for cls in (ContentRepositoryImpl, SnapshotPartitionRepository):
+        for name, member in vars(cls).items():
+            if name.startswith("_") or not callable(member):
+                continue
+            if name not in covered and f"{cls.__name__}.{name}" not in SKIPPED_METHODS:
+                missing.append(f"{cls.__name__}.{name}")
+    return missing
+
+
+def _walk(plan: dict):
+    yield plan
+    for child in plan.get("Plans", []):
+        yield from _walk(child)
+
+
+def explain_seq_scans(conn, statements: list[tuple[str, str, object]]) -> list[dict]:
+    """
+    enable_seqscan=off 가 설정된 연결에서 문장들을 EXPLAIN 해 Seq Scan 노드를 모은다.
+    """
+    violations: list[dict] = []
+    for label, statement, parameters in statements:
+        plan_json = conn.exec_driver_sql(f"EXPLAIN (FORMAT JSON) {statement}", parameters or {}).scalar()
+        if isinstance(plan_json, str):
+            plan_json = json.loads(plan_json)
+        for node in _walk(plan_json[0]["Plan"]):
+            relation = node.get("Relation Name")
+            if node.get("Node Type") != "Seq Scan" or relation in ALLOWED_SEQ_SCANS:
+                continue
+            violations.append(
+                {
+                    "scenario": label,
+                    "relation": relation,
+                    "filter": node.get("Filter"),
+                    "statement": " ".join(statement.split())[:300],
+                }
+            )
+    return violations
+
+
+def find_seq_scans(statements: list[tuple[str, str, object]]) -> list[dict]:
+    with engine.connect() as conn:
+        conn.exec_driver_sql("SET enable_seqscan = off")
+        violations = explain_seq_scans(conn, statements)
+        conn.rollback()
+    return violations
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="EXPLAIN 기반 Seq Scan 검사")
+    parser.add_argument("--seed-videos", type=int, default=500)
+    parser.add_argument("--as-of", type=date.fromisoformat, default=date.today())
+    parser.add_argument("--keep", action="store_true", help="시드 데이터와 집계 결과를 지우지 않는다")
+    args = parser.parse_args(argv)
+
+    init_db_schema()
+    recorder = StatementRecorder()
+    event.listen(engine, "before_cursor_execute", recorder)
+    try:
+        cleanup()
+        seed(args.seed_videos, args.as_of)
+        labels = run_scenarios(recorder, args.as_of)
+        event.remove(engine, "before_cursor_execute", recorder)
+        violations = recorder.inline_violations + find_seq_scans(recorder.statements)
+    finally:
+        if event.contains(engine, "before_cursor_execute", recorder):
+            event.remove(engine, "before_cursor_execute", recorder)
+        if not args.keep:
+            cleanup()
+
+    print(f"[PLAN-CHECK] statements explained: {len(recorder.statements) + recorder.explained_inline}")
+    missing = uncovered_methods(labels)
+    for name in missing:
+        print(f"[PLAN-CHECK] no scenario | method={name}")
+    for violation in violations:
+        print(
+            f"[PLAN-CHECK] seq scan | scenario={violation['scenario']}, relation={violation['relation']}, "
+            f"filter={violation['filter']}\n    {violation['statement']}"
+        )
+    if violations or missing:
+        print(f"[PLAN-CHECK] FAILED: {len(violations)} seq scan(s), {len(missing)} method(s) without scenario")
+        return 1
+    print("[PLAN-CHECK] OK: no seq scans")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -2,7 +2,7 @@ import os
 import urllib.parse
 
 from dotenv import load_dotenv
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, text
 from sqlalchemy.orm import declarative_base, sessionmaker
 
 load_dotenv()
@@ -26,13 +26,27 @@ SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
 Base = declarative_base()
 
+# 한국어 주석: create_all 은 이미 존재하는 테이블에 컬럼/인덱스를 추가하지 않으므로,
+# 각 ORM 모듈이 멱등 DDL(ADD COLUMN IF NOT EXISTS 등)을 여기에 등록하면 기동 시 함께 적용합니다.
+SCHEMA_UPGRADES: list[str] = []
+
 
 def get_db_session():
     return SessionLocal()
 
 
+# 한국어 주석: 여러 인스턴스가 동시에 기동해도 스키마 생성/업그레이드는 한 번에 하나씩만 돌도록 잡는 advisory lock 키.
+SCHEMA_LOCK_KEY = 720451
+
+
 def init_db_schema():
     """
     애플리케이션 기동 시 테이블이 없을 경우를 대비해 스키마를 생성합니다.
+    생성과 SCHEMA_UPGRADES 는 한 트랜잭션에서 pg_advisory_xact_lock 을 잡은 채 실행하므로,
+    동시에 기동한 다른 인스턴스는 커밋이 끝난 뒤의 스키마를 보고 이미 적용된 DDL 을 건너뛴다.
     """
-    Base.metadata.create_all(bind=engine)
+    with engine.begin() as conn:
+        conn.execute(text("SELECT pg_advisory_xact_lock(:key)"), {"key": SCHEMA_LOCK_KEY})
+        Base.metadata.create_all(bind=conn)
+        for ddl in SCHEMA_UPGRADES:
+            conn.execute(text(ddl))
@@ -14,8 +14,16 @@ class OpenAISettings:
 @dataclass
 class YouTubeSettings:
     api_key: str = os.getenv("YOUTUBE_API_KEY", "")
+    # 여러 프로젝트의 키를 쉼표로 나열하면 키마다 쿼터를 따로 쓴다(없으면 api_key 하나만 사용).
+    api_keys: str = os.getenv("YOUTUBE_API_KEYS", "")
     quota_user: str | None = os.getenv("YOUTUBE_QUOTA_USER")
 
+    def key_pool(self) -> list[str]:
+        keys = [key.strip() for key in self.api_keys.split(",") if key.strip()]
+        if self.api_key and self.api_key not in keys:
+            keys.insert(0, self.api_key)
+        return keys
+
 
 @dataclass
 class TikTokSettings:
@@ -1,23 +1,38 @@
+import json
 from datetime import date, datetime
 
 from fastapi import APIRouter, HTTPException
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, StreamingResponse
 from sqlalchemy import text
 
 from config.settings import OpenAISettings, YouTubeSettings
 from config.database.session import SessionLocal
-from content.adapter.input.web.request.ingest_requests import IngestChannelRequest, IngestVideoRequest
+from content.adapter.input.web.request.ingest_requests import (
+    IngestBulkRequest,
+    IngestChannelRequest,
+    IngestVideoRequest,
+    ResolveChannelsRequest,
+)
+from content.application.usecase.bulk_ingestion_usecase import BulkIngestionUseCase
+from content.application.usecase.ingestion_job_queue import (
+    IngestionJobQueue,
+    IngestionJobQueueFull,
+    IngestionJobStoreError,
+)
 from content.application.usecase.ingestion_usecase import IngestionUseCase
 from content.application.usecase.sentiment_usecase import SentimentUseCase
 from content.application.usecase.trend_aggregation_usecase import TrendAggregationUseCase
 from content.infrastructure.client.youtube_client import YouTubeClient
+from content.infrastructure.client.youtube_quota import iterate_in_quota_scope, quota_scope
 from content.infrastructure.repository.content_repository_impl import ContentRepositoryImpl
 
 ingestion_router = APIRouter(tags=["ingestion"])
 
-# 공용 리포지토리/클라이언트는 유지하되, OPENAI_API_KEY가 뒤늦게 설정되어도 반영되도록 SentimentUseCase는 지연 초기화한다.
-repository = ContentRepositoryImpl()
+# 채널/영상 수집은 오래 걸리므로(LLM 분석 포함) 요청 안에서 실행하지 않고 백그라운드 작업 큐로 넘긴다.
+ingestion_jobs = IngestionJobQueue()
+# OPENAI_API_KEY가 뒤늦게 설정되어도 반영되도록 SentimentUseCase는 지연 초기화한다.
 _sentiment_usecase: SentimentUseCase | None = None
+_youtube_client: YouTubeClient | None = None
 
 
 def get_sentiment_usecase() -> SentimentUseCase | None:
@@ -36,9 +51,13 @@ def resolve_platform_client(platform: str):
     """
     현재는 youtube만 지원. 다른 플랫폼은 향후 확장 예정.
     """
+    global _youtube_client
     platform = platform.lower()
     if platform == "youtube":
-        return YouTubeClient(YouTubeSettings())
+        # 요청 간에 클라이언트를 공유해야 동시에 들어온 요청의 videos.list 호출이 한 요청으로 묶인다.
+        if _youtube_client is None:
+            _youtube_client = YouTubeClient(YouTubeSettings())
+        return _youtube_client
     raise HTTPException(status_code=400, detail="지원하지 않는 플랫폼입니다. (현재 youtube만 사용 가능)")
 
 
@@ -96,47 +115,139 @@ async def get_video_analysis(platform: str, video_id: str):
         db.close()
 
 
-@ingestion_router.post("/{platform}/channel/{channel_id}")
+@ingestion_router.post("/{platform}/channel/{channel_id}", status_code=202)
 async def ingest_channel(platform: str, channel_id: str, request: IngestChannelRequest):
     """
-    채널 단위로 영상/댓글을 수집하고 AI 분석까지 수행한다.
+    채널 단위 영상/댓글 수집 + AI 분석을 백그라운드 작업으로 등록하고 job_id 를 바로 반환한다.
+    - 같은 채널의 작업이 대기/실행 중이면 새로 만들지 않고 기존 job_id 를 돌려준다(coalesced=true).
+    - 진행 상황과 결과는 GET /ingestion/jobs/{job_id} 로 조회한다.
     """
     client = resolve_platform_client(platform)
-    try:
-        ingestion_usecase = IngestionUseCase(repository, get_sentiment_usecase())
-        result = ingestion_usecase.ingest_channel_bundle(
-            client,
-            channel_id,
-            include_comments=request.include_comments,
-            max_videos=request.max_videos,
-            max_comments=request.max_comments,
+
+    def run(progress):
+        return _run_ingestion(
+            lambda usecase: usecase.ingest_channel_bundle(
+                client,
+                channel_id,
+                include_comments=request.include_comments,
+                max_videos=request.max_videos,
+                max_comments=request.max_comments,
+                progress=progress,
+            )
         )
-        return JSONResponse(result)
-    except NotImplementedError as exc:
-        raise HTTPException(status_code=501, detail=str(exc))
-    except Exception as exc:
-        raise HTTPException(status_code=500, detail=str(exc))
+
+    return _enqueue(platform, "channel", channel_id, run, request.model_dump())
 
 
-@ingestion_router.post("/{platform}/video/{video_id}")
+@ingestion_router.post("/{platform}/video/{video_id}", status_code=202)
 async def ingest_video(platform: str, video_id: str, request: IngestVideoRequest):
     """
-    단일 영상에 대해 본문/댓글 수집 및 AI 분석을 수행한다.
+    단일 영상 본문/댓글 수집 + AI 분석을 백그라운드 작업으로 등록하고 job_id 를 바로 반환한다.
     """
     client = resolve_platform_client(platform)
-    try:
-        ingestion_usecase = IngestionUseCase(repository, get_sentiment_usecase())
-        result = ingestion_usecase.ingest_video(
+
+    def run(progress):
+        return _run_ingestion(
+            lambda usecase: usecase.ingest_video(
+                client,
+                video_id,
+                include_comments=request.include_comments,
+                max_comments=request.max_comments,
+                progress=progress,
+            )
+        )
+
+    return _enqueue(platform, "video", video_id, run, request.model_dump())
+
+
+@ingestion_router.post("/{platform}/bulk")
+async def ingest_bulk(platform: str, request: IngestBulkRequest):
+    """
+    여러 채널/영상을 한 요청으로 수집한다. 채널/영상 메타는 50개 단위 일괄 조회로 한꺼번에 받고,
+    항목별 수집/분석/적재는 동시에 실행해 끝나는 순서대로 NDJSON 한 줄씩 돌려준다(마지막 줄은 summary).
+    staged=true 이면 수집 파이프라인으로 처리해 영상이 적재되는 즉시 줄을 내보내고, 분석은 뒤에서 채운다.
+    """
+    if not request.channel_ids and not request.video_ids:
+        raise HTTPException(status_code=400, detail="channel_ids 또는 video_ids 중 하나 이상이 필요합니다.")
+    client = resolve_platform_client(platform)
+    usecase = BulkIngestionUseCase(ContentRepositoryImpl, get_sentiment_usecase())
+    # 요청의 priority 로 YouTube 쿼터를 확보한다(이미 아는 영상의 지표 갱신은 critical 로 보내면 탐색 작업보다 먼저 처리됨).
+    lines = iterate_in_quota_scope(
+        usecase.ingest(
             client,
-            video_id,
+            request.channel_ids,
+            request.video_ids,
             include_comments=request.include_comments,
+            max_videos=request.max_videos,
             max_comments=request.max_comments,
-        )
-        return JSONResponse(result)
-    except NotImplementedError as exc:
-        raise HTTPException(status_code=501, detail=str(exc))
-    except Exception as exc:
-        raise HTTPException(status_code=500, detail=str(exc))
+            staged=request.staged,
+        ),
+        f"ingestion:bulk:{platform.lower()}",
+        request.priority,
+    )
+    # 동기 제너레이터는 Starlette 가 스레드풀에서 순회하므로 이벤트 루프를 막지 않는다.
+    return StreamingResponse(
+        (json.dumps(line, ensure_ascii=False, default=str) + "\n" for line in lines),
+        media_type="application/x-ndjson",
+    )
+
+
+@ingestion_router.post("/{platform}/channels/resolve")
+def resolve_channels(platform: str, request: ResolveChannelsRequest):
+    """
+    핸들/채널 URL 을 채널 id 로 일괄 해석해 캐시를 미리 채운다(이후 수집 요청은 해석 API 호출 없이 진행).
+    응답: {"resolved": {입력: 채널 id}, "unresolved": [해석하지 못한 입력]}
+    """
+    client = resolve_platform_client(platform)
+    try:
+        resolved = client.resolve_channel_ids(request.identifiers)
+    except RuntimeError as exc:
+        raise HTTPException(status_code=502, detail=str(exc))
+    return {
+        "resolved": {identifier: channel_id for identifier, channel_id in resolved.items() if channel_id},
+        "unresolved": [identifier for identifier, channel_id in resolved.items() if not channel_id],
+    }
+
+
+@ingestion_router.get("/jobs/{job_id}")
+async def get_ingestion_job(job_id: str):
+    """
+    수집 작업 상태 조회: status(queued|running|succeeded|failed), 단계별 progress, 완료 시 result 또는 error.
+    """
+    try:
+        job = ingestion_jobs.get(job_id)
+    except IngestionJobStoreError as exc:
+        raise HTTPException(status_code=503, detail=str(exc))
+    if job is None:
+        raise HTTPException(status_code=404, detail="작업이 존재하지 않거나 보관 기간이 지났습니다.")
+    return JSONResponse(job.as_dict())
+
+
+def _run_ingestion(call):
+    # 작업은 워커 스레드에서 동시에 실행되므로 세션을 공유하지 않도록 작업마다 저장소를 만든다.
+    job_repository = ContentRepositoryImpl()
+    try:
+        with quota_scope("ingestion:job", priority="normal") as quota:
+            result = call(IngestionUseCase(job_repository, get_sentiment_usecase()))
+        return {**result, "quota_units": quota.total}
+    finally:
+        job_repository.close()
+
+
+def _enqueue(platform: str, target_type: str, target_id: str, run, params: dict) -> JSONResponse:
+    try:
+        job, coalesced = ingestion_jobs.submit(platform.lower(), target_type, target_id, run, params)
+    except (IngestionJobQueueFull, IngestionJobStoreError) as exc:
+        raise HTTPException(status_code=503, detail=str(exc))
+    return JSONResponse(
+        {
+            "job_id": job.job_id,
+            "status": job.status,
+            "coalesced": coalesced,
+            "status_url": f"/ingestion/jobs/{job.job_id}",
+        },
+        status_code=202,
+    )
 
 
 @ingestion_router.post("/trend/aggregate")
@@ -150,6 +261,44 @@ async def trigger_trend_batch(window_days: int = 7, platform: str | None = None)
     return result
 
 
+@ingestion_router.post("/trend/backfill", status_code=202)
+async def trigger_trend_backfill(
+    from_date: date,
+    to_date: date | None = None,
+    window_days: int = 7,
+    platform: str | None = None,
+):
+    """
+    기간 백필용 엔드포인트.
+    - from_date ~ to_date(기본 오늘)의 모든 기준일에 대해 카테고리/키워드 트렌드를 한 번의 집합 연산으로 재계산한다.
+    - 수 분씩 걸리는 SQL 이므로 백그라운드 작업으로 등록하고 job_id 를 바로 반환한다(GET /ingestion/jobs/{job_id}).
+    - 같은 조건의 백필이 대기/실행 중이면 기존 job_id 를 돌려준다(coalesced=true).
+    """
+    to_date = to_date or date.today()
+    if from_date > to_date:
+        raise HTTPException(status_code=400, detail="from_date must be on or before to_date")
+
+    def run(progress):
+        job_repository = ContentRepositoryImpl()
+        try:
+            return TrendAggregationUseCase(job_repository).backfill(
+                from_date=from_date,
+                to_date=to_date,
+                window_days=window_days,
+                platform=platform,
+            )
+        finally:
+            job_repository.close()
+
+    return _enqueue(
+        "trend",
+        "backfill",
+        f"{from_date}:{to_date}:{window_days}:{platform or 'all'}",
+        run,
+        {"from_date": str(from_date), "to_date": str(to_date), "window_days": window_days, "platform": platform},
+    )
+
+
 @ingestion_router.get("/category_Tags")
 async def get_category_tags():
     """
@@ -197,8 +346,13 @@ async def get_category_tags():
 
 # Postman 참고:
 # 1) 건강 확인: GET http://localhost:8000/health
-# 2) 채널 수집: POST http://localhost:8000/ingestion/youtube/channel/<CHANNEL_ID>
-# 3) 영상 수집: POST http://localhost:8000/ingestion/youtube/video/<VIDEO_ID>
+# 2) 채널 수집: POST http://localhost:8000/ingestion/youtube/channel/<CHANNEL_ID>  (202 + job_id)
+# 3) 영상 수집: POST http://localhost:8000/ingestion/youtube/video/<VIDEO_ID>  (202 + job_id)
+# 3-1) 작업 조회: GET  http://localhost:8000/ingestion/jobs/<JOB_ID>
+# 3-2) 일괄 수집: POST http://localhost:8000/ingestion/youtube/bulk  {"channel_ids": [...], "video_ids": [...]}  (NDJSON)
+#      파이프라인 모드: {"channel_ids": [...], "staged": true}  (적재 즉시 줄 출력, 분석 결과는 summary.analysis)
+# 3-3) 채널 id 미리 해석: POST http://localhost:8000/ingestion/youtube/channels/resolve  {"identifiers": ["@handle", ...]}
 # 4) 분석 조회: GET  http://localhost:8000/ingestion/youtube/video/<VIDEO_ID>/analysis
 # 5) 트렌드 집계: POST http://localhost:8000/ingestion/trend/aggregate
+# 5-1) 트렌드 백필: POST http://localhost:8000/ingestion/trend/backfill?from_date=2025-09-01&to_date=2025-11-30  (202 + job_id)
 # 6) 카테고리 집계 : GET http://localhost:8000/ingestion/category_Tags
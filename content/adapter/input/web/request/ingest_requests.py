@@ -1,3 +1,5 @@
+from typing import Literal
+
 from pydantic import BaseModel, Field
 
 
@@ -10,3 +12,22 @@ class IngestChannelRequest(BaseModel):
 class IngestVideoRequest(BaseModel):
     include_comments: bool = Field(default=True, description="Whether to fetch comments")
     max_comments: int = Field(default=50, ge=1, le=100)
+
+
+class ResolveChannelsRequest(BaseModel):
+    identifiers: list[str] = Field(min_length=1, max_length=1000, description="Channel handles (@name), URLs or ids")
+
+
+class IngestBulkRequest(BaseModel):
+    channel_ids: list[str] = Field(default_factory=list, max_length=1000, description="Channel ids, handles or URLs")
+    video_ids: list[str] = Field(default_factory=list, max_length=5000)
+    include_comments: bool = Field(default=False, description="Whether to fetch comments for each video")
+    max_videos: int = Field(default=10, ge=1, le=50)
+    max_comments: int = Field(default=50, ge=1, le=100)
+    priority: Literal["critical", "normal", "discovery"] = Field(
+        default="normal", description="YouTube quota priority (critical: trend metric refresh, discovery: exploration)"
+    )
+    staged: bool = Field(
+        default=False,
+        description="Run through the fetch/persist/analyze pipeline: items are reported once stored, analysis fills in later",
+    )
@@ -2,6 +2,7 @@ from fastapi import APIRouter, HTTPException, Query
 from fastapi.responses import JSONResponse
 from fastapi.encoders import jsonable_encoder
 
+from content.application.usecase.trend_aggregation_usecase import TrendAggregationUseCase
 from content.application.usecase.trend_query_usecase import TrendQueryUseCase
 from content.infrastructure.repository.content_repository_impl import ContentRepositoryImpl
 
@@ -10,6 +11,7 @@ trend_router = APIRouter(tags=["trends"])
 # 트렌드 탭 전용 조회용 유즈케이스/리포지토리 싱글턴
 repository = ContentRepositoryImpl()
 usecase = TrendQueryUseCase(repository)
+aggregation_usecase = TrendAggregationUseCase(repository)
 
 
 @trend_router.get("/categories/hot")
@@ -44,6 +46,23 @@ async def get_category_recommendations(
     return JSONResponse(jsonable_encoder({"category": category, "items": items}))
 
 
+@trend_router.get("/windows")
+async def get_multi_window_trends(
+    windows: str = Query(default="1,7,30", description="콤마로 구분한 집계 기간(일) 목록"),
+    limit: int = Query(default=20, ge=1, le=100),
+    platform: str | None = Query(default=None, description="플랫폼 필터 (예: youtube)"),
+):
+    """
+    일별 팩트 테이블을 기반으로 여러 기간(예: 1/7/30일)의 키워드/카테고리 트렌드를 한 번에 조회한다.
+    """
+    try:
+        window_list = [int(w) for w in windows.split(",") if w.strip()]
+    except ValueError:
+        raise HTTPException(status_code=400, detail="windows 는 콤마로 구분한 정수여야 합니다.")
+    result = aggregation_usecase.aggregate_windows(windows=window_list, platform=platform, limit=limit)
+    return JSONResponse(jsonable_encoder(result))
+
+
 @trend_router.get("/categories")
 async def list_categories(limit: int = Query(default=100, ge=1, le=500)):
     """
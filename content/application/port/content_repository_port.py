@@ -1,4 +1,5 @@
 from abc import ABC, abstractmethod
+from contextlib import AbstractContextManager
 from typing import Iterable
 
 from content.domain.channel import Channel
@@ -16,6 +17,18 @@ from content.domain.video_metrics_snapshot import VideoMetricsSnapshot
 
 
 class ContentRepositoryPort(ABC):
+    @abstractmethod
+    def unit_of_work(self) -> AbstractContextManager["ContentRepositoryPort"]:
+        """
+        with repository.unit_of_work(): 블록 안의 쓰기를 한 트랜잭션으로 묶는다(정상 종료 시 1회 commit, 예외 시 rollback).
+        """
+        raise NotImplementedError
+
+    def close(self) -> None:
+        """
+        저장소가 잡고 있는 세션 등 자원을 반납한다. 작업 단위로 만든 저장소는 끝난 뒤 호출한다.
+        """
+
     @abstractmethod
     def upsert_channel(self, channel: Channel) -> Channel:
         raise NotImplementedError
@@ -48,6 +61,14 @@ class ContentRepositoryPort(ABC):
     def upsert_category_trend(self, trend: CategoryTrend) -> CategoryTrend:
         raise NotImplementedError
 
+    @abstractmethod
+    def bulk_upsert_keyword_trends(self, trends: Iterable[KeywordTrend]) -> dict:
+        raise NotImplementedError
+
+    @abstractmethod
+    def bulk_upsert_category_trends(self, trends: Iterable[CategoryTrend]) -> dict:
+        raise NotImplementedError
+
     @abstractmethod
     def upsert_keyword_mapping(self, mapping: KeywordMapping) -> KeywordMapping:
         raise NotImplementedError
@@ -60,6 +81,31 @@ class ContentRepositoryPort(ABC):
     def log_crawl(self, log: CrawlLog) -> CrawlLog:
         raise NotImplementedError
 
+    # 다건 upsert (단건 메서드와 같은 정적/변동성 컬럼 규칙, 한 번에 commit). 반환값은 적재 행 수.
+    @abstractmethod
+    def upsert_channels(self, channels: Iterable[Channel]) -> int:
+        raise NotImplementedError
+
+    @abstractmethod
+    def upsert_accounts(self, accounts: Iterable[CreatorAccount]) -> int:
+        raise NotImplementedError
+
+    @abstractmethod
+    def upsert_videos(self, videos: Iterable[Video]) -> int:
+        raise NotImplementedError
+
+    @abstractmethod
+    def upsert_video_sentiments(self, sentiments: Iterable[VideoSentiment]) -> int:
+        raise NotImplementedError
+
+    @abstractmethod
+    def upsert_video_scores(self, scores: Iterable[VideoScore]) -> int:
+        raise NotImplementedError
+
+    @abstractmethod
+    def upsert_keyword_mappings(self, mappings: Iterable[KeywordMapping]) -> int:
+        raise NotImplementedError
+
     @abstractmethod
     def upsert_video_metrics_snapshot(self, snapshot: VideoMetricsSnapshot) -> None:
         raise NotImplementedError
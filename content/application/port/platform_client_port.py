@@ -1,4 +1,5 @@
 from abc import ABC, abstractmethod
+from datetime import datetime
 from typing import Iterable
 
 from content.domain.channel import Channel
@@ -14,7 +15,13 @@ class PlatformClientPort(ABC):
         raise NotImplementedError
 
     @abstractmethod
-    def fetch_videos(self, channel_id: str, max_results: int = 20) -> Iterable[Video]:
+    def fetch_videos(
+        self, channel_id: str, max_results: int = 20, published_after: datetime | None = None
+    ) -> Iterable[Video]:
+        """
+        채널의 최신 영상 목록. published_after 가 있으면 그 이후 업로드만 돌려주며,
+        구현체는 목록 조회 단계에서 일찍 멈춰 불필요한 메타 조회를 줄일 수 있다.
+        """
         raise NotImplementedError
 
     @abstractmethod
@@ -24,3 +31,25 @@ class PlatformClientPort(ABC):
     @abstractmethod
     def fetch_comments(self, video_id: str, max_results: int = 50) -> Iterable[VideoComment]:
         raise NotImplementedError
+
+    def fetch_channels(self, channel_ids: list[str]) -> dict[str, Channel]:
+        """
+        여러 채널 일괄 조회. 반환: {입력 식별자: Channel}. 일괄 API 가 있는 플랫폼은 재정의한다.
+        """
+        return {channel_id: self.fetch_channel(channel_id) for channel_id in dict.fromkeys(channel_ids)}
+
+    def resolve_channel_ids(self, identifiers: list[str]) -> dict[str, str | None]:
+        """
+        핸들/URL 등 채널 식별자를 플랫폼 채널 id 로 일괄 해석한다. 기본 구현은 입력을 그대로 id 로 본다.
+        """
+        return {identifier: identifier or None for identifier in dict.fromkeys(identifiers)}
+
+    def fetch_videos_for_ids(self, video_ids: list[str]) -> Iterable[Video]:
+        """
+        여러 영상 일괄 조회. 찾지 못한 영상은 결과에서 빠진다. 일괄 API 가 있는 플랫폼은 재정의한다.
+        """
+        for video_id in dict.fromkeys(video_ids):
+            try:
+                yield self.fetch_video(video_id)
+            except ValueError:
+                continue
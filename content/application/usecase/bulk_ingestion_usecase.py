@@ -0,0 +1,218 @@
+import contextvars
+import os
+import queue
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Callable, Generator, Iterator
+
+from content.application.port.content_repository_port import ContentRepositoryPort
+from content.application.port.platform_client_port import PlatformClientPort
+from content.application.usecase.ingestion_pipeline import IngestionPipeline, IngestionPipelineError
+from content.application.usecase.ingestion_usecase import IngestionUseCase
+
+# staged 모드에서 파이프라인이 모두 끝났음을 알리는 신호
+_DONE = object()
+
+
+class BulkIngestionUseCase:
+    """
+    채널/영상 여러 개를 한 번에 수집한다.
+    - 채널 정보와 영상 메타는 먼저 일괄 조회(fetch_channels / fetch_videos_for_ids, YouTube 는 50개 단위)로 한꺼번에 받아 둔다.
+    - 항목별 수집/분석/적재는 BULK_INGESTION_CONCURRENCY 개 스레드에서 동시에 실행하고,
+      끝나는 순서대로 항목별 결과를 내보낸다(마지막 줄은 summary).
+    - 항목끼리 세션을 공유하지 않도록 repository_factory 로 항목마다 저장소를 만든다.
+    - staged=True 이면 항목별 처리를 IngestionPipeline(fetch -> persist -> analyze)에 맡긴다. 항목 줄은 영상/댓글이
+      적재되는 즉시 나가고, 감정/점수는 뒤에서 채워져 summary 의 analysis 에 집계된다(LLM 이 적재 속도를 막지 않음).
+    """
+
+    def __init__(
+        self,
+        repository_factory: Callable[[], ContentRepositoryPort],
+        sentiment_usecase=None,
+        concurrency: int | None = None,
+    ):
+        self.repository_factory = repository_factory
+        self.sentiment_usecase = sentiment_usecase
+        self.concurrency = max(concurrency or int(os.getenv("BULK_INGESTION_CONCURRENCY", "4")), 1)
+
+    def ingest(
+        self,
+        client: PlatformClientPort,
+        channel_ids: list[str],
+        video_ids: list[str],
+        include_comments: bool = False,
+        max_videos: int = 10,
+        max_comments: int = 50,
+        staged: bool = False,
+    ) -> Iterator[dict]:
+        started = time.perf_counter()
+        channel_ids = list(dict.fromkeys(channel_ids))
+        video_ids = list(dict.fromkeys(video_ids))
+        counts = {"succeeded": 0, "failed": 0}
+
+        channels, channel_error = self._lookup(lambda: client.fetch_channels(channel_ids) if channel_ids else {})
+        videos, video_error = self._lookup(
+            lambda: {v.video_id: v for v in client.fetch_videos_for_ids(video_ids)} if video_ids else {}
+        )
+
+        # (종류, id, 일괄 조회로 받아 둔 채널/영상)
+        targets: list[tuple[str, str, object]] = []
+        missing: list[dict] = []
+        for channel_id in channel_ids:
+            channel = channels.get(channel_id)
+            if channel is None:
+                missing.append(self._line("channel", channel_id, error=channel_error or "channel not found"))
+                continue
+            targets.append(("channel", channel_id, channel))
+        for video_id in video_ids:
+            video = videos.get(video_id)
+            if video is None:
+                missing.append(self._line("video", video_id, error=video_error or "video not found"))
+                continue
+            targets.append(("video", video_id, video))
+
+        for line in missing:
+            counts["failed"] += 1
+            yield line
+
+        options = {"include_comments": include_comments, "max_videos": max_videos, "max_comments": max_comments}
+        if staged:
+            extra = yield from self._ingest_staged(client, targets, options, counts)
+        else:
+            extra = yield from self._ingest_concurrently(client, targets, options, counts)
+
+        duration_ms = int((time.perf_counter() - started) * 1000)
+        print(
+            f"[BULK-INGESTION] done | channels={len(channel_ids)}, videos={len(video_ids)}, "
+            f"succeeded={counts['succeeded']}, failed={counts['failed']}, duration_ms={duration_ms}"
+        )
+        yield {"type": "summary", **counts, "duration_ms": duration_ms, **extra}
+
+    def _ingest_concurrently(
+        self, client: PlatformClientPort, targets: list[tuple[str, str, object]], options: dict, counts: dict
+    ) -> Generator[dict, None, dict]:
+        """항목마다 IngestionUseCase 로 수집/분석/적재를 한 번에 처리한다."""
+
+        def call(item_type: str, item_id: str, prefetched) -> Callable[[IngestionUseCase], dict]:
+            if item_type == "channel":
+                return lambda usecase: usecase.ingest_channel_bundle(
+                    client,
+                    item_id,
+                    include_comments=options["include_comments"],
+                    max_videos=options["max_videos"],
+                    max_comments=options["max_comments"],
+                    channel=prefetched,
+                )
+            return lambda usecase: usecase.ingest_video(
+                client,
+                item_id,
+                include_comments=options["include_comments"],
+                max_comments=options["max_comments"],
+                video=prefetched,
+            )
+
+        pool = ThreadPoolExecutor(max_workers=self.concurrency, thread_name_prefix="bulk-ingest")
+        try:
+            # 항목별 플랫폼 호출도 요청자의 context(쿼터 우선순위/사용량 집계)에서 실행한다.
+            futures = {
+                pool.submit(contextvars.copy_context().run, self._run, call(*target)): target[:2]
+                for target in targets
+            }
+            for future in as_completed(futures):
+                item_type, item_id = futures[future]
+                try:
+                    line = self._line(item_type, item_id, result=future.result())
+                    counts["succeeded"] += 1
+                except Exception as exc:  # pylint: disable=broad-except
+                    line = self._line(item_type, item_id, error=f"{type(exc).__name__}: {exc}")
+                    counts["failed"] += 1
+                yield line
+        finally:
+            # 응답 스트림이 중간에 끊기면 아직 시작하지 않은 항목은 취소한다.
+            pool.shutdown(wait=True, cancel_futures=True)
+        return {}
+
+    def _ingest_staged(
+        self, client: PlatformClientPort, targets: list[tuple[str, str, object]], options: dict, counts: dict
+    ) -> Generator[dict, None, dict]:
+        """
+        IngestionPipeline 으로 처리한다. 제출은 별도 스레드가 맡아(큐가 차면 막힘) 결과 줄을 받는 쪽과 겹쳐 진행한다.
+        """
+        results: queue.Queue = queue.Queue()
+        pipeline = IngestionPipeline(self.repository_factory, self.sentiment_usecase, on_item=results.put).start()
+        outcome: dict = {}
+
+        def produce() -> None:
+            try:
+                for item_type, item_id, prefetched in targets:
+                    if item_type == "channel":
+                        pipeline.submit_channel(client, item_id, channel=prefetched, **options)
+                    else:
+                        pipeline.submit_video(
+                            client,
+                            item_id,
+                            include_comments=options["include_comments"],
+                            max_comments=options["max_comments"],
+                            video=prefetched,
+                        )
+            except IngestionPipelineError:
+                pass  # 원인 오류는 close 가 다시 올린다.
+            try:
+                outcome["stats"] = pipeline.close()
+            except IngestionPipelineError as exc:
+                outcome["error"] = f"{type(exc).__name__}: {exc}"
+            finally:
+                results.put(_DONE)
+
+        producer = threading.Thread(
+            target=contextvars.copy_context().run, args=(produce,), name="bulk-ingest-producer", daemon=True
+        )
+        producer.start()
+        reported = 0
+        drained = False
+        try:
+            while (line := results.get()) is not _DONE:
+                reported += 1
+                counts["succeeded" if line["status"] == "succeeded" else "failed"] += 1
+                yield line
+            drained = True
+        finally:
+            if not drained:
+                # 응답 스트림이 중간에 끊기면 남은 작업을 버린다.
+                pipeline.cancel()
+            producer.join()
+
+        if "error" in outcome:
+            # 파이프라인이 중단돼 결과를 받지 못한 항목은 실패로 센다.
+            counts["failed"] += len(targets) - reported
+            return {"error": outcome["error"]}
+        stats = outcome["stats"]
+        return {
+            "analysis": {
+                "analyzed_videos": stats.analyzed_videos,
+                "analyzed_comments": stats.analyzed_comments,
+                "failures": [failure for failure in stats.failures if failure["stage"] == "analyze"],
+            }
+        }
+
+    def _run(self, call: Callable[[IngestionUseCase], dict]) -> dict:
+        repository = self.repository_factory()
+        try:
+            return call(IngestionUseCase(repository, self.sentiment_usecase))
+        finally:
+            repository.close()
+
+    @staticmethod
+    def _lookup(fetch: Callable[[], dict]) -> tuple[dict, str | None]:
+        # 일괄 조회 자체가 실패하면 해당 종류의 항목 전체를 같은 오류로 실패 처리한다.
+        try:
+            return fetch(), None
+        except Exception as exc:  # pylint: disable=broad-except
+            return {}, f"{type(exc).__name__}: {exc}"
+
+    @staticmethod
+    def _line(item_type: str, item_id: str, result: dict | None = None, error: str | None = None) -> dict:
+        if error is not None:
+            return {"type": item_type, "id": item_id, "status": "failed", "error": error}
+        return {"type": item_type, "id": item_id, "status": "succeeded", "result": result}
@@ -0,0 +1,362 @@
+import hashlib
+import json
+import os
+import socket
+import threading
+import time
+import uuid
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Callable, Optional
+
+import redis
+
+# 작업 함수는 진행 상황 콜백(progress)을 받아 단계별 메시지를 남기고, 결과 dict 를 반환한다.
+JobFunc = Callable[[Callable[[str], None]], Any]
+
+# KEYS: inflight / ARGV: job_id, inflight_ttl_ms, job_key_prefix
+# 같은 키의 작업이 대기/실행 중이면 그 job_id 를 돌려주고 합쳐진 요청 수를 올린다. 없으면 새 작업을 진행 중으로 등록한다.
+_CLAIM_INFLIGHT_SCRIPT = """
+local existing = redis.call('GET', KEYS[1])
+if existing and redis.call('EXISTS', ARGV[3] .. existing) == 1 then
+    redis.call('HINCRBY', ARGV[3] .. existing, 'coalesced_submissions', 1)
+    return existing
+end
+redis.call('SET', KEYS[1], ARGV[1], 'PX', ARGV[2])
+return ARGV[1]
+"""
+
+# 토큰(job_id)이 일치할 때만 진행 중 표시를 연장/해제한다. 다른 작업이 잡은 키를 건드리지 않기 위함.
+_RENEW_SCRIPT = """
+if redis.call('GET', KEYS[1]) == ARGV[1] then
+    return redis.call('PEXPIRE', KEYS[1], ARGV[2])
+end
+return 0
+"""
+
+_RELEASE_SCRIPT = """
+if redis.call('GET', KEYS[1]) == ARGV[1] then
+    return redis.call('DEL', KEYS[1])
+end
+return 0
+"""
+
+
+class IngestionJobQueueFull(RuntimeError):
+    """이 프로세스에서 대기 중인 작업 수가 INGESTION_JOB_MAX_PENDING 에 도달해 새 작업을 받을 수 없음."""
+
+
+class IngestionJobStoreError(RuntimeError):
+    """작업 상태 저장소(Redis)에 접근할 수 없어 작업을 등록/조회할 수 없음."""
+
+
+@dataclass
+class IngestionJob:
+    job_id: str
+    key: str
+    platform: str
+    target_type: str
+    target_id: str
+    params: dict = field(default_factory=dict)
+    status: str = "queued"  # queued | running | succeeded | failed
+    progress: list[str] = field(default_factory=list)
+    submitted_at: datetime = field(default_factory=datetime.utcnow)
+    started_at: Optional[datetime] = None
+    finished_at: Optional[datetime] = None
+    result: Any = None
+    error: Optional[str] = None
+    coalesced_submissions: int = 0
+    worker: Optional[str] = None
+
+    @property
+    def done(self) -> bool:
+        return self.status in ("succeeded", "failed")
+
+    def as_dict(self) -> dict:
+        return {
+            "job_id": self.job_id,
+            "platform": self.platform,
+            "target_type": self.target_type,
+            "target_id": self.target_id,
+            "params": self.params,
+            "status": self.status,
+            "progress": list(self.progress),
+            "submitted_at": self.submitted_at.isoformat(),
+            "started_at": self.started_at.isoformat() if self.started_at else None,
+            "finished_at": self.finished_at.isoformat() if self.finished_at else None,
+            "result": self.result,
+            "error": self.error,
+            "coalesced_submissions": self.coalesced_submissions,
+            "worker": self.worker,
+        }
+
+    def to_hash(self) -> dict:
+        return {
+            "job_id": self.job_id,
+            "key": self.key,
+            "platform": self.platform,
+            "target_type": self.target_type,
+            "target_id": self.target_id,
+            "params": json.dumps(self.params, ensure_ascii=False, default=str),
+            "status": self.status,
+            "submitted_at": self.submitted_at.isoformat(),
+            "coalesced_submissions": self.coalesced_submissions,
+            "worker": self.worker or "",
+        }
+
+    @classmethod
+    def from_hash(cls, values: dict, progress: list[str]) -> "IngestionJob":
+        def parse_time(value: str | None) -> Optional[datetime]:
+            return datetime.fromisoformat(value) if value else None
+
+        return cls(
+            job_id=values["job_id"],
+            key=values["key"],
+            platform=values["platform"],
+            target_type=values["target_type"],
+            target_id=values["target_id"],
+            params=json.loads(values.get("params") or "{}"),
+            status=values.get("status", "queued"),
+            progress=progress,
+            submitted_at=parse_time(values.get("submitted_at")) or datetime.utcnow(),
+            started_at=parse_time(values.get("started_at")),
+            finished_at=parse_time(values.get("finished_at")),
+            result=json.loads(values["result"]) if values.get("result") else None,
+            error=values.get("error") or None,
+            coalesced_submissions=int(values.get("coalesced_submissions") or 0),
+            worker=values.get("worker") or None,
+        )
+
+
+class IngestionJobQueue:
+    """
+    수집 요청을 백그라운드 작업으로 실행하는 작업 큐. 실행은 프로세스 내 스레드 풀, 상태는 Redis 에 둔다.
+    - 작업은 INGESTION_JOB_WORKERS 개 스레드 풀에서 실행되고, 요청은 job_id 만 받아 바로 반환한다.
+    - 작업 상태/진행/결과는 Redis 해시(INGESTION_JOB_KEY_PREFIX:job:{job_id})에 INGESTION_JOB_TTL_SECONDS 동안 남으므로,
+      어느 워커/노드로 들어온 GET /ingestion/jobs/{id} 도 같은 상태를 본다.
+    - 같은 대상(platform, target_type, target_id)과 같은 옵션(params)의 작업이 대기/실행 중이면 어느 노드에서 들어온 요청이든
+      새 작업을 만들지 않고 기존 작업을 돌려준다. 옵션이 다르면 별도 작업이다.
+    - 진행 중 표시는 INGESTION_JOB_INFLIGHT_TTL_SECONDS 짜리 키로 두고 실행 프로세스가 주기적으로 연장한다.
+      프로세스가 죽으면 키가 만료되어 같은 요청을 다시 받을 수 있고, 그 작업은 조회 시 failed 로 보인다.
+    - 이 프로세스의 대기 작업이 INGESTION_JOB_MAX_PENDING 개를 넘으면 IngestionJobQueueFull 을 던진다.
+    - Redis 에 접근할 수 없으면 등록/조회는 IngestionJobStoreError 를 던지고, 실행 중 상태 기록 실패는 로그만 남긴다.
+    """
+
+    def __init__(
+        self,
+        client: Optional[redis.Redis] = None,
+        max_workers: int | None = None,
+        max_pending: int | None = None,
+        ttl_seconds: int | None = None,
+        inflight_ttl_seconds: float | None = None,
+        key_prefix: str | None = None,
+    ):
+        self._client = client
+        self.max_workers = max(max_workers or int(os.getenv("INGESTION_JOB_WORKERS", "2")), 1)
+        self.max_pending = max(max_pending or int(os.getenv("INGESTION_JOB_MAX_PENDING", "100")), 1)
+        self.ttl_seconds = max(ttl_seconds or int(os.getenv("INGESTION_JOB_TTL_SECONDS", str(7 * 24 * 3600))), 1)
+        self.inflight_ttl_ms = int(
+            float(inflight_ttl_seconds or os.getenv("INGESTION_JOB_INFLIGHT_TTL_SECONDS", "60")) * 1000
+        )
+        self.key_prefix = key_prefix or os.getenv("INGESTION_JOB_KEY_PREFIX", "ingest:job")
+        self.worker_id = f"{socket.gethostname()}:{os.getpid()}"
+        self._executor: ThreadPoolExecutor | None = None
+        self._pending = 0
+        # 이 프로세스가 맡은 작업의 진행 중 키 (job_id -> inflight 키). heartbeat 가 연장한다.
+        self._local: dict[str, str] = {}
+        self._futures: dict[str, tuple[IngestionJob, Future]] = {}
+        self._lock = threading.Lock()
+        self._heartbeat: threading.Thread | None = None
+        self._scripts: dict | None = None
+
+    @property
+    def client(self) -> redis.Redis:
+        if self._client is None:
+            from config.redis_config import get_redis
+
+            self._client = get_redis()
+        return self._client
+
+    def _script(self, name: str):
+        if self._scripts is None:
+            self._scripts = {
+                "claim": self.client.register_script(_CLAIM_INFLIGHT_SCRIPT),
+                "renew": self.client.register_script(_RENEW_SCRIPT),
+                "release": self.client.register_script(_RELEASE_SCRIPT),
+            }
+        return self._scripts[name]
+
+    def _job_key(self, job_id: str) -> str:
+        return f"{self.key_prefix}:job:{job_id}"
+
+    def _inflight_key(self, key: str) -> str:
+        return f"{self.key_prefix}:inflight:{key}"
+
+    @staticmethod
+    def coalesce_key(platform: str, target_type: str, target_id: str, params: dict | None) -> str:
+        # 옵션이 다른 요청을 기존 작업으로 합치지 않도록 정렬한 params 의 해시를 키에 넣는다.
+        digest = hashlib.sha1(
+            json.dumps(params or {}, sort_keys=True, ensure_ascii=False, default=str).encode("utf-8")
+        ).hexdigest()[:16]
+        return f"{platform}:{target_type}:{target_id}:{digest}"
+
+    def submit(
+        self,
+        platform: str,
+        target_type: str,
+        target_id: str,
+        func: JobFunc,
+        params: dict | None = None,
+    ) -> tuple[IngestionJob, bool]:
+        """
+        작업을 등록하고 (job, coalesced) 를 반환한다. coalesced=True 이면 진행 중인 기존 작업을 돌려준 것이다.
+        """
+        key = self.coalesce_key(platform, target_type, target_id, params)
+        with self._lock:
+            if self._pending >= self.max_pending:
+                raise IngestionJobQueueFull(f"too many pending ingestion jobs ({self._pending})")
+            job = IngestionJob(
+                job_id=uuid.uuid4().hex,
+                key=key,
+                platform=platform,
+                target_type=target_type,
+                target_id=target_id,
+                params=params or {},
+                worker=self.worker_id,
+            )
+            job_key = self._job_key(job.job_id)
+            inflight_key = self._inflight_key(key)
+            try:
+                # 해시를 먼저 써 두어야 진행 중 키를 본 다른 노드가 바로 작업을 조회할 수 있다.
+                pipe = self.client.pipeline(transaction=False)
+                pipe.hset(job_key, mapping=job.to_hash())
+                pipe.expire(job_key, self.ttl_seconds)
+                pipe.execute()
+                owner = self._script("claim")(
+                    keys=[inflight_key], args=[job.job_id, self.inflight_ttl_ms, f"{self.key_prefix}:job:"]
+                )
+                if owner != job.job_id:
+                    self.client.delete(job_key)
+                    existing = self.get(owner)
+                    if existing is not None:
+                        return existing, True
+                    raise IngestionJobStoreError(f"coalesced ingestion job {owner} is missing")
+            except redis.RedisError as exc:
+                raise IngestionJobStoreError(f"ingestion job store unavailable: {exc}") from exc
+
+            self._pending += 1
+            self._local[job.job_id] = inflight_key
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="ingest-job")
+            if self._heartbeat is None:
+                self._heartbeat = threading.Thread(target=self._keep_alive, name="ingest-job-heartbeat", daemon=True)
+                self._heartbeat.start()
+            self._futures[job.job_id] = (job, self._executor.submit(self._run, job, func))
+        print(f"[INGESTION-JOB] queued | job_id={job.job_id}, key={key}")
+        return job, False
+
+    def get(self, job_id: str) -> IngestionJob | None:
+        job_key = self._job_key(job_id)
+        try:
+            pipe = self.client.pipeline(transaction=False)
+            pipe.hgetall(job_key)
+            pipe.lrange(f"{job_key}:progress", 0, -1)
+            values, progress = pipe.execute()
+            if not values:
+                return None
+            job = IngestionJob.from_hash(values, list(progress))
+            if not job.done and self.client.get(self._inflight_key(job.key)) != job.job_id:
+                # 실행하던 프로세스가 죽어 진행 중 키가 만료됐다. 결과는 나오지 않으므로 실패로 보여 준다.
+                job.status = "failed"
+                job.error = f"ingestion worker {job.worker} stopped before the job finished"
+            return job
+        except redis.RedisError as exc:
+            raise IngestionJobStoreError(f"ingestion job store unavailable: {exc}") from exc
+
+    def shutdown(self) -> None:
+        """
+        대기 중인 작업은 취소하고, 실행 중인 작업은 기다리지 않는다(요청 스레드가 아닌 워커에서 계속 끝까지 실행됨).
+        취소된 작업은 진행 중 키를 풀어 다른 노드가 같은 요청을 다시 받을 수 있게 한다.
+        """
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is None:
+            return
+        executor.shutdown(wait=False, cancel_futures=True)
+        with self._lock:
+            cancelled = [job for job, future in self._futures.values() if future.cancelled()]
+        for job in cancelled:
+            job.status = "failed"
+            job.error = "cancelled at shutdown"
+            job.finished_at = datetime.utcnow()
+            self._update(job, {"status": job.status, "error": job.error, "finished_at": job.finished_at.isoformat()})
+            self._release(job)
+
+    def _run(self, job: IngestionJob, func: JobFunc) -> None:
+        with self._lock:
+            self._pending -= 1
+        job.status = "running"
+        job.started_at = datetime.utcnow()
+        self._update(job, {"status": job.status, "started_at": job.started_at.isoformat()})
+        print(f"[INGESTION-JOB] started | job_id={job.job_id}, key={job.key}")
+        fields: dict[str, str] = {}
+        try:
+            job.result = func(lambda message: self._append_progress(job, message))
+            job.status = "succeeded"
+            fields["result"] = json.dumps(job.result, ensure_ascii=False, default=str)
+        except Exception as exc:  # pylint: disable=broad-except
+            job.error = f"{type(exc).__name__}: {exc}"
+            job.status = "failed"
+            fields["error"] = job.error
+        job.finished_at = datetime.utcnow()
+        fields.update({"status": job.status, "finished_at": job.finished_at.isoformat()})
+        self._update(job, fields)
+        self._release(job)
+        duration_ms = int((job.finished_at - job.started_at).total_seconds() * 1000)
+        print(f"[INGESTION-JOB] {job.status} | job_id={job.job_id}, key={job.key}, duration_ms={duration_ms}")
+
+    def _append_progress(self, job: IngestionJob, message: str) -> None:
+        job.progress.append(message)
+        progress_key = f"{self._job_key(job.job_id)}:progress"
+        try:
+            pipe = self.client.pipeline(transaction=False)
+            pipe.rpush(progress_key, message)
+            pipe.expire(progress_key, self.ttl_seconds)
+            pipe.execute()
+        except redis.RedisError as exc:
+            print(f"[INGESTION-JOB] progress write failed | job_id={job.job_id}: {exc}")
+
+    def _update(self, job: IngestionJob, fields: dict) -> None:
+        job_key = self._job_key(job.job_id)
+        try:
+            pipe = self.client.pipeline(transaction=False)
+            pipe.hset(job_key, mapping=fields)
+            pipe.expire(job_key, self.ttl_seconds)
+            pipe.execute()
+        except redis.RedisError as exc:
+            print(f"[INGESTION-JOB] status write failed | job_id={job.job_id}: {exc}")
+
+    def _release(self, job: IngestionJob) -> None:
+        with self._lock:
+            self._futures.pop(job.job_id, None)
+            inflight_key = self._local.pop(job.job_id, None)
+        if inflight_key is None:
+            return
+        try:
+            self._script("release")(keys=[inflight_key], args=[job.job_id])
+        except redis.RedisError as exc:
+            print(f"[INGESTION-JOB] inflight release failed | job_id={job.job_id}: {exc}")
+
+    def _keep_alive(self) -> None:
+        interval = max(self.inflight_ttl_ms / 3000, 0.1)
+        # 데몬 스레드: shutdown 뒤에도 끝까지 실행되는 작업의 키를 프로세스가 살아 있는 동안 연장한다.
+        while True:
+            time.sleep(interval)
+            with self._lock:
+                local = list(self._local.items())
+            for job_id, inflight_key in local:
+                try:
+                    self._script("renew")(keys=[inflight_key], args=[job_id, self.inflight_ttl_ms])
+                except redis.RedisError as exc:
+                    print(f"[INGESTION-JOB] inflight renew failed | job_id={job_id}: {exc}")
@@ -0,0 +1,364 @@
+import contextvars
+import os
+import queue
+import threading
+from dataclasses import dataclass, field
+from typing import Callable, Optional
+
+from content.application.port.content_repository_port import ContentRepositoryPort
+from content.application.port.platform_client_port import PlatformClientPort
+from content.application.usecase.ingestion_usecase import IngestionUseCase
+from content.domain.channel import Channel
+from content.domain.crawl_log import CrawlLog
+from content.domain.video import Video
+from content.domain.video_comment import VideoComment
+from content.domain.video_score import VideoScore
+
+# 단계 종료 신호. 워커 수만큼 큐에 넣어 모든 워커가 하나씩 받고 종료한다.
+_STOP = object()
+# 큐가 막혀 있을 때 파이프라인 중단 여부를 다시 확인하는 주기
+_POLL_SECONDS = 0.2
+
+
+class IngestionPipelineError(RuntimeError):
+    """워커가 항목 처리 밖에서 실패(저장소 생성 실패 등)해 파이프라인이 중단됨."""
+
+
+@dataclass
+class _FetchTask:
+    client: PlatformClientPort
+    target_type: str  # channel | video
+    target_id: str
+    include_comments: bool
+    max_videos: int
+    max_comments: int
+    # 일괄 조회로 미리 받아 둔 채널/영상(있으면 다시 조회하지 않는다)
+    channel: Optional[Channel] = None
+    video: Optional[Video] = None
+
+
+@dataclass
+class _FetchedBundle:
+    target_type: str
+    target_id: str
+    platform: str
+    channel: Optional[Channel]
+    videos: list[Video]
+    comments: dict[str, list[VideoComment]]
+
+
+@dataclass
+class _AnalyzeTask:
+    platform: str
+    video: Video
+    comments: list[VideoComment]
+
+
+@dataclass
+class PipelineStats:
+    fetched: int = 0
+    persisted_videos: int = 0
+    persisted_comments: int = 0
+    analyzed_videos: int = 0
+    analyzed_comments: int = 0
+    failures: list[dict] = field(default_factory=list)
+
+    def as_dict(self) -> dict:
+        return {
+            "fetched": self.fetched,
+            "persisted_videos": self.persisted_videos,
+            "persisted_comments": self.persisted_comments,
+            "analyzed_videos": self.analyzed_videos,
+            "analyzed_comments": self.analyzed_comments,
+            "failures": list(self.failures),
+        }
+
+
+class IngestionPipeline:
+    """
+    수집(fetch) -> 적재(persist) -> 분석(analyze) 3단계로 나눈 프로세스 내 수집 파이프라인.
+    - 단계 사이는 크기 제한 큐(INGESTION_PIPELINE_QUEUE_SIZE)로 연결되어, 뒷단계가 밀리면 앞단계의 put 이 막힌다(backpressure).
+    - 단계별 워커 수를 따로 둔다(INGESTION_PIPELINE_FETCH_WORKERS / _PERSIST_WORKERS / _ANALYZE_WORKERS).
+    - persist 단계는 영상/댓글을 바로 commit 해 곧바로 조회할 수 있게 하고,
+      감정/점수는 analyze 단계가 LLM 응답을 받는 대로 나중에 채운다.
+    - 저장소 세션은 스레드 간 공유할 수 없으므로 repository_factory 로 워커마다 저장소를 만들고, 워커가 끝나면 닫는다.
+    - on_item 을 주면 대상별 결과를 적재(또는 fetch/persist 실패) 직후 {"type", "id", "status", ...} 로 알린다.
+      분석 결과는 PipelineStats 에만 모은다.
+    - 항목 하나의 실패는 기록만 하고 넘어가지만, 워커 자체가 죽으면(저장소 생성 실패 등) 파이프라인 전체를 중단한다.
+      이때 막혀 있던 submit/close 는 IngestionPipelineError 를 올린다(남은 작업은 버린다).
+
+    사용 예:
+        pipeline = IngestionPipeline(ContentRepositoryImpl, sentiment_usecase)
+        pipeline.start()
+        pipeline.submit_channel(client, "UC...")
+        stats = pipeline.close()
+    """
+
+    def __init__(
+        self,
+        repository_factory: Callable[[], ContentRepositoryPort],
+        sentiment_usecase=None,
+        fetch_workers: int | None = None,
+        persist_workers: int | None = None,
+        analyze_workers: int | None = None,
+        queue_size: int | None = None,
+        on_item: Callable[[dict], None] | None = None,
+    ):
+        self.repository_factory = repository_factory
+        self.sentiment_usecase = sentiment_usecase
+        self.on_item = on_item
+        self.fetch_workers = max(fetch_workers or int(os.getenv("INGESTION_PIPELINE_FETCH_WORKERS", "2")), 1)
+        self.persist_workers = max(persist_workers or int(os.getenv("INGESTION_PIPELINE_PERSIST_WORKERS", "1")), 1)
+        self.analyze_workers = max(analyze_workers or int(os.getenv("INGESTION_PIPELINE_ANALYZE_WORKERS", "4")), 1)
+        size = max(queue_size or int(os.getenv("INGESTION_PIPELINE_QUEUE_SIZE", "32")), 1)
+        self._fetch_queue: queue.Queue = queue.Queue(maxsize=size)
+        self._persist_queue: queue.Queue = queue.Queue(maxsize=size)
+        self._analyze_queue: queue.Queue = queue.Queue(maxsize=size)
+        self._threads: dict[str, list[threading.Thread]] = {}
+        self._lock = threading.Lock()
+        self._failed = threading.Event()
+        self._error: BaseException | None = None
+        self.stats = PipelineStats()
+
+    def start(self) -> "IngestionPipeline":
+        if self._threads:
+            return self
+        self._threads = {
+            "fetch": self._spawn("fetch", self.fetch_workers, self._fetch_loop),
+            "persist": self._spawn("persist", self.persist_workers, self._persist_loop),
+            "analyze": self._spawn("analyze", self.analyze_workers, self._analyze_loop),
+        }
+        return self
+
+    def submit_channel(
+        self,
+        client: PlatformClientPort,
+        channel_id: str,
+        include_comments: bool = False,
+        max_videos: int = 10,
+        max_comments: int = 50,
+        channel: Channel | None = None,
+    ) -> None:
+        """fetch 큐가 가득 차 있으면 자리가 날 때까지 막힌다. 파이프라인이 중단되면 IngestionPipelineError."""
+        self._put(
+            self._fetch_queue,
+            _FetchTask(client, "channel", channel_id, include_comments, max_videos, max_comments, channel=channel),
+        )
+
+    def submit_video(
+        self,
+        client: PlatformClientPort,
+        video_id: str,
+        include_comments: bool = True,
+        max_comments: int = 50,
+        video: Video | None = None,
+    ) -> None:
+        self._put(self._fetch_queue, _FetchTask(client, "video", video_id, include_comments, 1, max_comments, video=video))
+
+    def cancel(self) -> None:
+        """남은 작업을 버리고 모든 워커를 멈춘다(이후 close 는 IngestionPipelineError)."""
+        self._abort("cancel", IngestionPipelineError("ingestion pipeline cancelled"))
+
+    def close(self) -> PipelineStats:
+        """
+        더 이상 작업을 받지 않고, 앞단계부터 차례로 남은 작업을 모두 처리한 뒤 종료한다.
+        워커가 죽어 파이프라인이 중단됐으면 모든 워커가 멈춘 뒤 IngestionPipelineError 를 올린다.
+        """
+        for stage, inbox in (
+            ("fetch", self._fetch_queue),
+            ("persist", self._persist_queue),
+            ("analyze", self._analyze_queue),
+        ):
+            threads = self._threads.get(stage, [])
+            try:
+                for _ in threads:
+                    self._put(inbox, _STOP)
+            except IngestionPipelineError:
+                pass  # 중단된 경우 워커는 _get 에서 스스로 종료한다.
+            for thread in threads:
+                thread.join()
+        self._threads = {}
+        print(f"[INGESTION-PIPELINE] closed | {self.stats.as_dict()}")
+        if self._error is not None:
+            raise IngestionPipelineError(
+                f"ingestion pipeline aborted: {type(self._error).__name__}: {self._error}"
+            ) from self._error
+        return self.stats
+
+    def _spawn(self, stage: str, count: int, target: Callable[[], None]) -> list[threading.Thread]:
+        threads = []
+        for index in range(count):
+            # 호출자의 context(쿼터 우선순위/사용량 집계)를 워커마다 복사해 넘긴다.
+            thread = threading.Thread(
+                target=contextvars.copy_context().run,
+                args=(self._guard, stage, target),
+                name=f"ingest-{stage}-{index}",
+                daemon=True,
+            )
+            thread.start()
+            threads.append(thread)
+        return threads
+
+    def _guard(self, stage: str, loop: Callable[[], None]) -> None:
+        try:
+            loop()
+        except BaseException as exc:  # pylint: disable=broad-except
+            self._abort(stage, exc)
+
+    def _abort(self, stage: str, exc: BaseException) -> None:
+        with self._lock:
+            if self._error is not None:
+                return
+            self._error = exc
+        print(f"[INGESTION-PIPELINE] aborted by {stage} | {type(exc).__name__}: {exc}")
+        self._failed.set()
+
+    def _get(self, inbox: queue.Queue):
+        # 중단되면 남은 항목을 버리고 종료 신호를 돌려준다.
+        while not self._failed.is_set():
+            try:
+                return inbox.get(timeout=_POLL_SECONDS)
+            except queue.Empty:
+                continue
+        return _STOP
+
+    def _put(self, outbox: queue.Queue, item) -> None:
+        # 뒷단계 워커가 모두 죽으면 큐가 비워지지 않으므로, 막혀 있는 동안 중단 여부를 확인한다.
+        while not self._failed.is_set():
+            try:
+                outbox.put(item, timeout=_POLL_SECONDS)
+                return
+            except queue.Full:
+                continue
+        raise IngestionPipelineError("ingestion pipeline aborted") from self._error
+
+    def _fetch_loop(self) -> None:
+        usecase = IngestionUseCase(repository=None)
+        while (task := self._get(self._fetch_queue)) is not _STOP:
+            try:
+                bundle = self._fetch(usecase, task)
+            except Exception as exc:  # pylint: disable=broad-except
+                self._fail("fetch", task.target_type, task.target_id, exc)
+                continue
+            self._put(self._persist_queue, bundle)
+            with self._lock:
+                self.stats.fetched += 1
+
+    def _persist_loop(self) -> None:
+        repository = self.repository_factory()
+        try:
+            self._persist_all(repository)
+        finally:
+            repository.close()
+
+    def _persist_all(self, repository: ContentRepositoryPort) -> None:
+        usecase = IngestionUseCase(repository)
+        while (bundle := self._get(self._persist_queue)) is not _STOP:
+            comments = [c for video in bundle.videos for c in bundle.comments.get(video.video_id, [])]
+            try:
+                with repository.unit_of_work():
+                    if bundle.channel is not None:
+                        usecase.persist_channel(bundle.channel)
+                    usecase.persist_videos(bundle.videos)
+                    repository.upsert_comments(comments)
+                    repository.log_crawl(
+                        CrawlLog(
+                            id=None,
+                            target_type=bundle.target_type,
+                            target_id=bundle.target_id,
+                            status="success",
+                            message=f"{len(bundle.videos)} videos, {len(comments)} comments ingested",
+                        )
+                    )
+            except Exception as exc:  # pylint: disable=broad-except
+                self._fail("persist", bundle.target_type, bundle.target_id, exc)
+                continue
+            with self._lock:
+                self.stats.persisted_videos += len(bundle.videos)
+                self.stats.persisted_comments += len(comments)
+            result = {"videos": [video.video_id for video in bundle.videos], "comment_count": len(comments)}
+            if bundle.channel is not None:
+                result["channel_id"] = bundle.channel.channel_id
+            self._report(bundle.target_type, bundle.target_id, result=result)
+            if self.sentiment_usecase is None:
+                continue
+            for video in bundle.videos:
+                self._put(
+                    self._analyze_queue,
+                    _AnalyzeTask(bundle.platform, video, bundle.comments.get(video.video_id, [])),
+                )
+
+    def _analyze_loop(self) -> None:
+        repository = self.repository_factory()
+        try:
+            self._analyze_all(repository)
+        finally:
+            repository.close()
+
+    def _analyze_all(self, repository: ContentRepositoryPort) -> None:
+        while (task := self._get(self._analyze_queue)) is not _STOP:
+            try:
+                sentiment = self.sentiment_usecase.analyze_video(task.video)
+                sentiment.platform = task.platform
+                comment_sentiments = [self.sentiment_usecase.analyze_comment(c) for c in task.comments]
+                for item in comment_sentiments:
+                    item.platform = task.platform
+                with repository.unit_of_work():
+                    repository.upsert_video_sentiments([sentiment])
+                    repository.upsert_video_scores(
+                        [
+                            VideoScore(
+                                video_id=task.video.video_id,
+                                platform=task.platform,
+                                sentiment_score=sentiment.sentiment_score,
+                                trend_score=sentiment.trend_score,
+                            )
+                        ]
+                    )
+                    repository.upsert_comment_sentiments(comment_sentiments)
+            except Exception as exc:  # pylint: disable=broad-except
+                self._fail("analyze", "video", task.video.video_id, exc)
+                continue
+            with self._lock:
+                self.stats.analyzed_videos += 1
+                self.stats.analyzed_comments += len(comment_sentiments)
+
+    @staticmethod
+    def _fetch(usecase: IngestionUseCase, task: _FetchTask) -> _FetchedBundle:
+        client = task.client
+        channel = None
+        if task.target_type == "channel":
+            channel, videos = usecase.fetch_channel_videos(client, task.target_id, task.max_videos, channel=task.channel)
+        else:
+            video = task.video or client.fetch_video(task.target_id)
+            video.platform = client.platform
+            videos = [video]
+        comments: dict[str, list[VideoComment]] = {}
+        if task.include_comments:
+            for video in videos:
+                fetched = list(client.fetch_comments(video.video_id, max_results=task.max_comments))
+                for c in fetched:
+                    c.platform = client.platform
+                comments[video.video_id] = fetched
+        return _FetchedBundle(task.target_type, task.target_id, client.platform, channel, videos, comments)
+
+    def _fail(self, stage: str, target_type: str, target_id: str, exc: Exception) -> None:
+        # 한 건의 실패가 파이프라인 전체를 멈추지 않도록 기록만 하고 다음 작업으로 넘어간다.
+        message = f"{type(exc).__name__}: {exc}"
+        print(f"[INGESTION-PIPELINE] {stage} failed | {target_type}={target_id}: {message}")
+        with self._lock:
+            self.stats.failures.append(
+                {"stage": stage, "target_type": target_type, "target_id": target_id, "error": message}
+            )
+        # 분석 실패는 대상이 이미 적재돼 알린 뒤이므로 통계에만 남긴다.
+        if stage != "analyze":
+            self._report(target_type, target_id, error=message)
+
+    def _report(self, target_type: str, target_id: str, result: dict | None = None, error: str | None = None) -> None:
+        if self.on_item is None:
+            return
+        if error is not None:
+            self.on_item({"type": target_type, "id": target_id, "status": "failed", "error": error})
+        else:
+            self.on_item({"type": target_type, "id": target_id, "status": "succeeded", "result": result})
+
@@ -1,6 +1,9 @@
+import contextvars
 import os
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass, field
 from datetime import datetime, timedelta, timezone
-from typing import Iterable
+from typing import Callable, Iterable
 
 from content.application.port.content_repository_port import ContentRepositoryPort
 from content.application.port.platform_client_port import PlatformClientPort
@@ -15,11 +18,32 @@ from content.domain.video_score import VideoScore
 from content.domain.keyword_mapping import KeywordMapping
 
 
+@dataclass
+class _VideoDetails:
+    """영상 목록 순서대로 정렬된 분석/댓글 수집 결과."""
+
+    video_sentiments: list[VideoSentiment] = field(default_factory=list)
+    scores: list[VideoScore] = field(default_factory=list)
+    comments: list[VideoComment] = field(default_factory=list)
+    comment_sentiments: list[CommentSentiment] = field(default_factory=list)
+
+
 class IngestionUseCase:
-    def __init__(self, repository: ContentRepositoryPort, sentiment_usecase=None):
+    def __init__(
+        self,
+        repository: ContentRepositoryPort,
+        sentiment_usecase=None,
+        platform_concurrency: int | None = None,
+        openai_concurrency: int | None = None,
+    ):
         # 한국어 주석: 저장소와 감정 분석 모듈을 주입받아 플랫폼 무관하게 전 범위 콘텐츠를 적재합니다.
         self.repository = repository
         self.sentiment_usecase = sentiment_usecase
+        # 한국어 주석: 영상별 네트워크 호출 동시 실행 수. 플랫폼(YouTube) API 와 OpenAI 를 따로 제한하며, 1이면 순차 실행과 같습니다.
+        self.platform_concurrency = max(
+            platform_concurrency or int(os.getenv("INGESTION_YOUTUBE_CONCURRENCY", "4")), 1
+        )
+        self.openai_concurrency = max(openai_concurrency or int(os.getenv("INGESTION_OPENAI_CONCURRENCY", "4")), 1)
 
     def ingest_channel_bundle(
         self,
@@ -28,83 +52,40 @@ class IngestionUseCase:
         include_comments: bool = False,
         max_videos: int = 10,
         max_comments: int = 50,
+        progress: Callable[[str], None] | None = None,
+        channel: Channel | None = None,
     ) -> dict:
+        # 한국어 주석: channel 을 넘기면(일괄 조회로 미리 받아 둔 경우) 채널 조회를 건너뜁니다.
         # 한국어 주석: 채널, 영상, 댓글까지 가능한 모든 데이터를 모아 후속 분류·추천에 쓰도록 합니다.
-        channel = client.fetch_channel(channel_id)
-        channel.platform = client.platform
-        # 한국어 주석: 계정/채널 단위 정보를 별도 테이블에 적재하여 팔로워/게시물 등 변동성 필드만 추적합니다.
-        self.repository.upsert_account(
-            CreatorAccount(
-                account_id=channel.channel_id,
-                platform=client.platform,
-                display_name=channel.title,
-                description=channel.description,
-                country=channel.country,
-                follower_count=channel.subscriber_count,
-                post_count=channel.video_count,
-                last_updated_at=channel.crawled_at,
-                crawled_at=channel.crawled_at,
-            )
-        )
-        self.repository.upsert_channel(channel)
+        # 한국어 주석: API 호출/분석을 먼저 모두 끝내고, 적재는 마지막에 한 트랜잭션(unit of work)으로 처리해
+        # 중간 실패 시 일부만 저장되는 일이 없게 하고 commit 횟수를 1회로 줄입니다.
+        channel, videos = self.fetch_channel_videos(client, channel_id, max_videos, channel=channel)
+        ingested_videos: list[str] = [video.video_id for video in videos]
+        # 한국어 주석: progress 는 백그라운드 작업 상태 조회용 단계 메시지 콜백입니다(없으면 무시).
+        report = progress or (lambda message: None)
+        report(f"fetched channel and {len(videos)} videos")
 
-        videos = list(client.fetch_videos(channel_id, max_results=max_videos))
-        # 최신 업로드 필터: 기본 14일 내 업로드본만 유지(환경변수 INGESTION_RECENT_DAYS로 조정 가능)
-        recent_days = int(os.getenv("INGESTION_RECENT_DAYS", "14"))
-        if recent_days > 0:
-            # 시간대가 섞여 있을 때 naive/aware 비교 오류를 막기 위해 UTC 기준으로 통일해서 비교한다.
-            cutoff = datetime.now(timezone.utc) - timedelta(days=recent_days)
-            videos = [
-                v
-                for v in videos
-                if (
-                    self._to_utc(v.published_at)
-                    or self._to_utc(v.crawled_at)
-                    or cutoff
-                )
-                >= cutoff
-            ]
-        ingested_videos: list[str] = []
-        ingested_comments: int = 0
+        details = self._collect_video_details(client, videos, include_comments, max_comments)
+        ingested_comments = len(details.comments)
+        report(f"fetched {ingested_comments} comments and analyzed {len(details.video_sentiments)} videos")
 
-        for video in videos:
-            video.platform = client.platform
-            self._persist_video(video)
-            ingested_videos.append(video.video_id)
-
-            if self.sentiment_usecase:
-                sentiment = self.sentiment_usecase.analyze_video(video)
-                sentiment.platform = client.platform
-                self.repository.upsert_video_sentiment(sentiment)
-                score = VideoScore(
-                    video_id=video.video_id,
-                    platform=client.platform,
-                    sentiment_score=sentiment.sentiment_score,
-                    trend_score=sentiment.trend_score,
+        with self.repository.unit_of_work():
+            self.persist_channel(channel)
+            self.persist_videos(videos)
+            self.repository.upsert_video_sentiments(details.video_sentiments)
+            self.repository.upsert_video_scores(details.scores)
+            self.repository.upsert_comments(details.comments)
+            self.repository.upsert_comment_sentiments(details.comment_sentiments)
+            self.repository.log_crawl(
+                CrawlLog(
+                    id=None,
+                    target_type="channel",
+                    target_id=channel.channel_id,
+                    status="success",
+                    message=f"{len(ingested_videos)} videos, {ingested_comments} comments ingested",
                 )
-                self.repository.upsert_video_score(score)
-
-            if include_comments:
-                comments = list(client.fetch_comments(video.video_id, max_results=max_comments))
-                for c in comments:
-                    c.platform = client.platform
-                self.repository.upsert_comments(comments)
-                ingested_comments += len(comments)
-                if self.sentiment_usecase:
-                    sentiments = self.sentiment_usecase.analyze_comments(comments)
-                    for s in sentiments:
-                        s.platform = client.platform
-                    self.repository.upsert_comment_sentiments(sentiments)
-
-        self.repository.log_crawl(
-            CrawlLog(
-                id=None,
-                target_type="channel",
-                target_id=channel.channel_id,
-                status="success",
-                message=f"{len(ingested_videos)} videos, {ingested_comments} comments ingested",
             )
-        )
+        report("persisted")
 
         return {
             "channel_id": channel.channel_id,
@@ -118,79 +99,191 @@ class IngestionUseCase:
         video_id: str,
         include_comments: bool = True,
         max_comments: int = 50,
+        progress: Callable[[str], None] | None = None,
+        video: Video | None = None,
     ) -> dict:
         # 한국어 주석: 단일 영상의 본문·태그·댓글 등 전체 정보를 수집해 분석과 추천의 기반을 만듭니다.
-        video = client.fetch_video(video_id)
+        # 한국어 주석: video 를 넘기면(일괄 조회로 미리 받아 둔 경우) 영상 조회를 건너뜁니다.
+        video = video or client.fetch_video(video_id)
         video.platform = client.platform
         video.crawled_at = video.crawled_at or datetime.utcnow()
-        self._persist_video(video)
-
-        comments: list[VideoComment] = []
-        if include_comments:
-            comments = list(client.fetch_comments(video_id, max_results=max_comments))
-            for c in comments:
-                c.platform = client.platform
-            self.repository.upsert_comments(comments)
-            if self.sentiment_usecase:
-                sentiments = self.sentiment_usecase.analyze_comments(comments)
-                for s in sentiments:
-                    s.platform = client.platform
-                self.repository.upsert_comment_sentiments(sentiments)
-
-        video_sentiment = None
-        if self.sentiment_usecase:
-            video_sentiment = self.sentiment_usecase.analyze_video(video)
-            video_sentiment.platform = client.platform
-            self.repository.upsert_video_sentiment(video_sentiment)
-            score = VideoScore(
-                video_id=video.video_id,
-                platform=client.platform,
-                sentiment_score=video_sentiment.sentiment_score,
-                trend_score=video_sentiment.trend_score,
-            )
-            self.repository.upsert_video_score(score)
-
-        self.repository.log_crawl(
-            CrawlLog(
-                id=None,
-                target_type="video",
-                target_id=video.video_id,
-                status="success",
-                message=f"{len(comments)} comments ingested",
+        report = progress or (lambda message: None)
+        report("fetched video")
+
+        # 한국어 주석: 채널 번들과 같이 수집/분석을 먼저 끝낸 뒤 한 트랜잭션으로 적재합니다.
+        details = self._collect_video_details(client, [video], include_comments, max_comments)
+        report(f"fetched {len(details.comments)} comments and analyzed {len(details.video_sentiments)} videos")
+        video_sentiment = details.video_sentiments[0] if details.video_sentiments else None
+
+        with self.repository.unit_of_work():
+            self.persist_videos([video])
+            self.repository.upsert_comments(details.comments)
+            self.repository.upsert_comment_sentiments(details.comment_sentiments)
+            self.repository.upsert_video_sentiments(details.video_sentiments)
+            self.repository.upsert_video_scores(details.scores)
+            self.repository.log_crawl(
+                CrawlLog(
+                    id=None,
+                    target_type="video",
+                    target_id=video.video_id,
+                    status="success",
+                    message=f"{len(details.comments)} comments ingested",
+                )
             )
-        )
+        report("persisted")
 
         return {
             "video_id": video.video_id,
-            "comment_count": len(comments),
+            "comment_count": len(details.comments),
             "sentiment": video_sentiment.sentiment_label if video_sentiment else None,
         }
 
+    def _collect_video_details(
+        self,
+        client: PlatformClientPort,
+        videos: list[Video],
+        include_comments: bool,
+        max_comments: int,
+    ) -> _VideoDetails:
+        """
+        영상 감정 분석(OpenAI), 댓글 수집(플랫폼 API), 댓글별 감정 분석(OpenAI)을 영상 간에 겹쳐 실행한다.
+        - 플랫폼/OpenAI 호출은 각각 별도 스레드 풀(INGESTION_YOUTUBE_CONCURRENCY / INGESTION_OPENAI_CONCURRENCY)로 제한한다.
+        - 댓글 수집이 끝나는 대로 해당 댓글의 분석을 제출하므로 작업이 서로를 기다리며 막히지 않는다.
+        - 결과는 영상/댓글의 원래 순서로 모아 반환하므로 이후 DB 적재 순서는 순차 실행과 같다.
+        """
+        details = _VideoDetails()
+        if not videos or (not self.sentiment_usecase and not include_comments):
+            return details
+
+        platform_pool = ThreadPoolExecutor(max_workers=self.platform_concurrency, thread_name_prefix="ingest-platform")
+        openai_pool = ThreadPoolExecutor(max_workers=self.openai_concurrency, thread_name_prefix="ingest-openai")
+        try:
+            sentiment_futures = (
+                [openai_pool.submit(self.sentiment_usecase.analyze_video, video) for video in videos]
+                if self.sentiment_usecase
+                else []
+            )
+            comment_futures = {}
+            if include_comments:
+                # 호출자의 context(쿼터 우선순위/사용량 집계)를 플랫폼 호출 스레드로 넘긴다.
+                comment_futures = {
+                    platform_pool.submit(
+                        contextvars.copy_context().run,
+                        lambda video_id: list(client.fetch_comments(video_id, max_results=max_comments)),
+                        video.video_id,
+                    ): index
+                    for index, video in enumerate(videos)
+                }
+
+            comments_by_video: dict[int, list[VideoComment]] = {}
+            comment_sentiment_futures: dict[int, list] = {}
+            for future in as_completed(comment_futures):
+                index = comment_futures[future]
+                comments = future.result()
+                for c in comments:
+                    c.platform = client.platform
+                comments_by_video[index] = comments
+                if self.sentiment_usecase:
+                    comment_sentiment_futures[index] = [
+                        openai_pool.submit(self.sentiment_usecase.analyze_comment, c) for c in comments
+                    ]
+
+            for video, future in zip(videos, sentiment_futures):
+                sentiment = future.result()
+                sentiment.platform = client.platform
+                details.video_sentiments.append(sentiment)
+                details.scores.append(
+                    VideoScore(
+                        video_id=video.video_id,
+                        platform=client.platform,
+                        sentiment_score=sentiment.sentiment_score,
+                        trend_score=sentiment.trend_score,
+                    )
+                )
+            for index in range(len(videos)):
+                details.comments.extend(comments_by_video.get(index, []))
+                for future in comment_sentiment_futures.get(index, []):
+                    sentiment = future.result()
+                    sentiment.platform = client.platform
+                    details.comment_sentiments.append(sentiment)
+        finally:
+            # 한 작업이 실패하면 아직 시작하지 않은 호출은 취소한다.
+            platform_pool.shutdown(wait=True, cancel_futures=True)
+            openai_pool.shutdown(wait=True, cancel_futures=True)
+        return details
+
+    def fetch_channel_videos(
+        self, client: PlatformClientPort, channel_id: str, max_videos: int, channel: Channel | None = None
+    ) -> tuple[Channel, list[Video]]:
+        """채널 정보와 최근 업로드 영상(INGESTION_RECENT_DAYS 필터 적용)을 가져온다. DB 에는 쓰지 않는다."""
+        channel = channel or client.fetch_channel(channel_id)
+        channel.platform = client.platform
+
+        # 최신 업로드 필터: 기본 14일 내 업로드본만 유지(환경변수 INGESTION_RECENT_DAYS로 조정 가능)
+        recent_days = int(os.getenv("INGESTION_RECENT_DAYS", "14"))
+        # 시간대가 섞여 있을 때 naive/aware 비교 오류를 막기 위해 UTC 기준으로 통일해서 비교한다.
+        cutoff = datetime.now(timezone.utc) - timedelta(days=recent_days) if recent_days > 0 else None
+        # 해석된 채널 id(UC...)로 조회해 핸들/URL 을 다시 해석하지 않게 한다.
+        # 기준일을 클라이언트에 넘겨 목록 조회 단계에서 멈추게 하고, 오래된 영상의 메타는 받지 않는다.
+        videos = list(client.fetch_videos(channel.channel_id, max_results=max_videos, published_after=cutoff))
+        if cutoff is not None:
+            videos = [
+                v
+                for v in videos
+                if (
+                    self._to_utc(v.published_at)
+                    or self._to_utc(v.crawled_at)
+                    or cutoff
+                )
+                >= cutoff
+            ]
+        for video in videos:
+            video.platform = client.platform
+        return channel, videos
+
+    def persist_channel(self, channel: Channel) -> None:
+        # 한국어 주석: 계정/채널 단위 정보를 별도 테이블에 적재하여 팔로워/게시물 등 변동성 필드만 추적합니다.
+        self.repository.upsert_accounts(
+            [
+                CreatorAccount(
+                    account_id=channel.channel_id,
+                    platform=channel.platform,
+                    display_name=channel.title,
+                    description=channel.description,
+                    country=channel.country,
+                    follower_count=channel.subscriber_count,
+                    post_count=channel.video_count,
+                    last_updated_at=channel.crawled_at,
+                    crawled_at=channel.crawled_at,
+                )
+            ]
+        )
+        self.repository.upsert_channels([channel])
+
     def update_keyword_mapping(self, mappings: Iterable[KeywordMapping]) -> int:
-        count = 0
-        for mapping in mappings:
-            self.repository.upsert_keyword_mapping(mapping)
-            count += 1
-        return count
+        mappings = list(mappings)
+        self.repository.upsert_keyword_mappings(mappings)
+        return len(mappings)
 
-    def _persist_video(self, video: Video):
+    def persist_videos(self, videos: list[Video]) -> None:
         # 한국어 주석: 수집 시각이 비어 있으면 현재 시각으로 채워 윈도우 필터에서 제외되지 않게 합니다.
-        video.crawled_at = video.crawled_at or datetime.utcnow()
-        self.repository.upsert_video(video)
-        if not video.tags:
-            return
-        keywords = [tag.strip() for tag in video.tags.split(",") if tag.strip()]
-        for kw in keywords:
-            self.repository.upsert_keyword_mapping(
-                KeywordMapping(
-                    mapping_id=None,
-                    video_id=video.video_id,
-                    channel_id=video.channel_id,
-                    platform=video.platform,
-                    keyword=kw,
-                    weight=1.0,
-                )
+        for video in videos:
+            video.crawled_at = video.crawled_at or datetime.utcnow()
+        self.repository.upsert_videos(videos)
+        self.repository.upsert_keyword_mappings(
+            KeywordMapping(
+                mapping_id=None,
+                video_id=video.video_id,
+                channel_id=video.channel_id,
+                platform=video.platform,
+                keyword=kw,
+                weight=1.0,
             )
+            for video in videos
+            if video.tags
+            for kw in (tag.strip() for tag in video.tags.split(","))
+            if kw
+        )
 
     @staticmethod
     def _to_utc(dt: datetime | None) -> datetime | None:
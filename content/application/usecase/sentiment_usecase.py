@@ -39,23 +39,21 @@ class SentimentUseCase:
         )
 
     def analyze_comments(self, comments: Iterable[VideoComment]) -> list[CommentSentiment]:
-        sentiments: list[CommentSentiment] = []
-        for comment in comments:
-            prompt = (
-                "You are analyzing sentiment for a YouTube comment.\n"
-                "Return a JSON object with keys sentiment_label (positive|neutral|negative) "
-                "and sentiment_score (0-1 float).\n"
-                f"Comment text: {comment.content}"
-            )
-            payload = self._request_json(prompt)
-            sentiments.append(
-                CommentSentiment(
-                    comment_id=comment.comment_id,
-                    sentiment_label=payload.get("sentiment_label"),
-                    sentiment_score=float(payload.get("sentiment_score", 0.0)),
-                )
-            )
-        return sentiments
+        return [self.analyze_comment(comment) for comment in comments]
+
+    def analyze_comment(self, comment: VideoComment) -> CommentSentiment:
+        prompt = (
+            "You are analyzing sentiment for a YouTube comment.\n"
+            "Return a JSON object with keys sentiment_label (positive|neutral|negative) "
+            "and sentiment_score (0-1 float).\n"
+            f"Comment text: {comment.content}"
+        )
+        payload = self._request_json(prompt)
+        return CommentSentiment(
+            comment_id=comment.comment_id,
+            sentiment_label=payload.get("sentiment_label"),
+            sentiment_score=float(payload.get("sentiment_score", 0.0)),
+        )
 
     def _request_json(self, prompt: str) -> dict:
         response = self.client.chat.completions.create(
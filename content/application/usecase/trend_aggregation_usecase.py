@@ -1,6 +1,7 @@
 import os
+import time
 from collections import defaultdict
-from datetime import date, timedelta
+from datetime import date, datetime, timedelta
 from typing import Iterable, Optional
 
 from sqlalchemy import text
@@ -10,6 +11,144 @@ from content.domain.category_trend import CategoryTrend
 from content.domain.keyword_trend import KeywordTrend
 from config.database.session import SessionLocal
 
+# YouTube category_id 를 사람이 읽을 수 있는 카테고리명으로 변환하는 SQL 식 (video v 별칭 기준)
+YOUTUBE_CATEGORY_NAME_SQL = """CASE v.category_id
+    WHEN 1 THEN 'Film & Animation'
+    WHEN 2 THEN 'Autos & Vehicles'
+    WHEN 10 THEN 'Music'
+    WHEN 15 THEN 'Pets & Animals'
+    WHEN 17 THEN 'Sports'
+    WHEN 19 THEN 'Travel & Events'
+    WHEN 20 THEN 'Gaming'
+    WHEN 22 THEN 'People & Blogs'
+    WHEN 23 THEN 'Comedy'
+    WHEN 24 THEN 'Entertainment'
+    WHEN 25 THEN 'News'
+    WHEN 26 THEN 'Howto & Style'
+    WHEN 27 THEN 'Education'
+    WHEN 28 THEN 'Science & Technology'
+    WHEN 29 THEN 'Nonprofits & Activism'
+    ELSE 'uncategorized'
+END"""
+
+
+# 키워드/카테고리 집계가 공통으로 사용하는 영상 단위 소스 (group_key 기준으로 묶는다)
+# 기간 필터는 activity_date(= 게시일, 없으면 수집일; video 의 생성 컬럼)로 걸어 인덱스 범위 스캔이 되게 한다.
+_SOURCE_COLUMNS_SQL = """
+    v.video_id,
+    v.platform,
+    v.view_count,
+    v.like_count,
+    v.comment_count,
+    v.published_at,
+    v.crawled_at,
+    v.activity_date,
+    vs.sentiment_score,
+    vs.trend_score,
+    sc.total_score
+"""
+
+KEYWORD_SOURCE_SQL = """
+    SELECT
+        km.keyword AS group_key,{columns}
+    FROM keyword_mapping km
+    JOIN video v ON v.video_id = km.video_id
+    LEFT JOIN video_sentiment vs ON vs.video_id = v.video_id
+    LEFT JOIN video_score sc ON sc.video_id = v.video_id
+""".format(columns=_SOURCE_COLUMNS_SQL)
+
+CATEGORY_SOURCE_SQL = """
+    SELECT
+        COALESCE(vs.category, {category_name_sql}) AS group_key,{columns}
+    FROM video v
+    LEFT JOIN video_sentiment vs ON vs.video_id = v.video_id
+    LEFT JOIN video_score sc ON sc.video_id = v.video_id
+""".format(category_name_sql=YOUTUBE_CATEGORY_NAME_SQL, columns=_SOURCE_COLUMNS_SQL)
+
+# 워터마크(:since) 이후 upsert(crawled_at), 재스냅샷(captured_at), 재분석(감정/점수) 또는 키워드 재매핑된
+# 영상 조건 (video v 별칭 기준). 카테고리/키워드/점수가 바뀌는 분석 갱신도 트렌드 값을 바꾸므로 변경으로 본다.
+_CHANGED_SINCE_SQL = """
+    v.crawled_at > :since
+    OR EXISTS (
+        SELECT 1
+        FROM video_metrics_snapshot s
+        WHERE s.video_id = v.video_id
+          AND s.platform = v.platform
+          AND s.captured_at > :since
+    )
+    OR EXISTS (
+        SELECT 1 FROM video_sentiment cvs WHERE cvs.video_id = v.video_id AND cvs.analyzed_at > :since
+    )
+    OR EXISTS (
+        SELECT 1 FROM video_score csc WHERE csc.video_id = v.video_id AND csc.updated_at > :since
+    )
+    OR EXISTS (
+        SELECT 1 FROM keyword_mapping ckm WHERE ckm.video_id = v.video_id AND ckm.updated_at > :since
+    )
+"""
+
+# 일별 팩트 재적재 대상 조건 (video v 별칭 기준). 팩트는 각 일자를 그 날짜 기준(as_of = activity_date)으로 측정하므로,
+# 게시일 이후에 찍힌 스냅샷이나 재수집은 값을 바꾸지 않는다. 게시일 이전 스냅샷이 없어 수집값으로 대신하는 영상의
+# 재수집, 게시일 이전 스냅샷 추가, 재분석/키워드 재매핑만 팩트를 바꾼다.
+_FACT_CHANGED_SINCE_SQL = """
+    (
+        v.crawled_at > :since
+        AND NOT EXISTS (
+            SELECT 1
+            FROM video_metrics_snapshot s
+            WHERE s.video_id = v.video_id
+              AND s.platform = v.platform
+              AND s.snapshot_date <= v.activity_date
+        )
+    )
+    OR EXISTS (
+        SELECT 1
+        FROM video_metrics_snapshot s
+        WHERE s.video_id = v.video_id
+          AND s.platform = v.platform
+          AND s.snapshot_date <= v.activity_date
+          AND s.captured_at > :since
+    )
+    OR EXISTS (
+        SELECT 1 FROM video_sentiment cvs WHERE cvs.video_id = v.video_id AND cvs.analyzed_at > :since
+    )
+    OR EXISTS (
+        SELECT 1 FROM video_score csc WHERE csc.video_id = v.video_id AND csc.updated_at > :since
+    )
+    OR EXISTS (
+        SELECT 1 FROM keyword_mapping ckm WHERE ckm.video_id = v.video_id AND ckm.updated_at > :since
+    )
+"""
+
+# facts 모드 검증(verify_facts_mode)에서 single_pass 결과와 값이 같아야 하는 필드 (측정 시점과 무관한 값).
+_FACT_EXACT_FIELDS = (
+    "video_count",
+    "video_count_prev",
+    "avg_sentiment",
+    "avg_trend",
+    "avg_total_score",
+)
+
+# 팩트는 일자별 측정값(as_of = activity_date), single_pass 는 윈도우 기준일 측정값이라 설계상 다른 필드.
+# 검증에서는 차이(최대 상대 오차)만 보고한다. rank 는 이 값들에 따라 달라지므로 비교하지 않는다.
+_FACT_MEASURED_FIELDS = (
+    "search_volume",
+    "search_volume_prev",
+    "view_velocity",
+    "like_velocity",
+    "comment_velocity",
+    "growth_rate",
+)
+
+# 일별 팩트 적재(refresh_daily_facts)의 trend_watermark job_name
+DAILY_FACT_JOB = "daily_facts"
+
+# 일별 팩트 테이블 구성: (팩트 테이블, 키 컬럼, 소스 SQL)
+DAILY_FACT_TABLES = (
+    ("keyword_daily_fact", "keyword", KEYWORD_SOURCE_SQL),
+    ("category_daily_fact", "category", CATEGORY_SOURCE_SQL),
+)
+
 
 class TrendAggregationUseCase:
     def __init__(self, repository: ContentRepositoryPort, session_factory=SessionLocal):
@@ -23,9 +162,22 @@ class TrendAggregationUseCase:
         velocity_days: Optional[int] = None,
         platform: str | None = None,
         surge_growth_threshold: float | None = None,
+        mode: str | None = None,
+        refresh_velocity: bool = True,
+        incremental: bool | None = None,
     ) -> dict:
         """
         - as_of: 기준 일자 (default: 오늘)
+        - mode: single_pass(기본, 현재/이전 윈도우 1회 스캔) | legacy(윈도우별 개별 스캔)
+          | facts(저장된 일별 팩트의 범위 합). 미지정 시 TREND_AGGREGATION_MODE 환경변수를 따른다.
+          facts 모드는 팩트를 적재하지 않고 읽기만 한다(적재는 refresh_daily_facts). 팩트는 각 일자를 그 날짜
+          기준으로 측정하므로 search_volume/속도/성장률은 윈도우 기준일로 측정하는 single_pass 와 다르다(근사치).
+        - refresh_velocity: video_velocity 단계를 먼저 갱신할지 여부
+          (배치에서 이미 refresh_video_velocity 를 실행했다면 False). facts 모드는 트렌딩 영상 선정용
+          현재 윈도우만 갱신한다.
+        - incremental: 마지막 성공 집계(trend_watermark) 이후 upsert/재스냅샷/재분석된 영상이 건드린
+          키워드/카테고리(지난 집계 때 기여한 키 포함, trend_video_key)만 재계산한다. 변경이 없으면 집계를 건너뛴다. 기준일/윈도우가 바뀌었거나
+          워터마크가 없으면 전체 집계로 동작한다. 미지정 시 TREND_INCREMENTAL 환경변수를 따른다.
         """
         as_of = as_of or date.today()
         from_date = as_of - timedelta(days=window_days - 1)
@@ -33,10 +185,7 @@ class TrendAggregationUseCase:
         prev_from = prev_to - timedelta(days=window_days - 1)
 
         if velocity_days is None:
-            try:
-                velocity_days = int(os.getenv("TREND_VELOCITY_DAYS", "3"))
-            except ValueError:
-                velocity_days = 3
+            velocity_days = self._default_velocity_days()
 
         surge_threshold = surge_growth_threshold
         if surge_threshold is None:
@@ -45,11 +194,77 @@ class TrendAggregationUseCase:
             except ValueError:
                 surge_threshold = 1.0
 
+        if mode is None:
+            mode = os.getenv("TREND_AGGREGATION_MODE", "single_pass").lower()
+        if incremental is None:
+            incremental = os.getenv("TREND_INCREMENTAL", "false").lower() == "true"
+        # legacy/facts 모드는 키 단위 부분 집계를 지원하지 않으므로 항상 전체 집계한다.
+        incremental = incremental and mode not in ("legacy", "facts")
+
+        with self.session_factory() as db:
+            run_started_at = self._db_utc_now(db)
+            watermark = self._load_watermark(db, platform) if incremental else None
+
+        changed_video_ids: list[str] | None = None
+        if (
+            watermark
+            and watermark["as_of"] == as_of
+            and watermark["window_days"] == window_days
+            and watermark["velocity_days"] == velocity_days
+        ):
+            since = watermark["watermark"]
+            if not self._has_new_data(as_of, prev_from, platform, since=since):
+                print(f"[TREND-AGG] no changes since {since} | as_of={as_of}, platform={platform}")
+                return {
+                    "as_of": str(as_of),
+                    "skipped": True,
+                    "incremental": True,
+                    "changed_video_count": 0,
+                    "keyword_trend_count": 0,
+                    "category_trend_count": 0,
+                    "surging_keywords": [],
+                    "surging_categories": [],
+                    "top_trending_videos": [],
+                }
+            with self.session_factory() as db:
+                changed_video_ids = self._fetch_changed_video_ids(db, prev_from, as_of, platform, since)
+        is_incremental_run = changed_video_ids is not None
+
         with self.session_factory() as db:
-            keyword_rows = self._aggregate_keywords(db, from_date, as_of, platform, velocity_days)
-            keyword_prev_rows = self._aggregate_keywords(db, prev_from, prev_to, platform, velocity_days)
-            category_rows = self._aggregate_categories(db, from_date, as_of, platform, velocity_days)
-            category_prev_rows = self._aggregate_categories(db, prev_from, prev_to, platform, velocity_days)
+            if mode == "legacy":
+                keyword_rows = self._aggregate_keywords(db, from_date, as_of, platform, velocity_days)
+                keyword_prev_rows = self._aggregate_keywords(db, prev_from, prev_to, platform, velocity_days)
+                category_rows = self._aggregate_categories(db, from_date, as_of, platform, velocity_days)
+                category_prev_rows = self._aggregate_categories(db, prev_from, prev_to, platform, velocity_days)
+            elif mode == "facts":
+                # 트렌딩 영상 선정이 읽는 현재 윈도우 video_velocity 만 갱신하고, 집계는 저장된 팩트만 읽는다.
+                if refresh_velocity:
+                    self._refresh_video_velocity(db, as_of, velocity_days, from_date, platform)
+                keyword_ranked = self._aggregate_from_facts(
+                    db, "keyword_daily_fact", "keyword", as_of, [window_days], platform
+                )
+                category_ranked = self._aggregate_from_facts(
+                    db, "category_daily_fact", "category", as_of, [window_days], platform
+                )
+            else:
+                if refresh_velocity:
+                    self._refresh_video_velocity(
+                        db, as_of, velocity_days, from_date, platform, video_ids=changed_video_ids
+                    )
+                    self._refresh_video_velocity(
+                        db, prev_to, velocity_days, prev_from, platform, video_ids=changed_video_ids
+                    )
+                keyword_keys = category_keys = None
+                if is_incremental_run:
+                    keyword_keys = self._fetch_touched_keywords(db, changed_video_ids)
+                    category_keys = self._fetch_touched_categories(db, changed_video_ids)
+                # 현재/이전 윈도우를 한 번의 스캔으로 집계하고 성장률/랭킹까지 SQL에서 계산한다.
+                keyword_ranked = self._aggregate_keywords_single_pass(
+                    db, prev_from, from_date, as_of, platform, velocity_days, group_keys=keyword_keys
+                )
+                category_ranked = self._aggregate_categories_single_pass(
+                    db, prev_from, from_date, as_of, platform, velocity_days, group_keys=category_keys
+                )
             top_trending_videos = self._select_trending_videos(
                 db=db,
                 from_date=from_date,
@@ -57,16 +272,18 @@ class TrendAggregationUseCase:
                 platform=platform,
                 velocity_days=velocity_days,
                 limit=int(os.getenv("TREND_TOP_ANALYSIS_LIMIT", "30")),
+                use_velocity_table=mode != "legacy",
             )
 
-        keyword_rows = self._attach_growth(keyword_rows, keyword_prev_rows, key_fields=("keyword", "platform"))
-        category_rows = self._attach_growth(category_rows, category_prev_rows, key_fields=("category", "platform"))
+        if mode == "legacy":
+            keyword_rows = self._attach_growth(keyword_rows, keyword_prev_rows, key_fields=("keyword", "platform"))
+            category_rows = self._attach_growth(category_rows, category_prev_rows, key_fields=("category", "platform"))
 
-        keyword_ranked = self._apply_rank(keyword_rows)
-        category_ranked = self._apply_rank(category_rows)
+            keyword_ranked = self._apply_rank(keyword_rows)
+            category_ranked = self._apply_rank(category_rows)
 
-        for row in keyword_ranked:
-            trend = KeywordTrend(
+        keyword_trends = [
+            KeywordTrend(
                 keyword=row["keyword"],
                 date=as_of,
                 platform=row["platform"],
@@ -79,11 +296,12 @@ class TrendAggregationUseCase:
                 avg_total_score=row["avg_total_score"],
                 growth_rate=row.get("growth_rate"),
                 rank=row["rank"],
+                view_velocity=row.get("view_velocity"),
             )
-            self.repository.upsert_keyword_trend(trend)
-
-        for row in category_ranked:
-            trend = CategoryTrend(
+            for row in keyword_ranked
+        ]
+        category_trends = [
+            CategoryTrend(
                 category=row["category"],
                 date=as_of,
                 platform=row["platform"],
@@ -96,8 +314,30 @@ class TrendAggregationUseCase:
                 search_volume_prev=row.get("search_volume_prev"),
                 growth_rate=row.get("growth_rate"),
                 rank=row["rank"],
+                view_velocity=row.get("view_velocity"),
             )
-            self.repository.upsert_category_trend(trend)
+            for row in category_ranked
+        ]
+        # 행 단위 upsert(조회+commit) 대신 테이블별 한 트랜잭션의 multi-row upsert 로 적재한다.
+        write_stats = [
+            self.repository.bulk_upsert_keyword_trends(keyword_trends),
+            self.repository.bulk_upsert_category_trends(category_trends),
+        ]
+        print("[TREND-AGG] trend rows written:", write_stats)
+
+        with self.session_factory() as db:
+            if is_incremental_run:
+                # 재계산한 키 중 영상이 모두 빠져 결과에 없는 키(예: 이전 카테고리)의 저장된 행을 지운다.
+                self._delete_emptied_trends(db, "keyword_trend", "keyword", as_of, platform, keyword_keys, keyword_ranked)
+                self._delete_emptied_trends(
+                    db, "category_trend", "category", as_of, platform, category_keys, category_ranked
+                )
+                # 부분 재계산된 행의 rank 는 부분 집합 기준이므로, 저장된 전체 행으로 플랫폼별 랭킹을 다시 매긴다.
+                self._rerank_trends(db, as_of, platform)
+            if incremental:
+                # 다음 증분 집계가 변경 영상의 이전 키를 알 수 있도록 영상별 기여 키를 기록한다(전체 집계면 재구축).
+                self._save_video_keys(db, prev_from, as_of, platform, video_ids=changed_video_ids)
+            self._save_watermark(db, platform, as_of, window_days, velocity_days, run_started_at)
 
         surging_keywords = [
             row
@@ -112,13 +352,603 @@ class TrendAggregationUseCase:
 
         return {
             "as_of": str(as_of),
+            "skipped": False,
+            "incremental": is_incremental_run,
+            "changed_video_count": len(changed_video_ids) if is_incremental_run else None,
             "keyword_trend_count": len(keyword_ranked),
             "category_trend_count": len(category_ranked),
             "surging_keywords": surging_keywords,
             "surging_categories": surging_categories,
             "top_trending_videos": top_trending_videos,
+            "write_stats": write_stats,
+        }
+
+    def backfill(
+        self,
+        from_date: date,
+        to_date: date,
+        window_days: int = 7,
+        velocity_days: Optional[int] = None,
+        platform: str | None = None,
+        chunk_days: Optional[int] = None,
+    ) -> dict:
+        """
+        from_date ~ to_date 의 모든 as_of 일자에 대해 keyword_trend / category_trend 를 집합 연산으로 재계산한다.
+        - generate_series 로 만든 as_of 목록을 영상/스냅샷과 조인해 일자 × 키 단위로 한 번에 집계하고,
+          INSERT ... SELECT ... ON CONFLICT 로 바로 저장한다(일자별 aggregate() 반복 호출 없음).
+        - chunk_days(기본 TREND_BACKFILL_CHUNK_DAYS=30) 단위로 나눠 커밋해 트랜잭션 크기를 제한한다.
+        - 각 일자의 집계 기준(스냅샷 시점, 성장률, 랭킹)은 aggregate() 와 동일하다.
+        """
+        if from_date > to_date:
+            raise ValueError("from_date must be on or before to_date")
+        if velocity_days is None:
+            velocity_days = self._default_velocity_days()
+        if chunk_days is None:
+            chunk_days = max(int(os.getenv("TREND_BACKFILL_CHUNK_DAYS", "30")), 1)
+
+        started = time.perf_counter()
+        written = {"keyword_trend": 0, "category_trend": 0}
+        chunk_start = from_date
+        with self.session_factory() as db:
+            while chunk_start <= to_date:
+                chunk_end = min(chunk_start + timedelta(days=chunk_days - 1), to_date)
+                for table, key_column, source_sql in (
+                    ("keyword_trend", "keyword", KEYWORD_SOURCE_SQL),
+                    ("category_trend", "category", CATEGORY_SOURCE_SQL),
+                ):
+                    written[table] += self._backfill_trend_table(
+                        db, table, key_column, source_sql, chunk_start, chunk_end, window_days, velocity_days, platform
+                    )
+                db.commit()
+                print(f"[TREND-BACKFILL] {chunk_start} ~ {chunk_end} done | rows={written}")
+                chunk_start = chunk_end + timedelta(days=1)
+
+        return {
+            "from_date": str(from_date),
+            "to_date": str(to_date),
+            "days": (to_date - from_date).days + 1,
+            "window_days": window_days,
+            "velocity_days": velocity_days,
+            "rows": written,
+            "elapsed_ms": round((time.perf_counter() - started) * 1000, 1),
+        }
+
+    def _backfill_trend_table(
+        self,
+        db,
+        table: str,
+        key_column: str,
+        source_sql: str,
+        start: date,
+        end: date,
+        window_days: int,
+        velocity_days: int,
+        platform: str | None,
+    ) -> int:
+        rows = db.execute(
+            text(
+                """
+                WITH days AS (
+                    SELECT d::date AS as_of
+                    FROM generate_series(CAST(:start AS date), CAST(:end AS date), interval '1 day') AS d
+                ),
+                src AS (
+                    {source_sql}
+                ),
+                base AS (
+                    SELECT
+                        days.as_of,
+                        src.group_key,
+                        src.platform,
+                        src.video_id,
+                        src.activity_date > days.as_of - :window_days AS is_current,
+                        COALESCE(curr.view_count, src.view_count, 0) AS view_count,
+                        GREATEST(COALESCE(curr.view_count, src.view_count, 0) - COALESCE(anchor.view_count, 0), 0) AS view_delta,
+                        src.sentiment_score,
+                        src.trend_score,
+                        src.total_score
+                    FROM days
+                    JOIN src
+                      ON src.activity_date
+                         BETWEEN days.as_of - (2 * :window_days - 1) AND days.as_of
+                    LEFT JOIN LATERAL (
+                        SELECT s.view_count
+                        FROM video_metrics_snapshot s
+                        WHERE s.video_id = src.video_id
+                          AND s.platform = src.platform
+                          AND s.snapshot_date <= CASE
+                                WHEN src.activity_date > days.as_of - :window_days
+                                    THEN days.as_of
+                                ELSE days.as_of - :window_days
+                              END
+                        ORDER BY s.snapshot_date DESC
+                        LIMIT 1
+                    ) curr ON true
+                    LEFT JOIN LATERAL (
+                        SELECT s.view_count
+                        FROM video_metrics_snapshot s
+                        WHERE s.video_id = src.video_id
+                          AND s.platform = src.platform
+                          AND s.snapshot_date <= days.as_of - :velocity_days
+                          AND src.activity_date > days.as_of - :window_days
+                        ORDER BY s.snapshot_date DESC
+                        LIMIT 1
+                    ) anchor ON true
+                    WHERE (:platform IS NULL OR src.platform = :platform)
+                ),
+                agg AS (
+                    SELECT
+                        as_of,
+                        group_key,
+                        platform,
+                        COUNT(DISTINCT video_id) FILTER (WHERE is_current) AS video_count,
+                        COUNT(DISTINCT video_id) FILTER (WHERE NOT is_current) AS video_count_prev,
+                        COALESCE(SUM(view_count) FILTER (WHERE is_current), 0) AS search_volume,
+                        COALESCE(SUM(view_count) FILTER (WHERE NOT is_current), 0) AS search_volume_prev,
+                        SUM(view_delta) FILTER (WHERE is_current)::numeric / :velocity_days AS view_velocity,
+                        AVG(COALESCE(sentiment_score, 0)) FILTER (WHERE is_current) AS avg_sentiment,
+                        AVG(COALESCE(trend_score, 0)) FILTER (WHERE is_current) AS avg_trend,
+                        AVG(COALESCE(total_score, 0)) FILTER (WHERE is_current) AS avg_total_score
+                    FROM base
+                    GROUP BY as_of, group_key, platform
+                )
+                INSERT INTO {table} (
+                    {key_column}, date, platform, search_volume, search_volume_prev, video_count, video_count_prev,
+                    avg_sentiment, avg_trend, avg_total_score, growth_rate, rank, view_velocity
+                )
+                SELECT
+                    group_key,
+                    as_of,
+                    platform,
+                    search_volume,
+                    search_volume_prev,
+                    video_count,
+                    video_count_prev,
+                    avg_sentiment,
+                    avg_trend,
+                    avg_total_score,
+                    CASE
+                        WHEN search_volume = 0 AND search_volume_prev = 0 THEN 0
+                        ELSE (search_volume - search_volume_prev)::numeric / GREATEST(search_volume_prev, 1)
+                    END,
+                    ROW_NUMBER() OVER (
+                        PARTITION BY as_of, platform
+                        ORDER BY view_velocity DESC NULLS LAST, search_volume DESC
+                    ),
+                    view_velocity
+                FROM agg
+                WHERE video_count > 0
+                ON CONFLICT ({key_column}, date, platform)
+                DO UPDATE SET
+                    search_volume = EXCLUDED.search_volume,
+                    search_volume_prev = EXCLUDED.search_volume_prev,
+                    video_count = EXCLUDED.video_count,
+                    video_count_prev = EXCLUDED.video_count_prev,
+                    avg_sentiment = EXCLUDED.avg_sentiment,
+                    avg_trend = EXCLUDED.avg_trend,
+                    avg_total_score = EXCLUDED.avg_total_score,
+                    growth_rate = EXCLUDED.growth_rate,
+                    rank = EXCLUDED.rank,
+                    view_velocity = EXCLUDED.view_velocity
+                """.format(table=table, key_column=key_column, source_sql=source_sql)
+            ),
+            {
+                "start": start,
+                "end": end,
+                "window_days": window_days,
+                "velocity_days": velocity_days,
+                "platform": platform,
+            },
+        )
+        return rows.rowcount or 0
+
+    def refresh_video_velocity(
+        self,
+        as_of: Optional[date] = None,
+        window_days: int = 7,
+        velocity_days: Optional[int] = None,
+        platform: str | None = None,
+    ) -> dict:
+        """
+        트렌드 배치의 video_velocity 단계.
+        현재/이전 윈도우에 속한 영상별 현재·기준점 지표와 속도를 (as_of, velocity_days) 단위로 한 번만 계산해 저장한다.
+        키워드/카테고리 집계와 트렌딩 영상 선정은 모두 이 테이블을 조인한다.
+        """
+        as_of = as_of or date.today()
+        if velocity_days is None:
+            velocity_days = self._default_velocity_days()
+        from_date = as_of - timedelta(days=window_days - 1)
+        prev_to = as_of - timedelta(days=window_days)
+        prev_from = prev_to - timedelta(days=window_days - 1)
+
+        with self.session_factory() as db:
+            current_count = self._refresh_video_velocity(db, as_of, velocity_days, from_date, platform)
+            prev_count = self._refresh_video_velocity(db, prev_to, velocity_days, prev_from, platform)
+        return {
+            "as_of": str(as_of),
+            "velocity_days": velocity_days,
+            "current_window_videos": current_count,
+            "prev_window_videos": prev_count,
         }
 
+    def refresh_daily_facts(
+        self,
+        as_of: Optional[date] = None,
+        days: Optional[int] = None,
+        velocity_days: Optional[int] = None,
+        platform: str | None = None,
+    ) -> dict:
+        """
+        트렌드 배치의 일별 팩트 단계. 최근 days 일과, 지난 팩트 적재 이후 팩트 값이 바뀌는 변경(게시일 이전 스냅샷,
+        스냅샷 없는 영상의 수집, 재분석/재매핑)이 생긴 게시일(activity_date)의 팩트만 다시 적재한다.
+        - days: as_of 를 포함해 항상 재적재할 최근 일수 (기본 TREND_FACT_REFRESH_DAYS=1, 즉 새 일자만 추가)
+        팩트 행의 지표/속도는 항상 그 일자 기준(video_velocity 의 as_of = activity_date)으로 측정한다.
+        언제 어떤 실행이 적재했는지와 무관하게 값이 같으므로, 어떤 기간이든 팩트의 단순 범위 합으로 계산된다.
+        """
+        as_of = as_of or date.today()
+        days = days or self._default_fact_refresh_days()
+        if velocity_days is None:
+            velocity_days = self._default_velocity_days()
+        from_date = as_of - timedelta(days=days - 1)
+        fact_dates = [from_date + timedelta(days=offset) for offset in range(days)]
+        with self.session_factory() as db:
+            run_started_at = self._db_utc_now(db)
+            watermark = self._load_watermark(db, platform, job_name=DAILY_FACT_JOB)
+            if watermark:
+                fact_dates += self._fetch_changed_activity_dates(
+                    db, from_date, as_of, platform, watermark["watermark"]
+                )
+            result = self._refresh_daily_facts(db, fact_dates, velocity_days, platform)
+            self._save_watermark(
+                db, platform, as_of, days, velocity_days, run_started_at, job_name=DAILY_FACT_JOB
+            )
+        return result
+
+    def aggregate_windows(
+        self,
+        as_of: Optional[date] = None,
+        windows: Iterable[int] = (1, 7, 30),
+        platform: str | None = None,
+        limit: int | None = 20,
+    ) -> dict:
+        """
+        일별 팩트 테이블만 읽어 여러 기간(기본 1/7/30일)의 키워드/카테고리 트렌드를 한 번에 계산한다.
+        각 기간은 직전 동일 길이 기간 대비 성장률과 플랫폼별 랭킹을 포함하며, 결과는 저장하지 않는다.
+        """
+        as_of = as_of or date.today()
+        windows = sorted({int(w) for w in windows if int(w) > 0})
+        if not windows:
+            return {"as_of": str(as_of), "windows": {}}
+        with self.session_factory() as db:
+            keyword_rows = self._aggregate_from_facts(
+                db, "keyword_daily_fact", "keyword", as_of, windows, platform, limit
+            )
+            category_rows = self._aggregate_from_facts(
+                db, "category_daily_fact", "category", as_of, windows, platform, limit
+            )
+
+        result: dict = {"as_of": str(as_of), "windows": {}}
+        for window_days in windows:
+            result["windows"][str(window_days)] = {
+                "keywords": [r for r in keyword_rows if r["window_days"] == window_days],
+                "categories": [r for r in category_rows if r["window_days"] == window_days],
+            }
+        return result
+
+    def verify_facts_mode(
+        self,
+        as_of: Optional[date] = None,
+        window_days: int = 7,
+        velocity_days: Optional[int] = None,
+        platform: str | None = None,
+        tolerance: float = 1e-6,
+    ) -> dict:
+        """
+        저장된 팩트로 계산한 facts 집계와 single_pass 집계를 키(키워드/카테고리, 플랫폼)별로 비교한다. 읽기 전용이다.
+        - 측정 시점과 무관한 필드(_FACT_EXACT_FIELDS)가 다르거나 한쪽에만 있는 키는 불일치로 본다
+          (팩트 적재가 늦었거나 누락된 경우).
+        - 측정 시점이 다른 필드(_FACT_MEASURED_FIELDS)는 필드별 최대 상대 오차만 보고한다.
+        single_pass 쪽은 저장된 video_velocity(as_of, as_of - window_days) 를 그대로 읽는다.
+        """
+        as_of = as_of or date.today()
+        if velocity_days is None:
+            velocity_days = self._default_velocity_days()
+        from_date = as_of - timedelta(days=window_days - 1)
+        prev_to = as_of - timedelta(days=window_days)
+        prev_from = prev_to - timedelta(days=window_days - 1)
+
+        result: dict = {"as_of": str(as_of), "window_days": window_days, "platform": platform}
+        with self.session_factory() as db:
+            for key_field, fact_table, single_pass in (
+                ("keyword", "keyword_daily_fact", self._aggregate_keywords_single_pass),
+                ("category", "category_daily_fact", self._aggregate_categories_single_pass),
+            ):
+                expected = single_pass(db, prev_from, from_date, as_of, platform, velocity_days)
+                actual = self._aggregate_from_facts(db, fact_table, key_field, as_of, [window_days], platform)
+                result[key_field] = self._compare_trend_rows(expected, actual, key_field, tolerance)
+        result["matched"] = not result["keyword"]["mismatches"] and not result["category"]["mismatches"]
+        print(
+            f"[TREND-AGG] facts vs single_pass | as_of={as_of}, window_days={window_days}, "
+            f"matched={result['matched']}, keyword_mismatches={len(result['keyword']['mismatches'])}, "
+            f"category_mismatches={len(result['category']['mismatches'])}"
+        )
+        return result
+
+    @staticmethod
+    def _compare_trend_rows(expected: list[dict], actual: list[dict], key_field: str, tolerance: float) -> dict:
+        def relative_diff(a: float, b: float) -> float:
+            return abs(a - b) / max(1.0, abs(a), abs(b))
+
+        expected_by_key = {(r[key_field], r["platform"]): r for r in expected}
+        actual_by_key = {(r[key_field], r["platform"]): r for r in actual}
+        mismatches: list[dict] = []
+        drift = {field: 0.0 for field in _FACT_MEASURED_FIELDS}
+        for key in sorted(expected_by_key.keys() | actual_by_key.keys(), key=str):
+            single_pass_row, facts_row = expected_by_key.get(key), actual_by_key.get(key)
+            if single_pass_row is None or facts_row is None:
+                mismatches.append({"key": list(key), "single_pass": single_pass_row, "facts": facts_row})
+                continue
+            fields = {
+                field: {"single_pass": single_pass_row[field], "facts": facts_row[field]}
+                for field in _FACT_EXACT_FIELDS
+                if relative_diff(single_pass_row[field], facts_row[field]) > tolerance
+            }
+            if fields:
+                mismatches.append({"key": list(key), "fields": fields})
+            for field in _FACT_MEASURED_FIELDS:
+                drift[field] = max(drift[field], relative_diff(single_pass_row[field], facts_row[field]))
+        return {"rows": len(expected_by_key), "mismatches": mismatches, "max_relative_drift": drift}
+
+    def _refresh_daily_facts(self, db, fact_dates: list[date], velocity_days: int, platform: str | None) -> dict:
+        """
+        fact_dates 일자의 팩트를 지우고 영상 단위 소스 + video_velocity 로 다시 채운다.
+        각 일자의 영상은 그 일자를 기준일로 한 video_velocity(as_of = activity_date) 로 측정하며,
+        필요한 video_velocity 행은 일자별로 먼저 갱신한다(해당 일자 게시 영상만이라 범위가 작다).
+        """
+        fact_dates = sorted(set(fact_dates))
+        for fact_date in fact_dates:
+            self._refresh_video_velocity(db, fact_date, velocity_days, fact_date, platform)
+
+        params = {"fact_dates": fact_dates, "velocity_days": velocity_days, "platform": platform}
+        counts: dict[str, int] = {}
+        for fact_table, key_column, source_sql in DAILY_FACT_TABLES:
+            db.execute(
+                text(
+                    """
+                    DELETE FROM {fact_table}
+                    WHERE date = ANY(CAST(:fact_dates AS date[]))
+                      AND (:platform IS NULL OR platform = :platform)
+                    """.format(fact_table=fact_table)
+                ),
+                params,
+            )
+            result = db.execute(
+                text(
+                    """
+                    INSERT INTO {fact_table} (
+                        date, platform, {key_column}, video_count,
+                        view_sum, like_sum, comment_sum,
+                        view_velocity_sum, like_velocity_sum, comment_velocity_sum,
+                        sentiment_sum, trend_sum, total_score_sum, computed_at
+                    )
+                    SELECT
+                        src.activity_date AS fact_date,
+                        src.platform,
+                        src.group_key,
+                        COUNT(DISTINCT src.video_id),
+                        SUM(COALESCE(vv.view_count, src.view_count, 0)),
+                        SUM(COALESCE(vv.like_count, src.like_count, 0)),
+                        SUM(COALESCE(vv.comment_count, src.comment_count, 0)),
+                        SUM(GREATEST(COALESCE(vv.view_velocity, 0), 0)),
+                        SUM(GREATEST(COALESCE(vv.like_velocity, 0), 0)),
+                        SUM(GREATEST(COALESCE(vv.comment_velocity, 0), 0)),
+                        SUM(COALESCE(src.sentiment_score, 0)),
+                        SUM(COALESCE(src.trend_score, 0)),
+                        SUM(COALESCE(src.total_score, 0)),
+                        NOW()
+                    FROM ({source_sql}) src
+                    LEFT JOIN video_velocity vv
+                      ON vv.video_id = src.video_id
+                     AND vv.platform = src.platform
+                     AND vv.as_of = src.activity_date
+                     AND vv.velocity_days = :velocity_days
+                    WHERE src.activity_date = ANY(CAST(:fact_dates AS date[]))
+                      AND (:platform IS NULL OR src.platform = :platform)
+                    GROUP BY fact_date, src.platform, src.group_key
+                    """.format(fact_table=fact_table, key_column=key_column, source_sql=source_sql)
+                ),
+                params,
+            )
+            counts[fact_table] = result.rowcount or 0
+        db.commit()
+        return {"dates": [str(d) for d in fact_dates], "rows": counts}
+
+    def _aggregate_from_facts(
+        self,
+        db,
+        fact_table: str,
+        key_field: str,
+        as_of: date,
+        windows: list[int],
+        platform: str | None,
+        limit: int | None = None,
+    ) -> list[dict]:
+        """
+        팩트 테이블의 (as_of - 2N, as_of] 범위를 한 번 읽어 기간별 현재/이전 합계, 성장률, 랭킹을 계산한다.
+        limit 이 주어지면 기간·플랫폼별 상위 limit 개만 반환한다.
+        """
+        limit_sql = "WHERE rank <= :limit" if limit else ""
+        rows = db.execute(
+            text(
+                """
+                WITH w AS (
+                    SELECT unnest(CAST(:windows AS int[])) AS window_days
+                ),
+                agg AS (
+                    SELECT
+                        w.window_days,
+                        f.{key_field} AS group_key,
+                        f.platform,
+                        COALESCE(SUM(f.video_count) FILTER (WHERE f.date > CAST(:as_of AS date) - w.window_days), 0) AS video_count,
+                        COALESCE(SUM(f.video_count) FILTER (WHERE f.date <= CAST(:as_of AS date) - w.window_days), 0) AS video_count_prev,
+                        COALESCE(SUM(f.view_sum) FILTER (WHERE f.date > CAST(:as_of AS date) - w.window_days), 0) AS search_volume,
+                        COALESCE(SUM(f.view_sum) FILTER (WHERE f.date <= CAST(:as_of AS date) - w.window_days), 0) AS search_volume_prev,
+                        SUM(f.view_velocity_sum) FILTER (WHERE f.date > CAST(:as_of AS date) - w.window_days) AS view_velocity,
+                        SUM(f.like_velocity_sum) FILTER (WHERE f.date > CAST(:as_of AS date) - w.window_days) AS like_velocity,
+                        SUM(f.comment_velocity_sum) FILTER (WHERE f.date > CAST(:as_of AS date) - w.window_days) AS comment_velocity,
+                        SUM(f.sentiment_sum) FILTER (WHERE f.date > CAST(:as_of AS date) - w.window_days)
+                            / NULLIF(SUM(f.video_count) FILTER (WHERE f.date > CAST(:as_of AS date) - w.window_days), 0) AS avg_sentiment,
+                        SUM(f.trend_sum) FILTER (WHERE f.date > CAST(:as_of AS date) - w.window_days)
+                            / NULLIF(SUM(f.video_count) FILTER (WHERE f.date > CAST(:as_of AS date) - w.window_days), 0) AS avg_trend,
+                        SUM(f.total_score_sum) FILTER (WHERE f.date > CAST(:as_of AS date) - w.window_days)
+                            / NULLIF(SUM(f.video_count) FILTER (WHERE f.date > CAST(:as_of AS date) - w.window_days), 0) AS avg_total_score
+                    FROM {fact_table} f
+                    JOIN w
+                      ON f.date > CAST(:as_of AS date) - 2 * w.window_days
+                     AND f.date <= :as_of
+                    WHERE (:platform IS NULL OR f.platform = :platform)
+                    GROUP BY w.window_days, f.{key_field}, f.platform
+                ),
+                ranked AS (
+                    SELECT
+                        agg.*,
+                        CASE
+                            WHEN search_volume = 0 AND search_volume_prev = 0 THEN 0
+                            ELSE (search_volume - search_volume_prev)::numeric / GREATEST(search_volume_prev, 1)
+                        END AS growth_rate,
+                        ROW_NUMBER() OVER (
+                            PARTITION BY window_days, platform
+                            ORDER BY view_velocity DESC NULLS LAST, search_volume DESC
+                        ) AS rank
+                    FROM agg
+                    WHERE video_count > 0
+                )
+                SELECT *
+                FROM ranked
+                {limit_sql}
+                ORDER BY window_days, platform, rank
+                """.format(fact_table=fact_table, key_field=key_field, limit_sql=limit_sql)
+            ),
+            {"windows": list(windows), "as_of": as_of, "platform": platform, "limit": limit},
+        ).mappings()
+
+        result: list[dict] = []
+        for r in rows:
+            row = self._to_ranked_row(r, key_field)
+            row["window_days"] = int(r["window_days"])
+            result.append(row)
+        return result
+
+    def _refresh_video_velocity(
+        self,
+        db,
+        as_of: date,
+        velocity_days: int,
+        from_date: date,
+        platform: str | None,
+        video_ids: list[str] | None = None,
+    ) -> int:
+        """
+        from_date ~ as_of 사이에 게시(없으면 수집)된 영상에 대해 as_of 시점 최신 스냅샷과
+        as_of - velocity_days 시점 기준 스냅샷을 찾아 video_velocity 에 upsert 한다.
+        video_ids 가 주어지면 해당 영상만 갱신한다(증분 집계).
+        보존 기간(VIDEO_VELOCITY_RETENTION_DAYS, 기본 35일)이 지난 행은 함께 정리한다.
+        """
+        if video_ids is not None and not video_ids:
+            return 0
+        prev_anchor = as_of - timedelta(days=velocity_days)
+        video_filter_sql = "AND v.video_id = ANY(:video_ids)" if video_ids is not None else ""
+        result = db.execute(
+            text(
+                """
+                INSERT INTO video_velocity (
+                    as_of, velocity_days, video_id, platform,
+                    view_count, like_count, comment_count,
+                    anchor_view_count, anchor_like_count, anchor_comment_count,
+                    view_velocity, like_velocity, comment_velocity, computed_at
+                )
+                SELECT
+                    :as_of,
+                    :velocity_days,
+                    v.video_id,
+                    v.platform,
+                    COALESCE(curr.view_count, v.view_count, 0),
+                    COALESCE(curr.like_count, v.like_count, 0),
+                    COALESCE(curr.comment_count, v.comment_count, 0),
+                    COALESCE(prev.view_count, 0),
+                    COALESCE(prev.like_count, 0),
+                    COALESCE(prev.comment_count, 0),
+                    (COALESCE(curr.view_count, v.view_count, 0) - COALESCE(prev.view_count, 0))::numeric / :velocity_days,
+                    (COALESCE(curr.like_count, v.like_count, 0) - COALESCE(prev.like_count, 0))::numeric / :velocity_days,
+                    (COALESCE(curr.comment_count, v.comment_count, 0) - COALESCE(prev.comment_count, 0))::numeric / :velocity_days,
+                    NOW()
+                FROM video v
+                LEFT JOIN LATERAL (
+                    SELECT s.view_count, s.like_count, s.comment_count
+                    FROM video_metrics_snapshot s
+                    WHERE s.video_id = v.video_id
+                      AND s.platform = v.platform
+                      AND s.snapshot_date <= :as_of
+                    ORDER BY s.snapshot_date DESC
+                    LIMIT 1
+                ) curr ON true
+                LEFT JOIN LATERAL (
+                    SELECT s.view_count, s.like_count, s.comment_count
+                    FROM video_metrics_snapshot s
+                    WHERE s.video_id = v.video_id
+                      AND s.platform = v.platform
+                      AND s.snapshot_date <= :prev_anchor
+                    ORDER BY s.snapshot_date DESC
+                    LIMIT 1
+                ) prev ON true
+                WHERE v.activity_date BETWEEN :from_date AND :as_of
+                  AND (:platform IS NULL OR v.platform = :platform)
+                  {video_filter_sql}
+                ON CONFLICT (as_of, velocity_days, video_id, platform)
+                DO UPDATE SET
+                    view_count = EXCLUDED.view_count,
+                    like_count = EXCLUDED.like_count,
+                    comment_count = EXCLUDED.comment_count,
+                    anchor_view_count = EXCLUDED.anchor_view_count,
+                    anchor_like_count = EXCLUDED.anchor_like_count,
+                    anchor_comment_count = EXCLUDED.anchor_comment_count,
+                    view_velocity = EXCLUDED.view_velocity,
+                    like_velocity = EXCLUDED.like_velocity,
+                    comment_velocity = EXCLUDED.comment_velocity,
+                    computed_at = EXCLUDED.computed_at
+                """.format(video_filter_sql=video_filter_sql)
+            ),
+            {
+                "as_of": as_of,
+                "velocity_days": velocity_days,
+                "from_date": from_date,
+                "prev_anchor": prev_anchor,
+                "platform": platform,
+                "video_ids": video_ids,
+            },
+        )
+        retention_days = int(os.getenv("VIDEO_VELOCITY_RETENTION_DAYS", "35"))
+        db.execute(
+            text("DELETE FROM video_velocity WHERE as_of < :cutoff"),
+            {"cutoff": as_of - timedelta(days=retention_days)},
+        )
+        db.commit()
+        return result.rowcount or 0
+
+    @staticmethod
+    def _default_fact_refresh_days() -> int:
+        try:
+            return max(int(os.getenv("TREND_FACT_REFRESH_DAYS", "1")), 1)
+        except ValueError:
+            return 1
+
+    @staticmethod
+    def _default_velocity_days() -> int:
+        try:
+            return int(os.getenv("TREND_VELOCITY_DAYS", "3"))
+        except ValueError:
+            return 3
+
     def _aggregate_keywords(
         self, db, from_date: date, as_of: date, platform: str | None, velocity_days: int
     ) -> list[dict]:
@@ -164,7 +994,7 @@ class TrendAggregationUseCase:
                     ORDER BY s.snapshot_date DESC
                     LIMIT 1
                 ) prev ON true
-                WHERE COALESCE(v.published_at::date, v.crawled_at::date) BETWEEN :from_date AND :to_date
+                WHERE v.activity_date BETWEEN :from_date AND :to_date
                   AND (:platform IS NULL OR v.platform = :platform)
                 GROUP BY km.keyword, v.platform
                 """
@@ -214,30 +1044,14 @@ class TrendAggregationUseCase:
                         v.platform,
                         COALESCE(
                             vs.category,
-                            CASE v.category_id
-                                WHEN 1 THEN 'Film & Animation'
-                                WHEN 2 THEN 'Autos & Vehicles'
-                                WHEN 10 THEN 'Music'
-                                WHEN 15 THEN 'Pets & Animals'
-                                WHEN 17 THEN 'Sports'
-                                WHEN 19 THEN 'Travel & Events'
-                                WHEN 20 THEN 'Gaming'
-                                WHEN 22 THEN 'People & Blogs'
-                                WHEN 23 THEN 'Comedy'
-                                WHEN 24 THEN 'Entertainment'
-                                WHEN 25 THEN 'News'
-                                WHEN 26 THEN 'Howto & Style'
-                                WHEN 27 THEN 'Education'
-                                WHEN 28 THEN 'Science & Technology'
-                                WHEN 29 THEN 'Nonprofits & Activism'
-                                ELSE 'uncategorized'
-                            END
+                            {category_name_sql}
                         ) AS category,
                         v.view_count,
                         v.like_count,
                         v.comment_count,
                         v.published_at,
                         v.crawled_at,
+                        v.activity_date,
                         vs.sentiment_score,
                         vs.trend_score,
                         sc.total_score
@@ -276,10 +1090,10 @@ class TrendAggregationUseCase:
                     ORDER BY s.snapshot_date DESC
                     LIMIT 1
                 ) prev ON true
-                WHERE COALESCE(c.published_at::date, c.crawled_at::date) BETWEEN :from_date AND :to_date
+                WHERE c.activity_date BETWEEN :from_date AND :to_date
                   AND (:platform IS NULL OR c.platform = :platform)
                 GROUP BY c.category, c.platform
-                """
+                """.format(category_name_sql=YOUTUBE_CATEGORY_NAME_SQL)
             ),
             {
                 "from_date": from_date,
@@ -309,6 +1123,158 @@ class TrendAggregationUseCase:
             )
         return result
 
+    def _aggregate_keywords_single_pass(
+        self,
+        db,
+        prev_from: date,
+        from_date: date,
+        as_of: date,
+        platform: str | None,
+        velocity_days: int,
+        group_keys: list[str] | None = None,
+    ) -> list[dict]:
+        """
+        키워드 기준 현재/이전 윈도우 동시 집계 (성장률/랭킹 포함).
+        """
+        return self._aggregate_single_pass(
+            db, KEYWORD_SOURCE_SQL, "keyword", prev_from, from_date, as_of, platform, velocity_days, group_keys
+        )
+
+    def _aggregate_categories_single_pass(
+        self,
+        db,
+        prev_from: date,
+        from_date: date,
+        as_of: date,
+        platform: str | None,
+        velocity_days: int,
+        group_keys: list[str] | None = None,
+    ) -> list[dict]:
+        """
+        카테고리 기준 현재/이전 윈도우 동시 집계 (성장률/랭킹 포함).
+        """
+        return self._aggregate_single_pass(
+            db, CATEGORY_SOURCE_SQL, "category", prev_from, from_date, as_of, platform, velocity_days, group_keys
+        )
+
+    def _aggregate_single_pass(
+        self,
+        db,
+        source_sql: str,
+        key_field: str,
+        prev_from: date,
+        from_date: date,
+        as_of: date,
+        platform: str | None,
+        velocity_days: int,
+        group_keys: list[str] | None = None,
+    ) -> list[dict]:
+        """
+        prev_from ~ as_of 구간을 한 번만 스캔하면서 조건부 집계(FILTER)로 현재/이전 윈도우를 나눠 계산한다.
+        - 영상별 지표/속도는 video_velocity 에서 읽는다. 이전 윈도우 영상은 as_of=prev_to 행,
+          현재 윈도우 영상은 as_of 행을 사용한다(legacy 모드와 동일 기준).
+        - 성장률과 플랫폼별 랭킹(view_velocity, search_volume 내림차순)은 윈도우 함수로 산출한다.
+        - group_keys 가 주어지면 해당 키워드/카테고리만 집계한다(증분 집계, rank 는 부분 집합 기준).
+        """
+        if group_keys is not None and not group_keys:
+            return []
+        prev_to = from_date - timedelta(days=1)
+        group_filter_sql = "AND src.group_key = ANY(:group_keys)" if group_keys is not None else ""
+        rows = db.execute(
+            text(
+                """
+                WITH src AS (
+                    {source_sql}
+                ),
+                base AS (
+                    SELECT
+                        src.group_key,
+                        src.platform,
+                        src.video_id,
+                        src.activity_date >= :from_date AS is_current,
+                        COALESCE(vv.view_count, src.view_count, 0) AS view_count,
+                        GREATEST(COALESCE(vv.view_velocity, 0), 0) AS view_velocity,
+                        GREATEST(COALESCE(vv.like_velocity, 0), 0) AS like_velocity,
+                        GREATEST(COALESCE(vv.comment_velocity, 0), 0) AS comment_velocity,
+                        src.sentiment_score,
+                        src.trend_score,
+                        src.total_score
+                    FROM src
+                    LEFT JOIN video_velocity vv
+                      ON vv.video_id = src.video_id
+                     AND vv.platform = src.platform
+                     AND vv.velocity_days = :velocity_days
+                     AND vv.as_of = CASE
+                            WHEN src.activity_date >= :from_date THEN :to_date
+                            ELSE :prev_to
+                         END
+                    WHERE src.activity_date BETWEEN :prev_from AND :to_date
+                      AND (:platform IS NULL OR src.platform = :platform)
+                      {group_filter_sql}
+                ),
+                agg AS (
+                    SELECT
+                        group_key,
+                        platform,
+                        COUNT(DISTINCT video_id) FILTER (WHERE is_current) AS video_count,
+                        COUNT(DISTINCT video_id) FILTER (WHERE NOT is_current) AS video_count_prev,
+                        COALESCE(SUM(view_count) FILTER (WHERE is_current), 0) AS search_volume,
+                        COALESCE(SUM(view_count) FILTER (WHERE NOT is_current), 0) AS search_volume_prev,
+                        SUM(view_velocity) FILTER (WHERE is_current) AS view_velocity,
+                        SUM(like_velocity) FILTER (WHERE is_current) AS like_velocity,
+                        SUM(comment_velocity) FILTER (WHERE is_current) AS comment_velocity,
+                        AVG(COALESCE(sentiment_score, 0)) FILTER (WHERE is_current) AS avg_sentiment,
+                        AVG(COALESCE(trend_score, 0)) FILTER (WHERE is_current) AS avg_trend,
+                        AVG(COALESCE(total_score, 0)) FILTER (WHERE is_current) AS avg_total_score
+                    FROM base
+                    GROUP BY group_key, platform
+                )
+                SELECT
+                    agg.*,
+                    CASE
+                        WHEN search_volume = 0 AND search_volume_prev = 0 THEN 0
+                        ELSE (search_volume - search_volume_prev)::numeric / GREATEST(search_volume_prev, 1)
+                    END AS growth_rate,
+                    ROW_NUMBER() OVER (
+                        PARTITION BY platform
+                        ORDER BY view_velocity DESC NULLS LAST, search_volume DESC
+                    ) AS rank
+                FROM agg
+                WHERE video_count > 0
+                """.format(source_sql=source_sql, group_filter_sql=group_filter_sql)
+            ),
+            {
+                "prev_from": prev_from,
+                "prev_to": prev_to,
+                "from_date": from_date,
+                "to_date": as_of,
+                "platform": platform,
+                "velocity_days": velocity_days,
+                "group_keys": group_keys,
+            },
+        ).mappings()
+
+        return [self._to_ranked_row(r, key_field) for r in rows]
+
+    @staticmethod
+    def _to_ranked_row(r, key_field: str) -> dict:
+        return {
+            key_field: r["group_key"],
+            "platform": r["platform"],
+            "video_count": int(r["video_count"] or 0),
+            "video_count_prev": int(r["video_count_prev"] or 0),
+            "search_volume": int(r["search_volume"] or 0),
+            "search_volume_prev": int(r["search_volume_prev"] or 0),
+            "view_velocity": float(r["view_velocity"] or 0),
+            "like_velocity": float(r["like_velocity"] or 0),
+            "comment_velocity": float(r["comment_velocity"] or 0),
+            "avg_sentiment": float(r["avg_sentiment"] or 0),
+            "avg_trend": float(r["avg_trend"] or 0),
+            "avg_total_score": float(r["avg_total_score"] or 0),
+            "growth_rate": float(r["growth_rate"] or 0),
+            "rank": int(r["rank"]),
+        }
+
     def _apply_rank(self, rows: Iterable[dict]) -> list[dict]:
         # 플랫폼별 view_velocity 우선, 다음은 search_volume 내림차순으로 랭킹 산출
         grouped: dict[str, list[dict]] = defaultdict(list)
@@ -365,10 +1331,15 @@ class TrendAggregationUseCase:
         platform: str | None,
         velocity_days: int,
         limit: int,
+        use_velocity_table: bool = False,
     ) -> list[dict]:
         """
         속도(조회/댓글/좋아요 증가)에 기반해 상위 트렌딩 영상을 추출한다.
         """
+        if use_velocity_table:
+            return self._select_trending_videos_from_velocity(
+                db, from_date, to_date, platform, velocity_days, limit
+            )
         prev_anchor = to_date - timedelta(days=velocity_days)
         rows = db.execute(
             text(
@@ -412,7 +1383,7 @@ class TrendAggregationUseCase:
                     ORDER BY s.snapshot_date DESC
                     LIMIT 1
                 ) prev ON true
-                WHERE COALESCE(v.published_at::date, v.crawled_at::date) BETWEEN :from_date AND :to_date
+                WHERE v.activity_date BETWEEN :from_date AND :to_date
                   AND (:platform IS NULL OR v.platform = :platform)
                 ORDER BY view_velocity DESC NULLS LAST,
                          comment_velocity DESC NULLS LAST,
@@ -434,11 +1405,74 @@ class TrendAggregationUseCase:
 
         return [dict(r) for r in rows]
 
-    def _has_new_data(self, as_of: date, from_date: date, platform: str | None) -> bool:
+    def _select_trending_videos_from_velocity(
+        self,
+        db,
+        from_date: date,
+        to_date: date,
+        platform: str | None,
+        velocity_days: int,
+        limit: int,
+    ) -> list[dict]:
+        """
+        video_velocity 단계 결과를 조인해 상위 트렌딩 영상을 추출한다. (스냅샷 LATERAL 조회 없음)
+        """
+        rows = db.execute(
+            text(
+                """
+                SELECT
+                    v.video_id,
+                    v.title,
+                    v.channel_id,
+                    v.platform,
+                    vs.category,
+                    vv.view_count,
+                    vv.anchor_view_count AS view_count_prev,
+                    vv.like_count,
+                    vv.anchor_like_count AS like_count_prev,
+                    vv.comment_count,
+                    vv.anchor_comment_count AS comment_count_prev,
+                    vv.view_velocity,
+                    vv.like_velocity,
+                    vv.comment_velocity,
+                    COALESCE(sc.total_score, sc.sentiment_score, sc.trend_score, 0) AS total_score,
+                    v.published_at,
+                    v.thumbnail_url
+                FROM video_velocity vv
+                JOIN video v ON v.video_id = vv.video_id
+                LEFT JOIN video_sentiment vs ON vs.video_id = v.video_id
+                LEFT JOIN video_score sc ON sc.video_id = v.video_id
+                WHERE vv.as_of = :to_date
+                  AND vv.velocity_days = :velocity_days
+                  AND v.activity_date BETWEEN :from_date AND :to_date
+                  AND (:platform IS NULL OR vv.platform = :platform)
+                ORDER BY vv.view_velocity DESC NULLS LAST,
+                         vv.comment_velocity DESC NULLS LAST,
+                         vv.like_velocity DESC NULLS LAST,
+                         total_score DESC NULLS LAST,
+                         v.crawled_at DESC NULLS LAST
+                LIMIT :limit
+                """
+            ),
+            {
+                "from_date": from_date,
+                "to_date": to_date,
+                "platform": platform,
+                "velocity_days": velocity_days,
+                "limit": limit,
+            },
+        ).mappings()
+
+        return [dict(r) for r in rows]
+
+    def _has_new_data(
+        self, as_of: date, from_date: date, platform: str | None, since: datetime | None = None
+    ) -> bool:
         """
         동일 데이터에 대해 불필요하게 집계하지 않도록, 기간 내 신규 데이터 존재 여부를 확인한다.
         - 기간: published_at 없으면 crawled_at 기준 from_date ~ as_of (집계 쿼리와 동일 기준)
         - 플랫폼 필터가 있다면 동일하게 적용
+        - since 가 주어지면 그 이후 upsert(crawled_at), 재스냅샷(captured_at), 재분석/키워드 재매핑된 영상만 신규로 본다.
         """
         with self.session_factory() as db:
             row = db.execute(
@@ -446,11 +1480,256 @@ class TrendAggregationUseCase:
                     """
                     SELECT 1
                     FROM video v
-                    WHERE COALESCE(v.published_at::date, v.crawled_at::date) BETWEEN :from_date AND :to_date
+                    WHERE v.activity_date BETWEEN :from_date AND :to_date
                       AND (:platform IS NULL OR v.platform = :platform)
+                      AND (:since IS NULL OR {changed_sql})
                     LIMIT 1
-                    """
+                    """.format(changed_sql=_CHANGED_SINCE_SQL)
                 ),
-                {"from_date": from_date, "to_date": as_of, "platform": platform},
+                {"from_date": from_date, "to_date": as_of, "platform": platform, "since": since},
             ).first()
             return row is not None
+
+    def _fetch_changed_video_ids(
+        self, db, from_date: date, as_of: date, platform: str | None, since: datetime
+    ) -> list[str]:
+        """
+        워터마크 이후 upsert, 지표 재스냅샷 또는 재분석된 영상 중 집계 기간(이전 윈도우 포함)에 속한 영상 목록.
+        """
+        rows = db.execute(
+            text(
+                """
+                SELECT v.video_id
+                FROM video v
+                WHERE v.activity_date BETWEEN :from_date AND :to_date
+                  AND (:platform IS NULL OR v.platform = :platform)
+                  AND ({changed_sql})
+                """.format(changed_sql=_CHANGED_SINCE_SQL)
+            ),
+            {"from_date": from_date, "to_date": as_of, "platform": platform, "since": since},
+        ).scalars()
+        return list(rows)
+
+    def _fetch_changed_activity_dates(
+        self, db, from_date: date, as_of: date, platform: str | None, since: datetime
+    ) -> list[date]:
+        """
+        워터마크 이후 팩트 값이 바뀌는 변경(_FACT_CHANGED_SINCE_SQL)이 생긴 영상의 게시일 중 from_date 이전 일자
+        (from_date ~ as_of 는 항상 재적재하므로 제외).
+        """
+        rows = db.execute(
+            text(
+                """
+                SELECT DISTINCT v.activity_date
+                FROM video v
+                WHERE v.activity_date < :from_date
+                  AND (:platform IS NULL OR v.platform = :platform)
+                  AND ({changed_sql})
+                """.format(changed_sql=_FACT_CHANGED_SINCE_SQL)
+            ),
+            {"from_date": from_date, "platform": platform, "since": since},
+        ).scalars()
+        return sorted(rows)
+
+    def _fetch_touched_keywords(self, db, video_ids: list[str]) -> list[str]:
+        """
+        변경 영상의 현재 키워드 + 지난 집계 때 기여한 키워드(trend_video_key).
+        """
+        if not video_ids:
+            return []
+        rows = db.execute(
+            text(
+                """
+                SELECT keyword FROM keyword_mapping WHERE video_id = ANY(:video_ids)
+                UNION
+                SELECT group_key FROM trend_video_key WHERE key_type = 'keyword' AND video_id = ANY(:video_ids)
+                """
+            ),
+            {"video_ids": video_ids},
+        ).scalars()
+        return list(rows)
+
+    def _fetch_touched_categories(self, db, video_ids: list[str]) -> list[str]:
+        """
+        변경 영상의 현재 카테고리 + 지난 집계 때 기여한 카테고리(trend_video_key).
+        분석 결과로 카테고리가 바뀐 영상은 이전 카테고리 행에서도 빠져야 하므로 둘 다 재계산한다.
+        """
+        if not video_ids:
+            return []
+        rows = db.execute(
+            text(
+                """
+                SELECT COALESCE(vs.category, {category_name_sql}) AS category
+                FROM video v
+                LEFT JOIN video_sentiment vs ON vs.video_id = v.video_id
+                WHERE v.video_id = ANY(:video_ids)
+                UNION
+                SELECT group_key FROM trend_video_key WHERE key_type = 'category' AND video_id = ANY(:video_ids)
+                """.format(category_name_sql=YOUTUBE_CATEGORY_NAME_SQL)
+            ),
+            {"video_ids": video_ids},
+        ).scalars()
+        return list(rows)
+
+    def _save_video_keys(
+        self, db, from_date: date, as_of: date, platform: str | None, video_ids: list[str] | None = None
+    ) -> None:
+        """
+        trend_video_key 에 영상별 기여 키워드/카테고리를 기록한다. video_ids 가 없으면(전체 집계) 플랫폼 범위를
+        비우고 집계 기간(from_date ~ as_of) 영상으로 다시 채운다. commit 은 이후 워터마크 저장이 한다.
+        """
+        if video_ids is not None and not video_ids:
+            return
+        video_filter_sql = "AND src.video_id = ANY(:video_ids)" if video_ids is not None else ""
+        if video_ids is not None:
+            db.execute(text("DELETE FROM trend_video_key WHERE video_id = ANY(:video_ids)"), {"video_ids": video_ids})
+        else:
+            db.execute(
+                text("DELETE FROM trend_video_key WHERE (:platform IS NULL OR platform = :platform)"),
+                {"platform": platform},
+            )
+        for key_type, source_sql in (("keyword", KEYWORD_SOURCE_SQL), ("category", CATEGORY_SOURCE_SQL)):
+            db.execute(
+                text(
+                    """
+                    INSERT INTO trend_video_key (video_id, platform, key_type, group_key)
+                    SELECT DISTINCT src.video_id, src.platform, :key_type, src.group_key
+                    FROM ({source_sql}) src
+                    WHERE src.activity_date BETWEEN :from_date AND :to_date
+                      AND (:platform IS NULL OR src.platform = :platform)
+                      AND src.group_key IS NOT NULL
+                      {video_filter_sql}
+                    ON CONFLICT DO NOTHING
+                    """.format(source_sql=source_sql, video_filter_sql=video_filter_sql)
+                ),
+                {
+                    "key_type": key_type,
+                    "from_date": from_date,
+                    "to_date": as_of,
+                    "platform": platform,
+                    "video_ids": video_ids,
+                },
+            )
+
+    def _delete_emptied_trends(
+        self,
+        db,
+        table: str,
+        key_field: str,
+        as_of: date,
+        platform: str | None,
+        keys: list[str] | None,
+        ranked_rows: list[dict],
+    ) -> None:
+        """
+        재계산한 keys 중 결과(ranked_rows)에 없는 (키, 플랫폼)의 as_of 행을 지운다. commit 은 이후 재랭킹이 한다.
+        """
+        if not keys:
+            return
+        db.execute(
+            text(
+                """
+                DELETE FROM {table} t
+                WHERE t.date = :as_of
+                  AND (:platform IS NULL OR t.platform = :platform)
+                  AND t.{key_field} = ANY(:keys)
+                  AND (t.{key_field}, t.platform) NOT IN (
+                      SELECT kept.group_key, kept.platform
+                      FROM unnest(CAST(:kept_keys AS varchar[]), CAST(:kept_platforms AS varchar[]))
+                          AS kept(group_key, platform)
+                  )
+                """.format(table=table, key_field=key_field)
+            ),
+            {
+                "as_of": as_of,
+                "platform": platform,
+                "keys": keys,
+                "kept_keys": [row[key_field] for row in ranked_rows],
+                "kept_platforms": [row["platform"] for row in ranked_rows],
+            },
+        )
+
+    def _rerank_trends(self, db, as_of: date, platform: str | None) -> None:
+        """
+        keyword_trend / category_trend 의 as_of 일자 행 전체를 대상으로 플랫폼별 rank 를 다시 계산한다.
+        """
+        for table, key in (("keyword_trend", "keyword"), ("category_trend", "category")):
+            db.execute(
+                text(
+                    """
+                    UPDATE {table} t
+                    SET rank = r.new_rank
+                    FROM (
+                        SELECT
+                            {key},
+                            platform,
+                            ROW_NUMBER() OVER (
+                                PARTITION BY platform
+                                ORDER BY view_velocity DESC NULLS LAST, search_volume DESC NULLS LAST
+                            ) AS new_rank
+                        FROM {table}
+                        WHERE date = :as_of
+                          AND (:platform IS NULL OR platform = :platform)
+                    ) r
+                    WHERE t.{key} = r.{key}
+                      AND t.platform = r.platform
+                      AND t.date = :as_of
+                      AND t.rank IS DISTINCT FROM r.new_rank
+                    """.format(table=table, key=key)
+                ),
+                {"as_of": as_of, "platform": platform},
+            )
+        db.commit()
+
+    @staticmethod
+    def _db_utc_now(db) -> datetime:
+        # 워터마크는 DB 시계(UTC) 기준으로 잡아 애플리케이션 서버 간 시계 오차의 영향을 받지 않게 한다.
+        return db.execute(text("SELECT (now() AT TIME ZONE 'utc')")).scalar()
+
+    def _load_watermark(self, db, platform: str | None, job_name: str = "trend_aggregation") -> dict | None:
+        row = db.execute(
+            text(
+                """
+                SELECT as_of, window_days, velocity_days, watermark
+                FROM trend_watermark
+                WHERE job_name = :job_name AND platform = :platform
+                """
+            ),
+            {"job_name": job_name, "platform": platform or "all"},
+        ).mappings().first()
+        return dict(row) if row else None
+
+    def _save_watermark(
+        self,
+        db,
+        platform: str | None,
+        as_of: date,
+        window_days: int,
+        velocity_days: int,
+        watermark: datetime,
+        job_name: str = "trend_aggregation",
+    ) -> None:
+        db.execute(
+            text(
+                """
+                INSERT INTO trend_watermark (job_name, platform, as_of, window_days, velocity_days, watermark, updated_at)
+                VALUES (:job_name, :platform, :as_of, :window_days, :velocity_days, :watermark, NOW())
+                ON CONFLICT (job_name, platform)
+                DO UPDATE SET
+                    as_of = EXCLUDED.as_of,
+                    window_days = EXCLUDED.window_days,
+                    velocity_days = EXCLUDED.velocity_days,
+                    watermark = EXCLUDED.watermark,
+                    updated_at = EXCLUDED.updated_at
+                """
+            ),
+            {
+                "job_name": job_name,
+                "platform": platform or "all",
+                "as_of": as_of,
+                "window_days": window_days,
+                "velocity_days": velocity_days,
+                "watermark": watermark,
+            },
+        )
+        db.commit()
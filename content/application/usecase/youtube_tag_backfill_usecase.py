@@ -45,29 +45,24 @@ class YouTubeTagBackfillUseCase:
         # YouTube API로 메타데이터 재조회
         videos_from_api = list(self.client.fetch_videos_for_ids(video_ids))
 
-        updated = 0
-        for video in videos_from_api:
-            # API 응답에도 태그가 없다면 업데이트할 필요가 없다.
-            if not video.tags:
-                continue
+        # API 응답에도 태그가 없다면 업데이트할 필요가 없다.
+        tagged = [video for video in videos_from_api if video.tags]
+        for video in tagged:
             video.platform = platform
-            self._persist_video_with_keywords(video)
-            updated += 1
+        self._persist_videos_with_keywords(tagged)
 
-        return {"target_count": len(video_ids), "updated_count": updated}
+        return {"target_count": len(video_ids), "updated_count": len(tagged)}
 
-    def _persist_video_with_keywords(self, video: Video) -> None:
+    def _persist_videos_with_keywords(self, videos: list[Video]) -> None:
         """
-        IngestionUseCase._persist_video 와 동일한 규칙으로
-        video 및 keyword_mapping 을 upsert 한다.
+        IngestionUseCase.persist_videos 와 동일한 규칙으로
+        video 및 keyword_mapping 을 다건 upsert 한다.
         """
-        self.repository.upsert_video(video)
-        if not video.tags:
+        if not videos:
             return
-
-        keywords = [tag.strip() for tag in video.tags.split(",") if tag.strip()]
-        for kw in keywords:
-            self.repository.upsert_keyword_mapping(
+        with self.repository.unit_of_work():
+            self.repository.upsert_videos(videos)
+            self.repository.upsert_keyword_mappings(
                 KeywordMapping(
                     mapping_id=None,
                     video_id=video.video_id,
@@ -76,6 +71,10 @@ class YouTubeTagBackfillUseCase:
                     keyword=kw,
                     weight=1.0,
                 )
+                for video in videos
+                if video.tags
+                for kw in (tag.strip() for tag in video.tags.split(","))
+                if kw
             )
 
 
@@ -18,3 +18,4 @@ class CategoryTrend:
     search_volume_prev: Optional[int] = None
     growth_rate: Optional[float] = None
     rank: Optional[int] = None
+    view_velocity: Optional[float] = None
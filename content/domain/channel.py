@@ -15,6 +15,9 @@ class Channel:
     video_count: Optional[int] = None
     created_at: Optional[datetime] = None
     crawled_at: Optional[datetime] = None
+    # 플랫폼이 이전 조회 이후 바뀌지 않았다고 알려 준 경우(ETag 304). 저장 컬럼이 아닌 힌트이며,
+    # 저장소는 저장된 값이 들어온 값과 같을 때만 쓰기를 생략한다.
+    not_modified: bool = False
 
     @classmethod
     def from_platform(cls, payload: dict) -> "Channel":
@@ -17,3 +17,4 @@ class KeywordTrend:
     avg_total_score: Optional[float] = None
     growth_rate: Optional[float] = None
     rank: Optional[int] = None
+    view_velocity: Optional[float] = None
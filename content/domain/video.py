@@ -19,6 +19,9 @@ class Video:
     comment_count: Optional[int] = None
     thumbnail_url: Optional[str] = None
     crawled_at: Optional[datetime] = None
+    # 플랫폼이 이전 조회 이후 바뀌지 않았다고 알려 준 경우(ETag 304). 저장 컬럼이 아닌 힌트이며,
+    # 저장소는 저장된 값이 들어온 값과 같을 때만 쓰기를 생략한다.
+    not_modified: bool = False
 
     @classmethod
     def from_platform(cls, payload: dict) -> "Video":
@@ -1,3 +1,4 @@
+from datetime import datetime
 from typing import Iterable
 
 from content.application.port.platform_client_port import PlatformClientPort
@@ -17,7 +18,9 @@ class InstagramClient(PlatformClientPort):
     def fetch_channel(self, channel_id: str) -> Channel:
         raise NotImplementedError("Instagram API integration pending")
 
-    def fetch_videos(self, channel_id: str, max_results: int = 20) -> Iterable[Video]:
+    def fetch_videos(
+        self, channel_id: str, max_results: int = 20, published_after: datetime | None = None
+    ) -> Iterable[Video]:
         raise NotImplementedError("Instagram API integration pending")
 
     def fetch_video(self, video_id: str) -> Video:
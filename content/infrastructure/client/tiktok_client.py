@@ -1,3 +1,4 @@
+from datetime import datetime
 from typing import Iterable
 
 from content.application.port.platform_client_port import PlatformClientPort
@@ -16,7 +17,9 @@ class TikTokClient(PlatformClientPort):
     def fetch_channel(self, channel_id: str) -> Channel:
         raise NotImplementedError("TikTok API integration pending")
 
-    def fetch_videos(self, channel_id: str, max_results: int = 20) -> Iterable[Video]:
+    def fetch_videos(
+        self, channel_id: str, max_results: int = 20, published_after: datetime | None = None
+    ) -> Iterable[Video]:
         raise NotImplementedError("TikTok API integration pending")
 
     def fetch_video(self, video_id: str) -> Video:
@@ -0,0 +1,116 @@
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Iterable, Optional
+
+import redis
+
+
+class ChannelIdCache:
+    """
+    핸들/커스텀 URL 이름 → 채널 id(UC...) 해석 결과 캐시. 키는 소문자로 정규화한 조회어(@handle 또는 이름).
+    - 프로세스 내 LRU(YOUTUBE_CHANNEL_ID_CACHE_SIZE 개) 뒤에 Redis(YOUTUBE_CHANNEL_ID_CACHE_TTL_DAYS 일)를 둔다.
+      Redis 에서 찾은 값은 LRU 에도 채워, 같은 프로세스에서는 네트워크 왕복 없이 바로 돌려준다.
+    - 찾지 못한 식별자도 빈 문자열로 짧게(YOUTUBE_CHANNEL_ID_CACHE_NEGATIVE_TTL_HOURS 시간) 기억해
+      잘못된 핸들 때문에 search.list(100 unit)가 반복되지 않게 한다.
+    - Redis 오류 시에는 LRU 만으로 동작한다.
+    """
+
+    def __init__(
+        self,
+        client: Optional[redis.Redis] = None,
+        max_size: int | None = None,
+        ttl_seconds: int | None = None,
+        negative_ttl_seconds: int | None = None,
+        key_prefix: str | None = None,
+    ):
+        self._client = client
+        self.max_size = max(max_size or int(os.getenv("YOUTUBE_CHANNEL_ID_CACHE_SIZE", "10000")), 1)
+        self.ttl_seconds = ttl_seconds or int(float(os.getenv("YOUTUBE_CHANNEL_ID_CACHE_TTL_DAYS", "90")) * 86400)
+        self.negative_ttl_seconds = negative_ttl_seconds or int(
+            float(os.getenv("YOUTUBE_CHANNEL_ID_CACHE_NEGATIVE_TTL_HOURS", "24")) * 3600
+        )
+        self.key_prefix = key_prefix or os.getenv("YOUTUBE_CHANNEL_ID_CACHE_PREFIX", "yt:channel_id")
+        # 조회어 → (채널 id, 만료 시각[monotonic])
+        self._lru: "OrderedDict[str, tuple[str, float]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    @property
+    def client(self) -> redis.Redis:
+        if self._client is None:
+            from config.redis_config import get_redis
+
+            self._client = get_redis()
+        return self._client
+
+    @staticmethod
+    def normalize(query: str) -> str:
+        return query.strip().lower()
+
+    def get_many(self, queries: Iterable[str]) -> dict[str, str]:
+        """
+        캐시에 있는 조회어만 {조회어: 채널 id} 로 반환한다. 값이 빈 문자열이면 '찾지 못함'으로 기억된 것이다.
+        """
+        found: dict[str, str] = {}
+        misses: list[str] = []
+        now = time.monotonic()
+        with self._lock:
+            for query in dict.fromkeys(queries):
+                key = self.normalize(query)
+                entry = self._lru.get(key)
+                if entry is not None and entry[1] > now:
+                    self._lru.move_to_end(key)
+                    found[query] = entry[0]
+                else:
+                    misses.append(query)
+        if not misses:
+            return found
+        try:
+            values = self.client.mget([self._redis_key(query) for query in misses])
+        except redis.RedisError as exc:
+            print(f"[YOUTUBE-CHANNEL-CACHE] redis lookup failed: {exc}")
+            return found
+        loaded = {query: value for query, value in zip(misses, values) if value is not None}
+        self._remember(loaded)
+        found.update(loaded)
+        return found
+
+    def put_many(self, resolved: dict[str, str | None]) -> None:
+        """해석 결과를 저장한다. None 은 찾지 못한 식별자로 기록한다."""
+        if not resolved:
+            return
+        values = {query: channel_id or "" for query, channel_id in resolved.items()}
+        self._remember(values)
+        try:
+            pipe = self.client.pipeline(transaction=False)
+            for query, value in values.items():
+                pipe.set(self._redis_key(query), value, ex=self.ttl_seconds if value else self.negative_ttl_seconds)
+            pipe.execute()
+        except redis.RedisError as exc:
+            print(f"[YOUTUBE-CHANNEL-CACHE] redis store failed: {exc}")
+
+    def _remember(self, values: dict[str, str]) -> None:
+        now = time.monotonic()
+        with self._lock:
+            for query, value in values.items():
+                key = self.normalize(query)
+                self._lru[key] = (value, now + (self.ttl_seconds if value else self.negative_ttl_seconds))
+                self._lru.move_to_end(key)
+            while len(self._lru) > self.max_size:
+                self._lru.popitem(last=False)
+
+    def _redis_key(self, query: str) -> str:
+        return f"{self.key_prefix}:{self.normalize(query)}"
+
+
+_cache: ChannelIdCache | None = None
+_cache_lock = threading.Lock()
+
+
+def get_channel_id_cache() -> ChannelIdCache:
+    global _cache
+    with _cache_lock:
+        if _cache is None:
+            _cache = ChannelIdCache()
+        return _cache
@@ -1,5 +1,8 @@
-from datetime import datetime
-from typing import Iterable, List
+import os
+import threading
+from concurrent.futures import Future, as_completed
+from datetime import datetime, timezone
+from typing import Any, Callable, Iterable, Iterator, List
 from urllib.parse import urlparse
 
 from googleapiclient.discovery import build
@@ -10,84 +13,146 @@ from content.application.port.platform_client_port import PlatformClientPort
 from content.domain.channel import Channel
 from content.domain.video import Video
 from content.domain.video_comment import VideoComment
+from content.infrastructure.client.youtube_channel_cache import ChannelIdCache, get_channel_id_cache
+from content.infrastructure.client.youtube_etag_cache import ETagCache, get_etag_cache
+from content.infrastructure.client.youtube_key_pool import PooledKey, YouTubeKeyPool, get_key_pool
+from content.infrastructure.client.youtube_quota import QuotaExhaustedError
+from content.infrastructure.client.youtube_video_batcher import MAX_IDS_PER_REQUEST, VideoListBatcher
+
+# ETag 조건부 요청에서 304 로 재사용한 응답/항목에 붙이는 표시
+_NOT_MODIFIED = "_not_modified"
 
 
 class YouTubeClient(PlatformClientPort):
     platform = "youtube"
 
-    def __init__(self, settings: YouTubeSettings):
+    def __init__(
+        self,
+        settings: YouTubeSettings,
+        key_pool: YouTubeKeyPool | None = None,
+        channel_id_cache: ChannelIdCache | None = None,
+        etag_cache: ETagCache | None = None,
+    ):
         # YouTube Data API? ??/??/??? ????.
         self.settings = settings
-        self.service = build(
-            "youtube",
-            "v3",
-            developerKey=settings.api_key,
-            cache_discovery=False,
-        )
+        # 모든 API 호출은 _execute 를 거쳐 키 풀에서 쿼터가 남은 키를 받아 실행한다(키별 쿼터는 프로세스 간 공유).
+        self.key_pool = key_pool or get_key_pool(settings.key_pool())
+        self.channel_id_cache = channel_id_cache or get_channel_id_cache()
+        self.etag_cache = etag_cache or get_etag_cache()
+        self._local = threading.local()
+        # 이 클라이언트를 쓰는 모든 호출자의 videos.list 요청을 50개 단위로 합쳐 동시에 보낸다.
+        self._video_batcher = VideoListBatcher(self._fetch_video_items)
+
+    def _service(self, key: PooledKey):
+        # googleapiclient(httplib2) 서비스 객체는 스레드 안전하지 않으므로 스레드마다, 키마다 따로 만든다.
+        services = getattr(self._local, "services", None)
+        if services is None:
+            services = self._local.services = {}
+        service = services.get(key.key_id)
+        if service is None:
+            service = services[key.key_id] = build(
+                "youtube",
+                "v3",
+                developerKey=key.api_key,
+                cache_discovery=False,
+            )
+        return service
+
+    def _execute(self, method: str, build_request: Callable[[Any], Any], conditional: bool = False):
+        """
+        키 풀에서 쿼터(method 비용, 현재 quota_scope 의 우선순위)를 확보한 키로 요청을 만들어 실행한다.
+        확보하지 못하면 QuotaExhaustedError. API 가 quotaExceeded 를 돌려주면 그 키를 오늘 소진 처리하고
+        다른 키로 다시 시도한다(모든 키가 소진되면 QuotaExhaustedError).
+        conditional=True 이면 이전 응답의 ETag 로 If-None-Match 를 보내고, 304 면 저장해 둔 응답에
+        _NOT_MODIFIED 표시를 붙여 돌려준다(본문 전송 없이 재사용). ETag 는 적재 전에 저장되므로 이 표시는
+        "마지막 조회 이후 변경 없음" 힌트일 뿐이며, 저장소는 저장된 행과 비교한 뒤에만 쓰기를 생략한다.
+        """
+        while True:
+            key = self.key_pool.acquire(method)
+            request = build_request(self._service(key))
+            cache_key = stored = None
+            if conditional and self.etag_cache.enabled:
+                cache_key = self.etag_cache.request_key(method, request.uri)
+                stored = self.etag_cache.get(cache_key)
+                if stored is not None:
+                    request.headers["If-None-Match"] = stored["etag"]
+            try:
+                response = request.execute()
+            except HttpError as exc:
+                if exc.resp.status == 304 and stored is not None:
+                    self.etag_cache.touch(cache_key)
+                    return {**stored["payload"], _NOT_MODIFIED: True}
+                if exc.resp.status == 403 and b"quotaExceeded" in (exc.content or b""):
+                    self.key_pool.mark_exhausted(key)
+                    continue
+                raise
+            if cache_key is not None and response.get("etag"):
+                self.etag_cache.put(cache_key, response["etag"], response)
+            return response
+
+    @staticmethod
+    def _items(response: dict) -> List[dict]:
+        # 304 로 재사용한 응답이면 항목마다 표시를 옮겨, 파싱한 Channel/Video 의 not_modified 로 이어지게 한다.
+        items = response.get("items", [])
+        if response.get(_NOT_MODIFIED):
+            return [{**item, _NOT_MODIFIED: True} for item in items]
+        return items
 
     def fetch_channel(self, channel_id: str) -> Channel:
         resolved_id = self._resolve_channel_id(channel_id)
         try:
-            response = (
-                self.service.channels().list(part="snippet,statistics", id=resolved_id).execute()
+            response = self._execute(
+                "channels.list",
+                lambda service: service.channels().list(part="snippet,statistics", id=resolved_id),
+                conditional=True,
             )
         except HttpError as exc:
             raise RuntimeError(f"YouTube channel fetch failed: {exc}") from exc
 
-        items = response.get("items", [])
+        items = self._items(response)
         if not items:
             raise ValueError("Channel not found")
-        snippet = items[0]["snippet"]
-        stats = items[0]["statistics"]
-        return Channel(
-            channel_id=resolved_id,
-            platform=self.platform,
-            title=snippet.get("title", ""),
-            description=snippet.get("description"),
-            country=snippet.get("country"),
-            subscriber_count=int(stats.get("subscriberCount", 0)),
-            view_count=int(stats.get("viewCount", 0)),
-            video_count=int(stats.get("videoCount", 0)),
-            created_at=self._parse_datetime(snippet.get("publishedAt")),
-        )
-
-    def fetch_videos(self, channel_id: str, max_results: int = 20) -> Iterable[Video]:
-        resolved_id = self._resolve_channel_id(channel_id)
-        video_ids = self._list_video_ids(resolved_id, max_results)
-        if not video_ids:
-            return []
-        try:
-            response = (
-                self.service.videos()
-                .list(part="snippet,contentDetails,statistics", id=",".join(video_ids))
-                .execute()
-            )
-        except HttpError as exc:
-            raise RuntimeError(f"YouTube videos fetch failed: {exc}") from exc
+        self._remember_custom_urls(items)
+        channel = self._parse_channel(items[0])
+        channel.channel_id = resolved_id
+        return channel
 
-        videos: List[Video] = []
-        for item in response.get("items", []):
-            snippet = item["snippet"]
-            stats = item.get("statistics", {})
-            content = item.get("contentDetails", {})
-            videos.append(
-                Video(
-                    video_id=item["id"],
-                    channel_id=snippet["channelId"],
-                    platform=self.platform,
-                    title=snippet.get("title", ""),
-                    description=snippet.get("description"),
-                    tags=",".join(snippet.get("tags", [])) if snippet.get("tags") else None,
-                    category_id=int(snippet.get("categoryId")) if snippet.get("categoryId") else None,
-                    published_at=self._parse_datetime(snippet.get("publishedAt")),
-                    duration=content.get("duration"),
-                    view_count=int(stats.get("viewCount", 0)),
-                    like_count=int(stats.get("likeCount", 0)) if stats.get("likeCount") else 0,
-                    comment_count=int(stats.get("commentCount", 0)) if stats.get("commentCount") else 0,
-                    thumbnail_url=(snippet.get("thumbnails", {}).get("high") or {}).get("url"),
+    def fetch_channels(self, channel_ids: List[str]) -> dict[str, Channel]:
+        """
+        여러 채널을 channels.list 한 번에 최대 50개씩 조회한다. 반환: {입력 식별자: Channel}.
+        식별자를 해석하지 못했거나 찾지 못한 채널은 결과에서 빠진다.
+        """
+        resolved = {
+            identifier: channel_id
+            for identifier, channel_id in self.resolve_channel_ids(channel_ids).items()
+            if channel_id
+        }
+        unique_ids = list(dict.fromkeys(resolved.values()))
+        by_id: dict[str, Channel] = {}
+        for start in range(0, len(unique_ids), MAX_IDS_PER_REQUEST):
+            chunk = unique_ids[start : start + MAX_IDS_PER_REQUEST]
+            try:
+                response = self._execute(
+                    "channels.list",
+                    lambda service: service.channels()
+                    .list(part="snippet,statistics", id=",".join(chunk)),
+                    conditional=True,
                 )
-            )
-        return videos
+            except HttpError as exc:
+                raise RuntimeError(f"YouTube channels fetch failed: {exc}") from exc
+            items = self._items(response)
+            self._remember_custom_urls(items)
+            for item in items:
+                channel = self._parse_channel(item)
+                by_id[channel.channel_id] = channel
+        return {identifier: by_id[channel_id] for identifier, channel_id in resolved.items() if channel_id in by_id}
+
+    def fetch_videos(
+        self, channel_id: str, max_results: int = 20, published_after: datetime | None = None
+    ) -> Iterable[Video]:
+        resolved_id = self._resolve_channel_id(channel_id)
+        video_ids = self._list_video_ids(resolved_id, max_results, published_after)
+        return list(self.fetch_videos_for_ids(video_ids))
 
     def fetch_video(self, video_id: str) -> Video:
         videos = list(self.fetch_videos_for_ids([video_id]))
@@ -96,48 +161,84 @@ class YouTubeClient(PlatformClientPort):
         return videos[0]
 
     def fetch_videos_for_ids(self, video_ids: List[str]) -> Iterable[Video]:
-        if not video_ids:
-            return []
+        """
+        영상 id 들을 배처에 넘겨 다른 호출자의 id 와 함께 50개 단위로 동시에 조회하고, 끝난 요청부터 내보낸다.
+        결과 순서는 입력 순서와 다를 수 있으며, 존재하지 않는 영상은 빠진다.
+        """
+        futures = self._video_batcher.submit(dict.fromkeys(video_ids))
+        yield from self._parse_completed(as_completed(futures))
+
+    def fetch_videos_for_channels(
+        self, channel_ids: List[str], max_results: int = 20, published_after: datetime | None = None
+    ) -> Iterator[Video]:
+        """
+        여러 채널의 최근 영상을 채널 경계 없이 50개 단위 videos.list 로 묶어 조회한다.
+        채널별 id 목록을 만드는 동안에도 이미 끝난 요청의 영상을 먼저 내보낸다.
+        채널 해석/목록 조회나 videos.list 묶음이 실패하면 로그만 남기고 나머지 채널을 계속 처리한다
+        (QuotaExhaustedError 는 더 진행해도 실패하므로 그대로 던진다).
+        """
+        pending: set[Future] = set()
+        failures: set[int] = set()
+        for channel_id in dict.fromkeys(channel_ids):
+            try:
+                resolved_id = self._resolve_channel_id(channel_id)
+                video_ids = self._list_video_ids(resolved_id, max_results, published_after)
+            except QuotaExhaustedError:
+                raise
+            except (RuntimeError, ValueError, HttpError) as exc:
+                print(f"[YOUTUBE] skip channel | channel_id={channel_id}: {type(exc).__name__}: {exc}")
+                continue
+            pending.update(self._video_batcher.submit(video_ids))
+            done = {future for future in pending if future.done()}
+            pending -= done
+            yield from self._parse_completed(done, failures)
+        self._video_batcher.flush()
+        yield from self._parse_completed(as_completed(pending), failures)
+
+    def _parse_completed(self, futures: Iterable[Future], failures: set[int] | None = None) -> Iterator[Video]:
+        """
+        failures 가 주어지면 실패한 묶음의 영상은 건너뛰고, 같은 묶음의 예외는 한 번만 기록한다.
+        """
+        for future in futures:
+            if failures is None:
+                item = future.result()
+            else:
+                try:
+                    item = future.result()
+                except QuotaExhaustedError:
+                    raise
+                except (RuntimeError, ValueError, HttpError) as exc:
+                    if id(exc) not in failures:
+                        failures.add(id(exc))
+                        print(f"[YOUTUBE] skip videos.list chunk: {type(exc).__name__}: {exc}")
+                    continue
+            if item is not None:
+                yield self._parse_video(item)
+
+    def _fetch_video_items(self, video_ids: List[str]) -> List[dict]:
+        # VideoListBatcher 가 워커 스레드에서 호출한다(서비스 객체는 스레드별로 만들어진다).
         try:
-            response = (
-                self.service.videos()
-                .list(part="snippet,contentDetails,statistics", id=",".join(video_ids))
-                .execute()
+            response = self._execute(
+                "videos.list",
+                lambda service: service.videos()
+                .list(part="snippet,contentDetails,statistics", id=",".join(video_ids)),
+                conditional=True,
             )
         except HttpError as exc:
             raise RuntimeError(f"YouTube video fetch failed: {exc}") from exc
-
-        for item in response.get("items", []):
-            snippet = item["snippet"]
-            stats = item.get("statistics", {})
-            content = item.get("contentDetails", {})
-            yield Video(
-                video_id=item["id"],
-                channel_id=snippet["channelId"],
-                platform=self.platform,
-                title=snippet.get("title", ""),
-                description=snippet.get("description"),
-                tags=",".join(snippet.get("tags", [])) if snippet.get("tags") else None,
-                category_id=int(snippet.get("categoryId")) if snippet.get("categoryId") else None,
-                published_at=self._parse_datetime(snippet.get("publishedAt")),
-                duration=content.get("duration"),
-                view_count=int(stats.get("viewCount", 0)),
-                like_count=int(stats.get("likeCount", 0)) if stats.get("likeCount") else 0,
-                comment_count=int(stats.get("commentCount", 0)) if stats.get("commentCount") else 0,
-                thumbnail_url=(snippet.get("thumbnails", {}).get("high") or {}).get("url"),
-            )
+        return self._items(response)
 
     def fetch_comments(self, video_id: str, max_results: int = 50) -> Iterable[VideoComment]:
         try:
-            response = (
-                self.service.commentThreads()
+            response = self._execute(
+                "commentThreads.list",
+                lambda service: service.commentThreads()
                 .list(
                     part="snippet",
                     videoId=video_id,
                     maxResults=min(max_results, 100),
                     textFormat="plainText",
-                )
-                .execute()
+                ),
             )
         except HttpError as exc:
             raise RuntimeError(f"YouTube comments fetch failed: {exc}") from exc
@@ -162,37 +263,86 @@ class YouTubeClient(PlatformClientPort):
         """??(@), ?? URL, ??? ??? ?? channelId(UC...)? ??."""
         if not identifier:
             raise ValueError("Channel identifier is required")
-        ident = identifier.strip()
+        channel_id = self.resolve_channel_ids([identifier]).get(identifier)
+        if not channel_id:
+            raise ValueError("Channel not found from identifier")
+        return channel_id
+
+    def resolve_channel_ids(self, identifiers: List[str]) -> dict[str, str | None]:
+        """
+        핸들(@), 채널 URL, 이름 여러 개를 채널 id 로 한꺼번에 해석한다. 반환: {입력 식별자: 채널 id 또는 None}.
+        해석 결과는 ChannelIdCache(프로세스 LRU + Redis)에 남으므로, 미리 호출해 두면 이후 수집 요청은 API 를 부르지 않는다.
+        """
+        result: dict[str, str | None] = {}
+        pending: dict[str, list[str]] = {}
+        for identifier in dict.fromkeys(identifiers):
+            channel_id, query = self._parse_channel_identifier(identifier)
+            if query is None:
+                result[identifier] = channel_id
+            else:
+                pending.setdefault(self.channel_id_cache.normalize(query), []).append(identifier)
+
+        cached = self.channel_id_cache.get_many(pending)
+        looked_up: dict[str, str | None] = {}
+        for query, inputs in pending.items():
+            if query in cached:
+                channel_id = cached[query] or None
+            else:
+                channel_id = looked_up[query] = self._lookup_channel_id(query)
+            for identifier in inputs:
+                result[identifier] = channel_id
+        self.channel_id_cache.put_many(looked_up)
+        if looked_up:
+            print(f"[YOUTUBE-CLIENT] resolved channel identifiers | looked_up={len(looked_up)}, cached={len(cached)}")
+        return result
+
+    def _remember_custom_urls(self, items: List[dict]) -> None:
+        # channels.list 응답의 customUrl(@handle)도 해석 캐시에 채워 둔다(추가 호출 없이 캐시가 데워짐).
+        self.channel_id_cache.put_many(
+            {item["snippet"]["customUrl"]: item["id"] for item in items if item.get("snippet", {}).get("customUrl")}
+        )
+
+    @staticmethod
+    def _parse_channel_identifier(identifier: str | None) -> tuple[str | None, str | None]:
+        """(바로 알 수 있는 채널 id, API 로 찾아야 하는 조회어) 중 하나를 채워 반환한다."""
+        ident = (identifier or "").strip()
+        if not ident:
+            return None, None
         if ident.startswith("UC"):
-            return ident
+            return ident, None
 
         parsed = urlparse(ident)
         if parsed.scheme and parsed.netloc:
             path = parsed.path or ""
             if "/channel/" in path:
-                return path.split("/channel/", 1)[1].split("/")[0]
+                return path.split("/channel/", 1)[1].split("/")[0], None
             if "/@" in path:
                 handle = path.split("/@", 1)[1].split("/")[0]
                 ident = f"@{handle}"
             else:
                 ident = path.strip("/").split("/")[0] or ident
+        return None, ident
 
-        if ident.startswith("@"):
-            query = ident
-        else:
-            query = ident
-
-        channel_id = self._search_channel_id(query)
-        if not channel_id:
-            raise ValueError("Channel not found from identifier")
-        return channel_id
+    def _lookup_channel_id(self, query: str) -> str | None:
+        # 핸들은 channels.list(forHandle, 1 unit)로 정확히 찾고, 없거나 이름이면 search.list(100 unit)로 찾는다.
+        if query.startswith("@"):
+            try:
+                response = self._execute(
+                    "channels.list", lambda service: service.channels().list(part="id", forHandle=query)
+                )
+            except HttpError as exc:
+                raise RuntimeError(f"YouTube channel handle lookup failed: {exc}") from exc
+            items = response.get("items", [])
+            if items:
+                return items[0]["id"]
+        return self._search_channel_id(query)
 
     def _search_channel_id(self, query: str) -> str | None:
         try:
-            response = (
-                self.service.search()
-                .list(part="id", type="channel", q=query, maxResults=1)
-                .execute()
+            response = self._execute(
+                "search.list",
+                lambda service: service.search()
+                .list(part="id", type="channel", q=query, maxResults=1),
             )
         except HttpError as exc:
             raise RuntimeError(f"YouTube channel search failed: {exc}") from exc
@@ -202,15 +352,80 @@ class YouTubeClient(PlatformClientPort):
             return None
         return items[0]["id"].get("channelId")
 
-    def _list_video_ids(self, channel_id: str, max_results: int) -> List[str]:
+    def _list_video_ids(
+        self, channel_id: str, max_results: int, published_after: datetime | None = None
+    ) -> List[str]:
+        """
+        채널의 최신 영상 id 를 최신순으로 최대 max_results 개 가져온다(published_after 이후 업로드만).
+        YOUTUBE_VIDEO_LISTING=playlist(기본)이면 업로드 재생목록(playlistItems.list, 페이지당 1 unit)을,
+        search 이면 search.list(페이지당 100 unit)를 쓴다. 업로드 재생목록이 없으면 search 로 대체한다.
+        """
+        if os.getenv("YOUTUBE_VIDEO_LISTING", "playlist").lower() == "playlist":
+            ids = self._list_upload_ids(channel_id, max_results, published_after)
+            if ids is not None:
+                return ids
+        return self._search_video_ids(channel_id, max_results, published_after)
+
+    def _list_upload_ids(
+        self, channel_id: str, max_results: int, published_after: datetime | None
+    ) -> List[str] | None:
+        # 채널의 업로드 재생목록 id 는 채널 id 의 접두어 UC 를 UU 로 바꾼 값이다(channels.list 호출 불필요).
+        if not channel_id.startswith("UC"):
+            return None
+        playlist_id = "UU" + channel_id[2:]
+        cutoff = self._to_utc(published_after)
+        ids: List[str] = []
+        page_token = None
+        while len(ids) < max_results:
+            try:
+                response = self._execute(
+                    "playlistItems.list",
+                    lambda service: service.playlistItems()
+                    .list(
+                        part="contentDetails",
+                        playlistId=playlist_id,
+                        maxResults=min(max_results - len(ids), 50),
+                        pageToken=page_token,
+                    ),
+                    conditional=True,
+                )
+            except HttpError as exc:
+                # 업로드 재생목록이 없는 채널(playlistNotFound)은 search 방식으로 대체한다.
+                if exc.resp.status == 404:
+                    return None
+                raise RuntimeError(f"YouTube playlist items fetch failed: {exc}") from exc
+
+            reached_cutoff = False
+            for item in response.get("items", []):
+                details = item.get("contentDetails", {})
+                published_at = self._to_utc(self._parse_datetime(details.get("videoPublishedAt")))
+                if cutoff is not None and published_at is not None and published_at < cutoff:
+                    # 업로드 재생목록은 최신순이므로 기준일보다 오래된 항목이 나오면 다음 페이지는 볼 필요가 없다.
+                    reached_cutoff = True
+                    continue
+                if details.get("videoId"):
+                    ids.append(details["videoId"])
+                    if len(ids) >= max_results:
+                        break
+
+            page_token = response.get("nextPageToken")
+            if reached_cutoff or not page_token:
+                break
+
+        return ids
+
+    def _search_video_ids(
+        self, channel_id: str, max_results: int, published_after: datetime | None
+    ) -> List[str]:
         ids: List[str] = []
         page_token = None
         remaining = max_results
         while remaining > 0:
             fetch_size = min(remaining, 50)
             try:
-                response = (
-                    self.service.search()
+                response = self._execute(
+                    "search.list",
+                    lambda service: service.search()
                     .list(
                         part="id",
                         channelId=channel_id,
@@ -218,8 +433,10 @@ class YouTubeClient(PlatformClientPort):
                         type="video",
                         order="date",
                         pageToken=page_token,
-                    )
-                    .execute()
+                        publishedAfter=(
+                            self._to_utc(published_after).strftime("%Y-%m-%dT%H:%M:%SZ") if published_after else None
+                        ),
+                    ),
                 )
             except HttpError as exc:
                 raise RuntimeError(f"YouTube search failed: {exc}") from exc
@@ -237,6 +454,51 @@ class YouTubeClient(PlatformClientPort):
 
         return ids
 
+    def _parse_channel(self, item: dict) -> Channel:
+        snippet = item["snippet"]
+        stats = item.get("statistics", {})
+        return Channel(
+            channel_id=item["id"],
+            platform=self.platform,
+            title=snippet.get("title", ""),
+            description=snippet.get("description"),
+            country=snippet.get("country"),
+            subscriber_count=int(stats.get("subscriberCount", 0)),
+            view_count=int(stats.get("viewCount", 0)),
+            video_count=int(stats.get("videoCount", 0)),
+            created_at=self._parse_datetime(snippet.get("publishedAt")),
+            not_modified=bool(item.get(_NOT_MODIFIED)),
+        )
+
+    def _parse_video(self, item: dict) -> Video:
+        snippet = item["snippet"]
+        stats = item.get("statistics", {})
+        content = item.get("contentDetails", {})
+        return Video(
+            video_id=item["id"],
+            channel_id=snippet["channelId"],
+            platform=self.platform,
+            title=snippet.get("title", ""),
+            description=snippet.get("description"),
+            tags=",".join(snippet.get("tags", [])) if snippet.get("tags") else None,
+            category_id=int(snippet.get("categoryId")) if snippet.get("categoryId") else None,
+            published_at=self._parse_datetime(snippet.get("publishedAt")),
+            duration=content.get("duration"),
+            view_count=int(stats.get("viewCount", 0)),
+            like_count=int(stats.get("likeCount", 0)) if stats.get("likeCount") else 0,
+            comment_count=int(stats.get("commentCount", 0)) if stats.get("commentCount") else 0,
+            thumbnail_url=(snippet.get("thumbnails", {}).get("high") or {}).get("url"),
+            not_modified=bool(item.get(_NOT_MODIFIED)),
+        )
+
+    @staticmethod
+    def _to_utc(value: datetime | None) -> datetime | None:
+        if value is None:
+            return None
+        if value.tzinfo is None:
+            return value.replace(tzinfo=timezone.utc)
+        return value.astimezone(timezone.utc)
+
     @staticmethod
     def _parse_datetime(value: str | None):
         if not value:
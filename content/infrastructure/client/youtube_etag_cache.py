@@ -0,0 +1,78 @@
+import hashlib
+import json
+import os
+import threading
+from typing import Optional
+from urllib.parse import parse_qsl, urlparse
+
+import redis
+
+# 같은 요청인지 판단할 때 빼는 쿼리 파라미터(키 풀의 어느 키로 보냈는지는 응답과 무관하다).
+_IGNORED_PARAMS = {"key", "alt", "prettyPrint", "quotaUser"}
+
+
+class ETagCache:
+    """
+    YouTube API 조건부 요청(If-None-Match)용 응답 캐시. 요청(메서드 + API 키를 뺀 쿼리)별로 ETag 와 응답 본문을
+    Redis 에 YOUTUBE_ETAG_CACHE_TTL_HOURS 동안 보관한다. YOUTUBE_ETAG_CACHE=false 이면 사용하지 않는다.
+    Redis 오류는 캐시 미스로 처리한다(요청은 조건 없이 그대로 보냄).
+    """
+
+    def __init__(
+        self,
+        client: Optional[redis.Redis] = None,
+        ttl_seconds: int | None = None,
+        key_prefix: str | None = None,
+        enabled: bool | None = None,
+    ):
+        self._client = client
+        self.ttl_seconds = ttl_seconds or int(float(os.getenv("YOUTUBE_ETAG_CACHE_TTL_HOURS", "72")) * 3600)
+        self.key_prefix = key_prefix or os.getenv("YOUTUBE_ETAG_CACHE_PREFIX", "yt:etag")
+        self.enabled = enabled if enabled is not None else os.getenv("YOUTUBE_ETAG_CACHE", "true").lower() == "true"
+
+    @property
+    def client(self) -> redis.Redis:
+        if self._client is None:
+            from config.redis_config import get_redis
+
+            self._client = get_redis()
+        return self._client
+
+    def request_key(self, method: str, uri: str) -> str:
+        params = sorted((k, v) for k, v in parse_qsl(urlparse(uri).query) if k not in _IGNORED_PARAMS)
+        digest = hashlib.sha1(json.dumps([method, params]).encode()).hexdigest()
+        return f"{self.key_prefix}:{method}:{digest}"
+
+    def get(self, key: str) -> dict | None:
+        """저장된 {"etag": ..., "payload": ...} 또는 None."""
+        try:
+            raw = self.client.get(key)
+        except redis.RedisError as exc:
+            print(f"[YOUTUBE-ETAG-CACHE] redis lookup failed: {exc}")
+            return None
+        return json.loads(raw) if raw else None
+
+    def put(self, key: str, etag: str, payload: dict) -> None:
+        try:
+            self.client.set(key, json.dumps({"etag": etag, "payload": payload}), ex=self.ttl_seconds)
+        except redis.RedisError as exc:
+            print(f"[YOUTUBE-ETAG-CACHE] redis store failed: {exc}")
+
+    def touch(self, key: str) -> None:
+        # 304 로 확인된 항목은 보관 기간을 연장한다.
+        try:
+            self.client.expire(key, self.ttl_seconds)
+        except redis.RedisError:
+            pass
+
+
+_cache: ETagCache | None = None
+_cache_lock = threading.Lock()
+
+
+def get_etag_cache() -> ETagCache:
+    global _cache
+    with _cache_lock:
+        if _cache is None:
+            _cache = ETagCache()
+        return _cache
@@ -0,0 +1,99 @@
+import hashlib
+import itertools
+import os
+import threading
+import time
+from dataclasses import dataclass
+from typing import Optional
+
+import redis
+
+from content.infrastructure.client.youtube_quota import QuotaExhaustedError, YouTubeQuotaGovernor, current_priority
+
+
+@dataclass
+class PooledKey:
+    key_id: str
+    api_key: str
+    quota: YouTubeQuotaGovernor
+
+
+class YouTubeKeyPool:
+    """
+    여러 API 키(GCP 프로젝트)의 쿼터를 합쳐 쓰는 키 풀. 키마다 YouTubeQuotaGovernor 로 쿼터를 따로 관리한다.
+    - acquire 는 키를 돌아가며 시도해 쿼터를 확보한 첫 키를 돌려준다(요청이 키들에 고르게 분산됨).
+      모든 키의 토큰이 모자라면 가장 빨리 차는 키를 기다리고, 모든 키가 한도를 넘었으면 QuotaExhaustedError.
+    - quotaExceeded 를 받은 키는 mark_exhausted 로 오늘 하루 빼고, 호출자는 다른 키로 다시 시도한다.
+    - Redis/로그에는 키 원문 대신 해시 앞 8자리(key_id)만 남긴다.
+    """
+
+    def __init__(
+        self,
+        api_keys: list[str],
+        client: Optional[redis.Redis] = None,
+        max_wait_seconds: float | None = None,
+        **governor_options,
+    ):
+        if not api_keys:
+            raise ValueError("YOUTUBE_API_KEY or YOUTUBE_API_KEYS is not configured")
+        self.keys: list[PooledKey] = []
+        for api_key in dict.fromkeys(api_keys):
+            key_id = hashlib.sha256(api_key.encode()).hexdigest()[:8]
+            quota = YouTubeQuotaGovernor(client=client, key_id=key_id, **governor_options)
+            self.keys.append(PooledKey(key_id, api_key, quota))
+        self.max_wait_seconds = (
+            max_wait_seconds if max_wait_seconds is not None else float(os.getenv("YOUTUBE_QUOTA_MAX_WAIT_SECONDS", "30"))
+        )
+        self._rotation = itertools.count()
+
+    def acquire(self, method: str, priority: str | None = None) -> PooledKey:
+        priority = priority or current_priority()
+        deadline = time.monotonic() + self.max_wait_seconds
+        while True:
+            start = next(self._rotation) % len(self.keys)
+            waits: list[int] = []
+            for key in self.keys[start:] + self.keys[:start]:
+                status, value = key.quota.try_acquire(method, priority)
+                if status == 1:
+                    return key
+                if status == 0:
+                    waits.append(value)
+            if not waits:
+                raise QuotaExhaustedError(
+                    f"YouTube daily quota exhausted on all {len(self.keys)} API key(s) for priority={priority}"
+                )
+            wait_seconds = min(waits) / 1000
+            if time.monotonic() + wait_seconds > deadline:
+                raise QuotaExhaustedError(
+                    f"YouTube quota token buckets empty on all API keys for priority={priority} "
+                    f"(method={method}, wait={wait_seconds:.1f}s)"
+                )
+            time.sleep(min(wait_seconds, 1.0))
+
+    def mark_exhausted(self, key: PooledKey) -> None:
+        key.quota.mark_exhausted()
+
+    def status(self) -> dict:
+        keys = [key.quota.status() for key in self.keys]
+        daily_limit = sum(status["daily_limit"] for status in keys)
+        spent = sum(status["spent"] for status in keys)
+        return {
+            "day": keys[0]["day"],
+            "daily_limit": daily_limit,
+            "spent": spent,
+            "remaining": max(daily_limit - spent, 0),
+            "keys": keys,
+        }
+
+
+_pools: dict[tuple[str, ...], YouTubeKeyPool] = {}
+_pools_lock = threading.Lock()
+
+
+def get_key_pool(api_keys: list[str]) -> YouTubeKeyPool:
+    """같은 키 목록이면 프로세스 안에서 하나의 풀을 공유한다."""
+    with _pools_lock:
+        pool = _pools.get(tuple(api_keys))
+        if pool is None:
+            pool = _pools[tuple(api_keys)] = YouTubeKeyPool(api_keys)
+        return pool
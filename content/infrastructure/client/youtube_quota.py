@@ -0,0 +1,316 @@
+import math
+import os
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar, copy_context
+from datetime import datetime, timedelta, timezone
+from typing import Iterable, Iterator, Optional, TypeVar
+
+import redis
+
+try:
+    from zoneinfo import ZoneInfo
+
+    _QUOTA_TZ = ZoneInfo("America/Los_Angeles")
+except Exception:  # pylint: disable=broad-except
+    # tz 데이터가 없는 환경에서는 태평양 표준시로 근사한다.
+    _QUOTA_TZ = timezone(timedelta(hours=-8))
+
+# YouTube Data API v3 메서드별 쿼터 비용(unit). 목록에 없는 메서드는 1 로 계산한다.
+METHOD_COSTS = {
+    "search.list": 100,
+    "videos.list": 1,
+    "channels.list": 1,
+    "playlistItems.list": 1,
+    "commentThreads.list": 1,
+}
+
+# 우선순위가 높은 순서. critical(트렌드 지표 갱신) > normal(API 요청 수집) > discovery(신규 탐색/태그 수집)
+PRIORITIES = ("critical", "normal", "discovery")
+
+# 토큰 버킷에서 우선순위별로 남겨 둬야 하는 토큰 비율. 토큰이 모자라면 낮은 우선순위부터 기다린다.
+_BURST_HEADROOM = {"critical": 0.0, "normal": 0.25, "discovery": 0.5}
+
+
+class QuotaExhaustedError(RuntimeError):
+    """일일 쿼터(또는 해당 우선순위 몫)를 다 썼거나, 토큰을 기다릴 수 있는 시간을 넘김."""
+
+
+class QuotaSpend:
+    """
+    quota_scope 블록 안에서 쓴 쿼터 누계. 바깥 scope 에도 함께 더해진다.
+    """
+
+    def __init__(self, name: str, priority: str, parent: Optional["QuotaSpend"] = None):
+        self.name = name
+        self.priority = priority
+        self.parent = parent
+        self.total = 0
+        self.by_method: dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def add(self, method: str, cost: int) -> None:
+        with self._lock:
+            self.total += cost
+            self.by_method[method] = self.by_method.get(method, 0) + cost
+        if self.parent is not None:
+            self.parent.add(method, cost)
+
+    def as_dict(self) -> dict:
+        return {"name": self.name, "priority": self.priority, "units": self.total, "by_method": dict(self.by_method)}
+
+
+_current_scope: ContextVar[Optional[QuotaSpend]] = ContextVar("youtube_quota_scope", default=None)
+
+
+_T = TypeVar("_T")
+
+
+def _new_spend(name: str, priority: str | None) -> QuotaSpend:
+    parent = _current_scope.get()
+    priority = priority or (parent.priority if parent else "normal")
+    if priority not in PRIORITIES:
+        raise ValueError(f"unknown quota priority: {priority}")
+    return QuotaSpend(name, priority, parent)
+
+
+@contextmanager
+def quota_scope(name: str, priority: str | None = None) -> Iterator[QuotaSpend]:
+    """
+    블록 안의 YouTube 호출에 우선순위를 지정하고 사용량을 모은다. priority 를 생략하면 바깥 scope 의 값(없으면 normal).
+    다른 스레드에서 실행되는 호출까지 집계하려면 contextvars.copy_context().run 으로 작업을 넘긴다.
+    """
+    spend = _new_spend(name, priority)
+    token = _current_scope.set(spend)
+    try:
+        yield spend
+    finally:
+        _current_scope.reset(token)
+
+
+def iterate_in_quota_scope(items: Iterable[_T], name: str, priority: str | None = None) -> Iterator[_T]:
+    """
+    제너레이터를 quota_scope 안에서 순회한다. StreamingResponse 처럼 next() 마다 다른 스레드/context 에서
+    재개되는 제너레이터에는 with quota_scope 를 걸 수 없으므로, 전용 Context 를 만들어 그 안에서만 진행시킨다.
+    """
+    iterator = iter(items)
+    context = copy_context()
+    context.run(lambda: _current_scope.set(_new_spend(name, priority)))
+    try:
+        while True:
+            try:
+                item = context.run(next, iterator)
+            except StopIteration:
+                return
+            yield item
+    finally:
+        close = getattr(iterator, "close", None)
+        if close is not None:
+            context.run(close)
+
+
+def current_priority() -> str:
+    scope = _current_scope.get()
+    return scope.priority if scope else "normal"
+
+
+# KEYS: spend(일자별 hash), bucket(hash)
+# ARGV: cost, priority_limit, capacity, refill_per_ms, headroom, now_ms, method, priority, ttl
+# 반환: {1, 오늘 사용량} 성공 / {0, 대기 ms} 토큰 부족 / {-1, 오늘 사용량} 일일 한도 초과
+_ACQUIRE_SCRIPT = """
+local cost = tonumber(ARGV[1])
+local spent = tonumber(redis.call('HGET', KEYS[1], 'total') or '0')
+if spent + cost > tonumber(ARGV[2]) then return {-1, spent} end
+local capacity = tonumber(ARGV[3])
+local refill = tonumber(ARGV[4])
+local now = tonumber(ARGV[6])
+local tokens = tonumber(redis.call('HGET', KEYS[2], 'tokens') or capacity)
+local ts = tonumber(redis.call('HGET', KEYS[2], 'ts') or now)
+tokens = math.min(capacity, tokens + math.max(now - ts, 0) * refill)
+local headroom = tonumber(ARGV[5])
+if tokens - cost < headroom then
+    redis.call('HSET', KEYS[2], 'tokens', tostring(tokens), 'ts', now)
+    return {0, math.ceil((cost + headroom - tokens) / refill)}
+end
+redis.call('HSET', KEYS[2], 'tokens', tostring(tokens - cost), 'ts', now)
+redis.call('HINCRBY', KEYS[1], 'total', cost)
+redis.call('HINCRBY', KEYS[1], 'method:' .. ARGV[7], cost)
+redis.call('HINCRBY', KEYS[1], 'priority:' .. ARGV[8], cost)
+redis.call('EXPIRE', KEYS[1], ARGV[9])
+return {1, spent + cost}
+"""
+
+
+class _LocalQuotaStore:
+    """Redis 에 접근할 수 없을 때 쓰는 프로세스 내 대체 저장소(_ACQUIRE_SCRIPT 와 같은 규칙)."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.spend: dict[str, dict[str, int]] = {}
+        self.tokens: float | None = None
+        self.ts: float | None = None
+
+    def acquire(self, day, cost, priority_limit, capacity, refill, headroom, now, method, priority):
+        with self._lock:
+            spend = self.spend.setdefault(day, {})
+            spent = spend.get("total", 0)
+            if spent + cost > priority_limit:
+                return -1, spent
+            tokens = capacity if self.tokens is None else self.tokens
+            ts = now if self.ts is None else self.ts
+            tokens = min(capacity, tokens + max(now - ts, 0) * refill)
+            self.ts = now
+            if tokens - cost < headroom:
+                self.tokens = tokens
+                return 0, math.ceil((cost + headroom - tokens) / refill)
+            self.tokens = tokens - cost
+            for field in ("total", f"method:{method}", f"priority:{priority}"):
+                spend[field] = spend.get(field, 0) + cost
+            return 1, spent + cost
+
+
+class YouTubeQuotaGovernor:
+    """
+    모든 YouTube 호출이 거쳐 가는 쿼터 관리자(프로세스 간 공유는 Redis).
+    - 일일 한도(YOUTUBE_DAILY_QUOTA)는 태평양 시간 자정 기준 일자별 누계로 관리한다.
+      normal/discovery 는 각각 YOUTUBE_QUOTA_RESERVE_CRITICAL, +YOUTUBE_QUOTA_RESERVE_NORMAL 비율만큼을
+      남겨 두고 멈추므로, 한도가 다 되어 가도 트렌드 지표 갱신(critical)은 계속 돌 수 있다.
+    - 토큰 버킷(용량 YOUTUBE_QUOTA_BURST, 하루 한도/86400 초당 충전)으로 한도를 하루에 고르게 나눠 쓴다.
+      토큰이 모자라면 낮은 우선순위일수록 더 많은 토큰을 남겨 둬야 하므로 높은 우선순위가 먼저 통과한다.
+    - 토큰을 YOUTUBE_QUOTA_MAX_WAIT_SECONDS 넘게 기다려야 하거나 한도를 넘으면 QuotaExhaustedError 를 던진다.
+    - Redis 오류 시에는 프로세스 내 저장소로 대신 계산한다.
+    """
+
+    def __init__(
+        self,
+        client: Optional[redis.Redis] = None,
+        daily_limit: int | None = None,
+        burst: int | None = None,
+        max_wait_seconds: float | None = None,
+        key_prefix: str | None = None,
+        key_id: str = "default",
+    ):
+        self._client = client
+        self.key_id = key_id
+        self.daily_limit = daily_limit or int(os.getenv("YOUTUBE_DAILY_QUOTA", "10000"))
+        self.burst = burst or int(os.getenv("YOUTUBE_QUOTA_BURST", str(max(self.daily_limit // 5, 100))))
+        self.max_wait_seconds = (
+            max_wait_seconds if max_wait_seconds is not None else float(os.getenv("YOUTUBE_QUOTA_MAX_WAIT_SECONDS", "30"))
+        )
+        # API 키(프로젝트)마다 쿼터가 따로이므로 키 식별자별로 누계/버킷을 나눈다.
+        self.key_prefix = f"{key_prefix or os.getenv('YOUTUBE_QUOTA_KEY_PREFIX', 'yt:quota')}:{key_id}"
+        reserve_critical = float(os.getenv("YOUTUBE_QUOTA_RESERVE_CRITICAL", "0.2"))
+        reserve_normal = float(os.getenv("YOUTUBE_QUOTA_RESERVE_NORMAL", "0.1"))
+        self.priority_limits = {
+            "critical": self.daily_limit,
+            "normal": int(self.daily_limit * (1 - reserve_critical)),
+            "discovery": int(self.daily_limit * (1 - reserve_critical - reserve_normal)),
+        }
+        self.refill_per_ms = self.daily_limit / 86_400_000
+        self._script = None
+        self._local = _LocalQuotaStore()
+
+    @property
+    def client(self) -> redis.Redis:
+        if self._client is None:
+            from config.redis_config import get_redis
+
+            self._client = get_redis()
+        return self._client
+
+    @staticmethod
+    def quota_day(now: datetime | None = None) -> str:
+        return (now or datetime.now(timezone.utc)).astimezone(_QUOTA_TZ).date().isoformat()
+
+    def _spend_key(self, day: str) -> str:
+        return f"{self.key_prefix}:spend:{day}"
+
+    def acquire(self, method: str, priority: str | None = None) -> int:
+        """
+        method 호출에 필요한 쿼터를 확보한다(필요하면 토큰이 찰 때까지 기다림). 확보한 unit 을 반환한다.
+        """
+        priority = priority or current_priority()
+        deadline = time.monotonic() + self.max_wait_seconds
+        while True:
+            status, value = self.try_acquire(method, priority)
+            if status == 1:
+                return value
+            if status == -1:
+                raise QuotaExhaustedError(
+                    f"YouTube daily quota exhausted for priority={priority} "
+                    f"(key={self.key_id}, spent={value}, limit={self.priority_limits[priority]})"
+                )
+            wait_seconds = value / 1000
+            if time.monotonic() + wait_seconds > deadline:
+                raise QuotaExhaustedError(
+                    f"YouTube quota token bucket empty for priority={priority} (method={method}, wait={wait_seconds:.1f}s)"
+                )
+            time.sleep(min(wait_seconds, 1.0))
+
+    def try_acquire(self, method: str, priority: str | None = None) -> tuple[int, int]:
+        """
+        기다리지 않고 한 번만 시도한다. 반환: (1, 확보한 unit) / (0, 토큰이 찰 때까지 대기 ms) / (-1, 오늘 사용량).
+        """
+        priority = priority or current_priority()
+        cost = METHOD_COSTS.get(method, 1)
+        # 버킷 용량보다 큰 여유분을 요구하면 영원히 통과하지 못하므로 용량 안으로 줄인다.
+        headroom = min(self.burst * _BURST_HEADROOM[priority], max(self.burst - cost, 0))
+        status, value = self._try_acquire(self.quota_day(), cost, priority, headroom, method)
+        if status != 1:
+            return status, value
+        scope = _current_scope.get()
+        if scope is not None:
+            scope.add(method, cost)
+        return 1, cost
+
+    def _try_acquire(self, day: str, cost: int, priority: str, headroom: float, method: str) -> tuple[int, int]:
+        now_ms = int(time.time() * 1000)
+        args = [
+            cost, self.priority_limits[priority], self.burst, self.refill_per_ms, headroom, now_ms, method, priority,
+            2 * 86400,
+        ]
+        try:
+            if self._script is None:
+                self._script = self.client.register_script(_ACQUIRE_SCRIPT)
+            status, value = self._script(keys=[self._spend_key(day), f"{self.key_prefix}:bucket"], args=args)
+            return int(status), int(value)
+        except redis.RedisError as exc:
+            print(f"[YOUTUBE-QUOTA] redis unavailable, using in-process accounting: {exc}")
+            return self._local.acquire(
+                day, cost, self.priority_limits[priority], self.burst, self.refill_per_ms, headroom, now_ms, method,
+                priority,
+            )
+
+    def mark_exhausted(self) -> None:
+        """API 가 quotaExceeded 를 돌려주면 오늘 누계를 한도로 올려 모든 프로세스가 더 호출하지 않게 한다."""
+        day = self.quota_day()
+        print(f"[YOUTUBE-QUOTA] API reported quotaExceeded | key={self.key_id}, day={day}")
+        try:
+            key = self._spend_key(day)
+            spent = int(self.client.hget(key, "total") or 0)
+            if spent < self.daily_limit:
+                self.client.hincrby(key, "total", self.daily_limit - spent)
+                self.client.expire(key, 2 * 86400)
+        except redis.RedisError:
+            spend = self._local.spend.setdefault(day, {})
+            spend["total"] = max(spend.get("total", 0), self.daily_limit)
+
+    def status(self) -> dict:
+        day = self.quota_day()
+        try:
+            raw = self.client.hgetall(self._spend_key(day))
+        except redis.RedisError:
+            raw = self._local.spend.get(day, {})
+        spent = int(raw.get("total", 0))
+        return {
+            "key": self.key_id,
+            "day": day,
+            "daily_limit": self.daily_limit,
+            "spent": spent,
+            "remaining": max(self.daily_limit - spent, 0),
+            "priority_limits": self.priority_limits,
+            "by_method": {k.split(":", 1)[1]: int(v) for k, v in raw.items() if k.startswith("method:")},
+            "by_priority": {k.split(":", 1)[1]: int(v) for k, v in raw.items() if k.startswith("priority:")},
+        }
+
@@ -0,0 +1,85 @@
+import contextvars
+import os
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Callable, Iterable
+
+# videos.list 의 id 파라미터 최대 개수
+MAX_IDS_PER_REQUEST = 50
+
+
+class VideoListBatcher:
+    """
+    여러 호출자(채널/스레드)가 요청한 영상 id 를 모아 videos.list 50개 단위 요청으로 묶는 배처.
+    - submit 은 id 별 Future 를 돌려준다. 결과는 API item(dict) 이고, 존재하지 않는 영상이면 None.
+    - 대기 id 가 50개가 되면 즉시, 아니면 linger 시간(YOUTUBE_VIDEOS_LINGER_MS) 뒤에 요청을 보낸다.
+      그 사이 다른 호출자가 넣은 id 도 같은 요청에 합쳐진다.
+    - 묶인 요청은 YOUTUBE_VIDEOS_CONCURRENCY 개 스레드에서 동시에 실행된다.
+    - 같은 id 를 여러 호출자가 기다리면 한 번만 조회해 모두에게 같은 결과를 준다.
+    - 묶인 요청은 첫 id 를 넣은 호출자의 context 에서 실행된다(쿼터 우선순위/사용량 집계가 호출자를 따라간다).
+    """
+
+    def __init__(
+        self,
+        fetch_chunk: Callable[[list[str]], Iterable[dict]],
+        max_concurrency: int | None = None,
+        linger_seconds: float | None = None,
+    ):
+        self.fetch_chunk = fetch_chunk
+        self.max_concurrency = max(max_concurrency or int(os.getenv("YOUTUBE_VIDEOS_CONCURRENCY", "4")), 1)
+        self.linger_seconds = (
+            linger_seconds if linger_seconds is not None else float(os.getenv("YOUTUBE_VIDEOS_LINGER_MS", "20")) / 1000
+        )
+        self._pending: dict[str, list[Future]] = {}
+        self._contexts: dict[str, contextvars.Context] = {}
+        self._lock = threading.Lock()
+        self._timer: threading.Timer | None = None
+        self._executor: ThreadPoolExecutor | None = None
+
+    def submit(self, video_ids: Iterable[str]) -> list[Future]:
+        futures: list[Future] = []
+        context = contextvars.copy_context()
+        with self._lock:
+            for video_id in video_ids:
+                future: Future = Future()
+                self._contexts.setdefault(video_id, context)
+                self._pending.setdefault(video_id, []).append(future)
+                futures.append(future)
+            while len(self._pending) >= MAX_IDS_PER_REQUEST:
+                self._dispatch_locked(MAX_IDS_PER_REQUEST)
+            if self._pending and self._timer is None:
+                if self.linger_seconds <= 0:
+                    self._dispatch_locked(len(self._pending))
+                else:
+                    self._timer = threading.Timer(self.linger_seconds, self.flush)
+                    self._timer.daemon = True
+                    self._timer.start()
+        return futures
+
+    def flush(self) -> None:
+        """대기 중인 id 를 모두 요청으로 보낸다."""
+        with self._lock:
+            self._timer = None
+            while self._pending:
+                self._dispatch_locked(MAX_IDS_PER_REQUEST)
+
+    def _dispatch_locked(self, size: int) -> None:
+        video_ids = list(self._pending)[:size]
+        chunk = {video_id: self._pending.pop(video_id) for video_id in video_ids}
+        contexts = [self._contexts.pop(video_id) for video_id in video_ids]
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=self.max_concurrency, thread_name_prefix="yt-videos")
+        # 같은 Context 는 여러 스레드에서 동시에 run 할 수 없으므로 요청마다 복사본을 쓴다.
+        self._executor.submit(contexts[0].copy().run, self._execute, chunk)
+
+    def _execute(self, chunk: dict[str, list[Future]]) -> None:
+        try:
+            items = {item["id"]: item for item in self.fetch_chunk(list(chunk))}
+        except BaseException as exc:  # pylint: disable=broad-except
+            for waiters in chunk.values():
+                for future in waiters:
+                    future.set_exception(exc)
+            return
+        for video_id, waiters in chunk.items():
+            for future in waiters:
+                future.set_result(items.get(video_id))
@@ -1,7 +1,22 @@
 from datetime import datetime, date
-from sqlalchemy import Column, String, Text, BigInteger, Integer, DateTime, Date, DECIMAL, PrimaryKeyConstraint, text
-
-from config.database.session import Base
+from sqlalchemy import (
+    Column,
+    Computed,
+    String,
+    Text,
+    BigInteger,
+    Integer,
+    DateTime,
+    Date,
+    DECIMAL,
+    Index,
+    PrimaryKeyConstraint,
+    text,
+)
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.schema import CreateIndex
+
+from config.database.session import Base, SCHEMA_UPGRADES
 
 
 class ChannelORM(Base):
@@ -37,6 +52,10 @@ class CreatorAccountORM(Base):
 
 class VideoORM(Base):
     __tablename__ = "video"
+    __table_args__ = (
+        # 트렌드 집계/백필/추천의 "활동일 범위 + 플랫폼" 필터용.
+        Index("ix_video_activity_date", "activity_date", "platform"),
+    )
 
     video_id = Column(String(100), primary_key=True)
     channel_id = Column(String(100))
@@ -52,6 +71,8 @@ class VideoORM(Base):
     comment_count = Column(BigInteger)
     thumbnail_url = Column(String(500))
     crawled_at = Column(DateTime, default=datetime.utcnow)
+    # 게시일(없으면 수집일). 기간 필터가 식 대신 이 컬럼으로 인덱스 범위 스캔을 하도록 저장형 생성 컬럼으로 둔다.
+    activity_date = Column(Date, Computed("COALESCE(published_at::date, crawled_at::date)", persisted=True))
 
 
 class VideoCommentORM(Base):
@@ -68,6 +89,9 @@ class VideoCommentORM(Base):
 
 class VideoSentimentORM(Base):
     __tablename__ = "video_sentiment"
+    __table_args__ = (
+        Index("ix_video_sentiment_category", "category", "video_id"),
+    )
 
     video_id = Column(String(100), primary_key=True)
     platform = Column(String(50), default="youtube")
@@ -92,6 +116,10 @@ class CommentSentimentORM(Base):
 
 class KeywordTrendORM(Base):
     __tablename__ = "keyword_trend"
+    __table_args__ = (
+        # 특정 일자의 플랫폼별 랭킹 조회/재랭킹용.
+        Index("ix_keyword_trend_date_platform_rank", "date", "platform", "rank"),
+    )
 
     keyword = Column(String(100), primary_key=True)
     date = Column(Date, primary_key=True)
@@ -105,10 +133,16 @@ class KeywordTrendORM(Base):
     avg_total_score = Column(DECIMAL(6, 3))
     growth_rate = Column(DECIMAL(18, 4))
     rank = Column(Integer)
+    view_velocity = Column(DECIMAL(20, 4))
 
 
 class CategoryTrendORM(Base):
     __tablename__ = "category_trend"
+    __table_args__ = (
+        Index("ix_category_trend_date_platform_rank", "date", "platform", "rank"),
+        # 카테고리별 최신 집계 일자(MAX(date) GROUP BY category, platform) 조회용.
+        Index("ix_category_trend_latest", "platform", "category", text("date DESC")),
+    )
 
     category = Column(String(100), primary_key=True)
     date = Column(Date, primary_key=True)
@@ -122,12 +156,14 @@ class CategoryTrendORM(Base):
     search_volume_prev = Column(BigInteger)
     growth_rate = Column(DECIMAL(18, 4))
     rank = Column(Integer)
+    view_velocity = Column(DECIMAL(20, 4))
 
 
 class KeywordMappingORM(Base):
     __tablename__ = "keyword_mapping"
     __table_args__ = (
         PrimaryKeyConstraint("video_id", "keyword", "platform", name="pk_keyword_mapping"),
+        Index("ix_keyword_mapping_keyword", "keyword", "video_id"),
     )
 
     # 서버 기본값(nextval)로 채워지도록 server_default 지정, 애플리케이션에서는 직접 값 지정하지 않는다.
@@ -141,6 +177,8 @@ class KeywordMappingORM(Base):
     platform = Column(String(50), default="youtube")
     keyword = Column(String(100))
     weight = Column(DECIMAL(5, 4))
+    # 증분 트렌드 집계가 키워드 재매핑을 변경으로 인식하는 기준 시각
+    updated_at = Column(DateTime, default=datetime.utcnow)
 
 
 class VideoScoreORM(Base):
@@ -167,9 +205,16 @@ class CrawlLogORM(Base):
 
 
 class VideoMetricsSnapshotORM(Base):
+    """
+    snapshot_date 기준 월별 RANGE 파티션 테이블(video_metrics_snapshot_YYYYMM).
+    파티션 생성/보관 주기는 SnapshotPartitionRepository 가 관리한다.
+    """
     __tablename__ = "video_metrics_snapshot"
     __table_args__ = (
         PrimaryKeyConstraint("video_id", "snapshot_date", "platform", name="pk_video_metrics_snapshot"),
+        # "기준일 이전 최신 스냅샷" LATERAL 조회(ORDER BY snapshot_date DESC LIMIT 1)용. 파티션마다 자동 생성된다.
+        Index("ix_video_metrics_snapshot_latest", "video_id", "platform", text("snapshot_date DESC")),
+        {"postgresql_partition_by": "RANGE (snapshot_date)"},
     )
 
     video_id = Column(String(100))
@@ -178,3 +223,180 @@ class VideoMetricsSnapshotORM(Base):
     view_count = Column(BigInteger)
     like_count = Column(BigInteger)
     comment_count = Column(BigInteger)
+    # 값이 실제로 바뀐 시각(UTC). 증분 트렌드 집계의 변경 감지 기준으로 사용한다.
+    captured_at = Column(DateTime, server_default=text("(now() AT TIME ZONE 'utc')"))
+
+
+class VideoVelocityORM(Base):
+    """
+    트렌드 배치의 video_velocity 단계 결과. (as_of, velocity_days) 기준 영상별 현재/기준점 지표와 속도를 보관한다.
+    """
+    __tablename__ = "video_velocity"
+    __table_args__ = (
+        PrimaryKeyConstraint("as_of", "velocity_days", "video_id", "platform", name="pk_video_velocity"),
+    )
+
+    as_of = Column(Date)
+    velocity_days = Column(Integer)
+    video_id = Column(String(100))
+    platform = Column(String(50), default="youtube")
+    view_count = Column(BigInteger)
+    like_count = Column(BigInteger)
+    comment_count = Column(BigInteger)
+    anchor_view_count = Column(BigInteger)
+    anchor_like_count = Column(BigInteger)
+    anchor_comment_count = Column(BigInteger)
+    view_velocity = Column(DECIMAL(20, 4))
+    like_velocity = Column(DECIMAL(20, 4))
+    comment_velocity = Column(DECIMAL(20, 4))
+    computed_at = Column(DateTime, default=datetime.utcnow)
+
+
+class TrendWatermarkORM(Base):
+    """
+    증분 트렌드 집계용 워터마크. 마지막 성공 집계 시각과 당시 집계 조건을 보관한다.
+    """
+    __tablename__ = "trend_watermark"
+
+    job_name = Column(String(100), primary_key=True)
+    platform = Column(String(50), primary_key=True)
+    as_of = Column(Date)
+    window_days = Column(Integer)
+    velocity_days = Column(Integer)
+    watermark = Column(DateTime)
+    updated_at = Column(DateTime, default=datetime.utcnow)
+
+
+class TrendVideoKeyORM(Base):
+    """
+    증분 트렌드 집계용. 마지막 집계 때 영상이 기여한 키워드/카테고리(key_type)를 보관해,
+    영상이 바뀌면 이전 키의 트렌드 행도 함께 재계산한다(분석 결과로 카테고리가 바뀐 경우 등).
+    """
+    __tablename__ = "trend_video_key"
+    __table_args__ = (
+        PrimaryKeyConstraint("video_id", "platform", "key_type", "group_key", name="pk_trend_video_key"),
+    )
+
+    video_id = Column(String(100))
+    platform = Column(String(50))
+    key_type = Column(String(20))
+    group_key = Column(String(100))
+
+
+class KeywordDailyFactORM(Base):
+    """
+    (date, platform, keyword) 단위 일별 합계. date 는 영상 게시일(없으면 수집일)이며,
+    임의 기간 트렌드는 이 테이블의 범위 합으로 계산한다.
+    """
+    __tablename__ = "keyword_daily_fact"
+    __table_args__ = (
+        PrimaryKeyConstraint("date", "platform", "keyword", name="pk_keyword_daily_fact"),
+    )
+
+    date = Column(Date)
+    platform = Column(String(50))
+    keyword = Column(String(100))
+    video_count = Column(Integer)
+    view_sum = Column(BigInteger)
+    like_sum = Column(BigInteger)
+    comment_sum = Column(BigInteger)
+    view_velocity_sum = Column(DECIMAL(20, 4))
+    like_velocity_sum = Column(DECIMAL(20, 4))
+    comment_velocity_sum = Column(DECIMAL(20, 4))
+    sentiment_sum = Column(DECIMAL(18, 4))
+    trend_sum = Column(DECIMAL(18, 4))
+    total_score_sum = Column(DECIMAL(18, 3))
+    computed_at = Column(DateTime, default=datetime.utcnow)
+
+
+class CategoryDailyFactORM(Base):
+    """
+    (date, platform, category) 단위 일별 합계. KeywordDailyFactORM 과 동일한 규칙을 따른다.
+    """
+    __tablename__ = "category_daily_fact"
+    __table_args__ = (
+        PrimaryKeyConstraint("date", "platform", "category", name="pk_category_daily_fact"),
+    )
+
+    date = Column(Date)
+    platform = Column(String(50))
+    category = Column(String(100))
+    video_count = Column(Integer)
+    view_sum = Column(BigInteger)
+    like_sum = Column(BigInteger)
+    comment_sum = Column(BigInteger)
+    view_velocity_sum = Column(DECIMAL(20, 4))
+    like_velocity_sum = Column(DECIMAL(20, 4))
+    comment_velocity_sum = Column(DECIMAL(20, 4))
+    sentiment_sum = Column(DECIMAL(18, 4))
+    trend_sum = Column(DECIMAL(18, 4))
+    total_score_sum = Column(DECIMAL(18, 3))
+    computed_at = Column(DateTime, default=datetime.utcnow)
+
+
+class BatchRunORM(Base):
+    """
+    배치 실행 이력. 실행 단위로 시작/종료 시각, 소요 시간, 결과를 남긴다.
+    """
+    __tablename__ = "batch_run"
+
+    id = Column(BigInteger, primary_key=True, autoincrement=True)
+    job_name = Column(String(100))
+    status = Column(String(20))
+    started_at = Column(DateTime)
+    finished_at = Column(DateTime)
+    duration_ms = Column(Integer)
+    message = Column(Text)
+    quota_units = Column(Integer)
+
+
+SCHEMA_UPGRADES.extend(
+    [
+        "ALTER TABLE keyword_trend ADD COLUMN IF NOT EXISTS view_velocity DECIMAL(20,4)",
+        "ALTER TABLE category_trend ADD COLUMN IF NOT EXISTS view_velocity DECIMAL(20,4)",
+        "ALTER TABLE video_metrics_snapshot ADD COLUMN IF NOT EXISTS captured_at TIMESTAMP DEFAULT (now() AT TIME ZONE 'utc')",
+        "ALTER TABLE keyword_mapping ADD COLUMN IF NOT EXISTS updated_at TIMESTAMP",
+        "ALTER TABLE batch_run ADD COLUMN IF NOT EXISTS quota_units INTEGER",
+        # video.activity_date 추가는 테이블 전체를 다시 쓰므로 기동 시 하지 않는다. 없으면 마이그레이션을 안내하며 멈춘다.
+        """
+        DO $$
+        BEGIN
+            IF NOT EXISTS (
+                SELECT 1
+                FROM information_schema.columns
+                WHERE table_schema = current_schema()
+                  AND table_name = 'video'
+                  AND column_name = 'activity_date'
+            ) THEN
+                RAISE EXCEPTION 'video.activity_date is missing; run: python -m app.tools.migrate_video_activity_date';
+            END IF;
+        END $$;
+        """,
+        # 미리 만들어 둔 월 파티션 범위를 벗어난 날짜도 적재가 실패하지 않도록 DEFAULT 파티션을 둔다.
+        # 파티션 도입 이전의 일반 테이블은 기동 시 옮기지 않는다(SnapshotPartitionRepository.migrate_unpartitioned 로 명시 실행).
+        """
+        DO $$
+        BEGIN
+            IF EXISTS (
+                SELECT 1
+                FROM pg_class c
+                JOIN pg_namespace n ON n.oid = c.relnamespace
+                WHERE c.relname = 'video_metrics_snapshot'
+                  AND n.nspname = current_schema()
+                  AND c.relkind = 'p'
+            ) THEN
+                CREATE TABLE IF NOT EXISTS video_metrics_snapshot_default PARTITION OF video_metrics_snapshot DEFAULT;
+            END IF;
+        END $$;
+        """,
+    ]
+)
+
+
+# 한국어 주석: create_all 은 기존 테이블에 인덱스를 추가하지 않으므로, ORM 에 선언된 인덱스를
+# CREATE INDEX IF NOT EXISTS 로 변환해 기동 시 함께 적용한다(인덱스 정의는 ORM 한 곳에서만 관리).
+SCHEMA_UPGRADES.extend(
+    str(CreateIndex(index, if_not_exists=True).compile(dialect=postgresql.dialect()))
+    for table in Base.metadata.sorted_tables
+    for index in sorted(table.indexes, key=lambda i: i.name)
+)
@@ -0,0 +1,311 @@
+import json
+import os
+import time
+import uuid
+import zlib
+from dataclasses import dataclass
+from typing import Callable, Iterable, Optional
+
+import redis
+
+# 작업 종료 처리(성공/최종 실패) 공통 로직. 항목 상태 기록 -> 중복 방지 키 해제 -> 배치 집계/결과 목록 추가 -> TTL 설정.
+# 대기/실행 중에 다른 배치가 같은 dedupe_key 로 합쳐 들어왔으면(watchers) 그 배치들에도 같은 결과를 남긴다.
+_FINISH_LUA = """
+local function record(prefix, batch_id, id, status, body, f, ttl)
+    local batch = prefix .. ':batch:' .. batch_id
+    redis.call('HINCRBY', batch, status, 1)
+    redis.call('RPUSH', batch .. ':results', cjson.encode({
+        item_id = id, status = status, body = body, attempts = tonumber(f[3]), worker = f[4], payload = f[5]
+    }))
+    redis.call('EXPIRE', batch, ttl)
+    redis.call('EXPIRE', batch .. ':results', ttl)
+end
+
+local function finish(prefix, id, status, body, ttl)
+    local item = prefix .. ':item:' .. id
+    local f = redis.call('HMGET', item, 'batch_id', 'dedupe_key', 'attempts', 'worker', 'payload')
+    local field = 'error'
+    if status == 'succeeded' then field = 'result' end
+    redis.call('HSET', item, 'status', status, 'token', '', field, body)
+    if f[2] and redis.call('HGET', prefix .. ':inflight', f[2]) == id then
+        redis.call('HDEL', prefix .. ':inflight', f[2])
+    end
+    if f[1] and f[1] ~= '' then
+        record(prefix, f[1], id, status, body, f, ttl)
+    end
+    for _, watcher in ipairs(redis.call('SMEMBERS', item .. ':watchers')) do
+        record(prefix, watcher, id, status, body, f, ttl)
+    end
+    redis.call('DEL', item .. ':watchers')
+    redis.call('EXPIRE', item, ttl)
+end
+"""
+
+# ARGV: prefix, shard, item_id, payload, dedupe_key, batch_id, now_ms, ttl
+# 같은 dedupe_key 항목이 대기/실행 중이면 새로 넣지 않고, 그 항목을 이 배치의 대기 대상(watchers)으로 등록해
+# 배치 total 에 포함시킨다. 끝날 때 finish 가 이 배치에도 결과를 남기므로 생산자는 합쳐진 항목까지 기다릴 수 있다.
+_ENQUEUE_SCRIPT = """
+local prefix = ARGV[1]
+local inflight = prefix .. ':inflight'
+local batch = prefix .. ':batch:' .. ARGV[6]
+if ARGV[5] ~= '' then
+    local existing = redis.call('HGET', inflight, ARGV[5])
+    if existing then
+        local watchers = prefix .. ':item:' .. existing .. ':watchers'
+        redis.call('SADD', watchers, ARGV[6])
+        redis.call('EXPIRE', watchers, ARGV[8])
+        redis.call('HINCRBY', batch, 'total', 1)
+        redis.call('HINCRBY', batch, 'coalesced', 1)
+        redis.call('EXPIRE', batch, ARGV[8])
+        return existing
+    end
+    redis.call('HSET', inflight, ARGV[5], ARGV[3])
+end
+local item = prefix .. ':item:' .. ARGV[3]
+redis.call('HSET', item, 'payload', ARGV[4], 'shard', ARGV[2], 'dedupe_key', ARGV[5], 'batch_id', ARGV[6],
+    'attempts', 0, 'status', 'queued', 'enqueued_at', ARGV[7])
+redis.call('LPUSH', prefix .. ':pending:' .. ARGV[2], ARGV[3])
+redis.call('HINCRBY', batch, 'total', 1)
+redis.call('EXPIRE', batch, ARGV[8])
+return ARGV[3]
+"""
+
+# KEYS: pending, processing / ARGV: prefix, now_ms, visibility_ms, token, worker, max_attempts, ttl
+# 가시성 제한 시간이 지난 항목(워커 종료/재시도 대기 만료)을 먼저 대기열로 되돌린 뒤 하나를 꺼낸다.
+_CLAIM_SCRIPT = _FINISH_LUA + """
+local prefix = ARGV[1]
+local now = tonumber(ARGV[2])
+local expired = redis.call('ZRANGEBYSCORE', KEYS[2], '-inf', now, 'LIMIT', 0, 100)
+for _, id in ipairs(expired) do
+    redis.call('ZREM', KEYS[2], id)
+    local item = prefix .. ':item:' .. id
+    local attempts = tonumber(redis.call('HGET', item, 'attempts') or '0')
+    if redis.call('HGET', item, 'status') == 'running' and attempts >= tonumber(ARGV[6]) then
+        finish(prefix, id, 'dead', 'visibility timeout exceeded', ARGV[7])
+    else
+        redis.call('HSET', item, 'status', 'queued', 'token', '')
+        redis.call('LPUSH', KEYS[1], id)
+    end
+end
+local id = redis.call('RPOP', KEYS[1])
+if not id then return false end
+local item = prefix .. ':item:' .. id
+local attempts = redis.call('HINCRBY', item, 'attempts', 1)
+redis.call('ZADD', KEYS[2], now + tonumber(ARGV[3]), id)
+redis.call('HSET', item, 'status', 'running', 'token', ARGV[4], 'worker', ARGV[5], 'claimed_at', ARGV[2])
+return {id, redis.call('HGET', item, 'payload'), attempts}
+"""
+
+# KEYS: processing / ARGV: prefix, item_id, token, deadline_ms
+_EXTEND_SCRIPT = """
+if redis.call('HGET', ARGV[1] .. ':item:' .. ARGV[2], 'token') ~= ARGV[3] then return 0 end
+redis.call('ZADD', KEYS[1], ARGV[4], ARGV[2])
+return 1
+"""
+
+# KEYS: processing / ARGV: prefix, item_id, token, status, body, ttl
+_ACK_SCRIPT = _FINISH_LUA + """
+if redis.call('HGET', ARGV[1] .. ':item:' .. ARGV[2], 'token') ~= ARGV[3] then return 0 end
+redis.call('ZREM', KEYS[1], ARGV[2])
+finish(ARGV[1], ARGV[2], ARGV[4], ARGV[5], ARGV[6])
+return 1
+"""
+
+# KEYS: processing / ARGV: prefix, item_id, token, error, retry_at_ms
+# 재시도는 processing 에 retry_at 을 마감 시각으로 남겨 두면 claim 의 만료 처리에서 대기열로 돌아간다.
+_RETRY_SCRIPT = """
+local item = ARGV[1] .. ':item:' .. ARGV[2]
+if redis.call('HGET', item, 'token') ~= ARGV[3] then return 0 end
+redis.call('HSET', item, 'status', 'retry_wait', 'token', '', 'error', ARGV[4])
+redis.call('ZADD', KEYS[1], ARGV[5], ARGV[2])
+return 1
+"""
+
+
+@dataclass
+class WorkItem:
+    item_id: str
+    shard: int
+    payload: dict
+    attempts: int
+    token: str
+
+
+class RedisWorkQueue:
+    """
+    Redis 기반 작업 큐(여러 노드의 워커 프로세스가 공유).
+    - 항목은 dedupe_key 의 crc32 로 INGESTION_WORK_QUEUE_SHARDS 개 샤드 중 하나에 들어가고,
+      워커는 담당 샤드를 돌아가며 꺼낸다(--shards 로 일부 샤드만 맡길 수 있음).
+    - 꺼낸 항목은 processing ZSET 에 가시성 마감 시각과 함께 남는다. 워커가 죽어 마감이 지나면
+      다음 claim 에서 대기열로 되돌아가고, 시도 횟수가 INGESTION_WORK_QUEUE_MAX_ATTEMPTS 에 닿으면 dead 로 끝난다.
+    - ack/fail/extend 는 claim 때 받은 token 이 일치할 때만 반영되어, 마감이 지난 늦은 워커의 결과는 무시된다.
+    - 같은 dedupe_key 항목이 대기/실행 중이면 새로 넣지 않고 기존 항목을 이 배치에서도 기다린다
+      (배치 total 에 포함되고, 끝나면 원래 배치와 합쳐 들어온 배치 모두에 결과가 남는다).
+    - 항목별 결과는 배치(batch_id) 단위 결과 목록에 쌓여 생산자가 batch_status 로 확인한다.
+    """
+
+    def __init__(
+        self,
+        client: Optional[redis.Redis] = None,
+        prefix: Optional[str] = None,
+        shards: Optional[int] = None,
+        visibility_timeout_seconds: Optional[float] = None,
+        max_attempts: Optional[int] = None,
+        retry_backoff_seconds: Optional[float] = None,
+        result_ttl_seconds: Optional[int] = None,
+    ):
+        if client is None:
+            from config.redis_config import get_redis
+
+            client = get_redis()
+        self.client = client
+        self.prefix = prefix or os.getenv("INGESTION_WORK_QUEUE_PREFIX", "ingest:wq")
+        self.shards = max(shards or int(os.getenv("INGESTION_WORK_QUEUE_SHARDS", "4")), 1)
+        self.visibility_ms = int(
+            float(visibility_timeout_seconds or os.getenv("INGESTION_WORK_QUEUE_VISIBILITY_SECONDS", "300")) * 1000
+        )
+        self.max_attempts = max(max_attempts or int(os.getenv("INGESTION_WORK_QUEUE_MAX_ATTEMPTS", "3")), 1)
+        self.retry_backoff_ms = int(
+            float(retry_backoff_seconds or os.getenv("INGESTION_WORK_QUEUE_RETRY_BACKOFF_SECONDS", "30")) * 1000
+        )
+        self.result_ttl_seconds = result_ttl_seconds or int(
+            os.getenv("INGESTION_WORK_QUEUE_RESULT_TTL_SECONDS", str(7 * 24 * 3600))
+        )
+        self._enqueue = self.client.register_script(_ENQUEUE_SCRIPT)
+        self._claim = self.client.register_script(_CLAIM_SCRIPT)
+        self._extend = self.client.register_script(_EXTEND_SCRIPT)
+        self._ack = self.client.register_script(_ACK_SCRIPT)
+        self._retry = self.client.register_script(_RETRY_SCRIPT)
+
+    def _pending_key(self, shard: int) -> str:
+        return f"{self.prefix}:pending:{shard}"
+
+    def _processing_key(self, shard: int) -> str:
+        return f"{self.prefix}:processing:{shard}"
+
+    def shard_for(self, key: str) -> int:
+        return zlib.crc32(key.encode("utf-8")) % self.shards
+
+    def enqueue(self, payloads: Iterable[dict], dedupe_key: Callable[[dict], str] | None = None) -> dict:
+        """
+        payload 들을 한 배치로 넣는다. 반환: {"batch_id", "enqueued": [item_id...], "coalesced": {dedupe_key: 기존 item_id}}
+        """
+        batch_id = uuid.uuid4().hex
+        now_ms = int(time.time() * 1000)
+        entries = []
+        pipe = self.client.pipeline(transaction=False)
+        for payload in payloads:
+            key = dedupe_key(payload) if dedupe_key else ""
+            item_id = uuid.uuid4().hex
+            shard = self.shard_for(key or item_id)
+            entries.append((key, item_id))
+            self._enqueue(
+                keys=[],
+                args=[
+                    self.prefix, shard, item_id, json.dumps(payload, ensure_ascii=False), key, batch_id, now_ms,
+                    self.result_ttl_seconds,
+                ],
+                client=pipe,
+            )
+        enqueued: list[str] = []
+        coalesced: dict[str, str] = {}
+        for (key, item_id), returned in zip(entries, pipe.execute()):
+            if returned == item_id:
+                enqueued.append(item_id)
+            else:
+                coalesced[key] = returned
+        print(
+            f"[WORK-QUEUE] enqueued | batch_id={batch_id}, enqueued={len(enqueued)}, coalesced={len(coalesced)}"
+        )
+        return {"batch_id": batch_id, "enqueued": enqueued, "coalesced": coalesced}
+
+    def claim(self, worker_id: str, shards: Iterable[int] | None = None) -> WorkItem | None:
+        """
+        담당 샤드를 순서대로 확인해 처리할 항목 하나를 가져온다. 없으면 None.
+        """
+        token = uuid.uuid4().hex
+        now_ms = int(time.time() * 1000)
+        for shard in shards if shards is not None else range(self.shards):
+            claimed = self._claim(
+                keys=[self._pending_key(shard), self._processing_key(shard)],
+                args=[
+                    self.prefix, now_ms, self.visibility_ms, token, worker_id, self.max_attempts,
+                    self.result_ttl_seconds,
+                ],
+            )
+            if claimed:
+                item_id, payload, attempts = claimed
+                return WorkItem(item_id=item_id, shard=shard, payload=json.loads(payload), attempts=int(attempts), token=token)
+        return None
+
+    def extend(self, item: WorkItem) -> bool:
+        """긴 작업 중 가시성 마감을 연장한다. 이미 다른 워커에게 넘어갔으면 False."""
+        deadline = int(time.time() * 1000) + self.visibility_ms
+        return bool(
+            self._extend(keys=[self._processing_key(item.shard)], args=[self.prefix, item.item_id, item.token, deadline])
+        )
+
+    def ack(self, item: WorkItem, result: dict) -> bool:
+        return bool(
+            self._ack(
+                keys=[self._processing_key(item.shard)],
+                args=[
+                    self.prefix, item.item_id, item.token, "succeeded", json.dumps(result, ensure_ascii=False, default=str),
+                    self.result_ttl_seconds,
+                ],
+            )
+        )
+
+    def fail(self, item: WorkItem, error: str) -> str:
+        """
+        실패를 기록한다. 시도 횟수가 남았으면 백오프 뒤 재시도("retry"), 아니면 "dead". 토큰이 맞지 않으면 "stale".
+        """
+        processing = self._processing_key(item.shard)
+        if item.attempts < self.max_attempts:
+            retry_at = int(time.time() * 1000) + self.retry_backoff_ms * item.attempts
+            applied = self._retry(keys=[processing], args=[self.prefix, item.item_id, item.token, error, retry_at])
+            return "retry" if applied else "stale"
+        applied = self._ack(
+            keys=[processing], args=[self.prefix, item.item_id, item.token, "dead", error, self.result_ttl_seconds]
+        )
+        return "dead" if applied else "stale"
+
+    def batch_status(self, batch_id: str, include_results: bool = True) -> dict:
+        batch_key = f"{self.prefix}:batch:{batch_id}"
+        counts = self.client.hgetall(batch_key)
+        total = int(counts.get("total", 0))
+        succeeded = int(counts.get("succeeded", 0))
+        dead = int(counts.get("dead", 0))
+        status = {
+            "batch_id": batch_id,
+            "total": total,
+            "coalesced": int(counts.get("coalesced", 0)),
+            "succeeded": succeeded,
+            "dead": dead,
+            "done": total > 0 and succeeded + dead >= total,
+        }
+        if include_results:
+            results = []
+            for raw in self.client.lrange(f"{batch_key}:results", 0, -1):
+                record = json.loads(raw)
+                record["payload"] = json.loads(record["payload"]) if record.get("payload") else None
+                if record["status"] == "succeeded":
+                    record["result"] = json.loads(record.pop("body"))
+                else:
+                    record["error"] = record.pop("body")
+                results.append(record)
+            status["results"] = results
+        return status
+
+    def stats(self) -> dict:
+        pipe = self.client.pipeline(transaction=False)
+        for shard in range(self.shards):
+            pipe.llen(self._pending_key(shard))
+            pipe.zcard(self._processing_key(shard))
+        counts = pipe.execute()
+        return {
+            "shards": [
+                {"shard": shard, "pending": counts[shard * 2], "processing": counts[shard * 2 + 1]}
+                for shard in range(self.shards)
+            ]
+        }
@@ -1,7 +1,12 @@
-from typing import Iterable
-from datetime import datetime, timedelta
+import os
+import time
+from dataclasses import asdict
+from contextlib import contextmanager
+from typing import Iterable, Iterator
+from datetime import date, datetime, timedelta
 
-from sqlalchemy import text
+from sqlalchemy import or_, text
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 
 from config.database.session import SessionLocal
 from content.application.port.content_repository_port import ContentRepositoryPort
@@ -36,6 +41,53 @@ from content.infrastructure.orm.models import (
 class ContentRepositoryImpl(ContentRepositoryPort):
     def __init__(self):
         self.db = SessionLocal()
+        self._uow_depth = 0
+        self._staged_ops = 0
+
+    @contextmanager
+    def unit_of_work(self) -> Iterator["ContentRepositoryImpl"]:
+        """
+        블록 안의 쓰기 메서드는 commit 대신 세션에 쌓아 두고(UOW_FLUSH_EVERY 건마다 flush),
+        블록이 정상 종료되면 한 번만 commit 한다. 예외가 나면 전체를 rollback 한다.
+        중첩 호출은 바깥 작업 단위에 합류한다.
+        """
+        if self._uow_depth:
+            self._uow_depth += 1
+            try:
+                yield self
+            finally:
+                self._uow_depth -= 1
+            return
+
+        self._uow_depth = 1
+        self._staged_ops = 0
+        try:
+            yield self
+            self.db.commit()
+        except Exception:
+            self.db.rollback()
+            raise
+        finally:
+            self._uow_depth = 0
+            self._staged_ops = 0
+
+    def _commit(self) -> None:
+        if not self._uow_depth:
+            self.db.commit()
+            return
+        self._staged_ops += 1
+        if self._staged_ops >= int(os.getenv("UOW_FLUSH_EVERY", "200")):
+            self.db.flush()
+            self._staged_ops = 0
+
+    def _rollback(self) -> None:
+        # 작업 단위 안에서는 예외를 그대로 올려 unit_of_work 가 전체를 rollback 하게 한다.
+        if not self._uow_depth:
+            self.db.rollback()
+
+    def close(self) -> None:
+        # 작업 단위로 만든 저장소(백그라운드 작업 등)는 끝나면 세션을 닫아 커넥션을 풀에 돌려준다.
+        self.db.close()
 
     def upsert_channel(self, channel: Channel) -> Channel:
         orm = self.db.get(ChannelORM, channel.channel_id)
@@ -54,7 +106,7 @@ class ContentRepositoryImpl(ContentRepositoryPort):
         orm.video_count = channel.video_count
         orm.crawled_at = channel.crawled_at
 
-        self.db.commit()
+        self._commit()
         return channel
 
     def upsert_account(self, account: CreatorAccount) -> CreatorAccount:
@@ -80,11 +132,20 @@ class ContentRepositoryImpl(ContentRepositoryPort):
         orm.post_count = account.post_count
         orm.last_updated_at = account.last_updated_at
         orm.crawled_at = account.crawled_at
-        self.db.commit()
+        self._commit()
         return account
 
     def upsert_video(self, video: Video) -> Video:
+        """
+        영상을 upsert 하면서 조회/좋아요/댓글 수가 바뀌었으면 같은 트랜잭션에서 오늘자 스냅샷도 남긴다.
+        (스냅샷은 변경분만 기록되고, 읽는 쪽은 기준일 이전 최신 스냅샷을 그대로 이어 쓴다.)
+        """
         orm = self.db.get(VideoORM, video.video_id)
+        counters_changed = orm is None or (orm.view_count, orm.like_count, orm.comment_count) != (
+            video.view_count,
+            video.like_count,
+            video.comment_count,
+        )
         if orm is None:
             orm = VideoORM(video_id=video.video_id)
             self.db.add(orm)
@@ -104,24 +165,28 @@ class ContentRepositoryImpl(ContentRepositoryPort):
         orm.comment_count = video.comment_count
         orm.crawled_at = video.crawled_at
 
-        self.db.commit()
+        if counters_changed and video.view_count is not None:
+            self._upsert_snapshot_row(
+                VideoMetricsSnapshot(
+                    video_id=video.video_id,
+                    platform=video.platform or "youtube",
+                    snapshot_date=date.today(),
+                    view_count=video.view_count,
+                    like_count=video.like_count,
+                    comment_count=video.comment_count,
+                )
+            )
+        self._commit()
         return video
 
     def upsert_comments(self, comments: Iterable[VideoComment]) -> None:
-        for comment in comments:
-            orm = self.db.get(VideoCommentORM, comment.comment_id)
-            if orm is None:
-                orm = VideoCommentORM(comment_id=comment.comment_id)
-                self.db.add(orm)
-                # 한국어 주석: 최초 적재 시 댓글 본문/작성자 등 정적 정보를 저장합니다.
-                orm.platform = comment.platform or "youtube"
-                orm.video_id = comment.video_id
-                orm.author = comment.author
-                orm.content = comment.content
-                orm.published_at = comment.published_at
-            # 한국어 주석: 기존 댓글은 변동성 필드(좋아요 수)만 업데이트합니다.
-            orm.like_count = comment.like_count
-        self.db.commit()
+        # 한국어 주석: 최초 적재 시 댓글 본문/작성자 등 정적 정보를 저장하고, 기존 댓글은 변동성 필드(좋아요 수)만 업데이트합니다.
+        self._bulk_upsert(
+            VideoCommentORM,
+            [self._row(VideoCommentORM, comment) for comment in comments],
+            key_columns=("comment_id",),
+            update_columns=("like_count",),
+        )
 
     def upsert_video_sentiment(self, sentiment: VideoSentiment) -> VideoSentiment:
         orm = self.db.get(VideoSentimentORM, sentiment.video_id)
@@ -135,21 +200,222 @@ class ContentRepositoryImpl(ContentRepositoryPort):
         orm.sentiment_score = sentiment.sentiment_score
         orm.keywords = sentiment.keywords
         orm.summary = sentiment.summary
-        orm.analyzed_at = sentiment.analyzed_at
-        self.db.commit()
+        # 분석 시각은 증분 트렌드 집계의 변경 기준이므로 비어 있으면 현재 시각으로 채운다.
+        orm.analyzed_at = sentiment.analyzed_at or datetime.utcnow()
+        self._commit()
         return sentiment
 
     def upsert_comment_sentiments(self, sentiments: Iterable[CommentSentiment]) -> None:
-        for sentiment in sentiments:
-            orm = self.db.get(CommentSentimentORM, sentiment.comment_id)
-            if orm is None:
-                orm = CommentSentimentORM(comment_id=sentiment.comment_id)
-                self.db.add(orm)
-            orm.platform = sentiment.platform or "youtube"
-            orm.sentiment_label = sentiment.sentiment_label
-            orm.sentiment_score = sentiment.sentiment_score
-            orm.analyzed_at = sentiment.analyzed_at
-        self.db.commit()
+        self._bulk_upsert(
+            CommentSentimentORM,
+            [self._row(CommentSentimentORM, sentiment) for sentiment in sentiments],
+            key_columns=("comment_id",),
+        )
+
+    # 다건 upsert: 단건 메서드와 같은 정적/변동성 컬럼 규칙을 multi-row INSERT ... ON CONFLICT 로 적용한다.
+    # 같은 키가 한 문장에 두 번 들어가면 ON CONFLICT 가 실패하므로 마지막 값만 남기고, 전체를 한 번에 commit 한다.
+
+    def upsert_channels(self, channels: Iterable[Channel]) -> int:
+        channels = list(channels)
+        hinted = {channel.channel_id: channel for channel in channels if channel.not_modified}
+        if hinted:
+            # ETag 304(not_modified)는 '마지막 조회 이후 변경 없음'일 뿐 적재 여부를 보장하지 않으므로,
+            # 저장된 행의 갱신 대상 컬럼이 들어온 값과 같을 때만 건너뛴다.
+            stored = {
+                r.channel_id: (r.subscriber_count, r.view_count, r.video_count)
+                for r in self.db.execute(
+                    text(
+                        "SELECT channel_id, subscriber_count, view_count, video_count "
+                        "FROM channel WHERE channel_id = ANY(:ids)"
+                    ),
+                    {"ids": list(hinted)},
+                )
+            }
+            unchanged = {
+                channel_id
+                for channel_id, channel in hinted.items()
+                if stored.get(channel_id) == (channel.subscriber_count, channel.view_count, channel.video_count)
+            }
+            channels = [channel for channel in channels if channel.channel_id not in unchanged]
+        return self._bulk_upsert(
+            ChannelORM,
+            [self._row(ChannelORM, channel) for channel in channels],
+            key_columns=("channel_id",),
+            update_columns=("subscriber_count", "view_count", "video_count", "crawled_at"),
+        )
+
+    def upsert_accounts(self, accounts: Iterable[CreatorAccount]) -> int:
+        return self._bulk_upsert(
+            CreatorAccountORM,
+            [self._row(CreatorAccountORM, account, default_platform=False) for account in accounts],
+            key_columns=("account_id", "platform"),
+            update_columns=("follower_count", "post_count", "last_updated_at", "crawled_at"),
+        )
+
+    def upsert_videos(self, videos: Iterable[Video]) -> int:
+        """
+        upsert_video 의 다건 버전. 기존 지표를 한 번에 조회해 조회/좋아요/댓글 수가 바뀐 영상(신규 포함)만
+        오늘자 스냅샷을 같은 트랜잭션에서 남긴다. ETag 304 로 변경 없음이 확인된 영상(not_modified) 중
+        저장된 지표가 들어온 값과 같은 것은 건너뛰며, 반환값은 실제로 쓴 행 수다.
+        """
+        videos = list(videos)
+        rows = self._dedupe([self._row(VideoORM, video) for video in videos], ("video_id",))
+        if not rows:
+            return 0
+        previous = {
+            r.video_id: (r.view_count, r.like_count, r.comment_count)
+            for r in self.db.execute(
+                text("SELECT video_id, view_count, like_count, comment_count FROM video WHERE video_id = ANY(:ids)"),
+                {"ids": [row["video_id"] for row in rows]},
+            )
+        }
+        # not_modified 는 힌트일 뿐이므로(적재 전에 ETag 가 저장될 수 있음) 저장된 지표와 같을 때만 건너뛴다.
+        hinted = {video.video_id for video in videos if video.not_modified}
+        rows = [
+            row
+            for row in rows
+            if row["video_id"] not in hinted
+            or previous.get(row["video_id"]) != (row["view_count"], row["like_count"], row["comment_count"])
+        ]
+        if not rows:
+            return 0
+        today = date.today()
+        snapshots = [
+            {
+                "video_id": row["video_id"],
+                "platform": row["platform"],
+                "snapshot_date": today,
+                "view_count": row["view_count"],
+                "like_count": row["like_count"],
+                "comment_count": row["comment_count"],
+            }
+            for row in rows
+            if row["view_count"] is not None
+            and previous.get(row["video_id"]) != (row["view_count"], row["like_count"], row["comment_count"])
+        ]
+        try:
+            self._execute_bulk_upsert(
+                VideoORM,
+                rows,
+                key_columns=("video_id",),
+                update_columns=("view_count", "like_count", "comment_count", "crawled_at"),
+            )
+            if snapshots:
+                snapshot_table = VideoMetricsSnapshotORM.__table__
+                stmt = pg_insert(snapshot_table).values(snapshots)
+                counters = ("view_count", "like_count", "comment_count")
+                # upsert_video_metrics_snapshot 와 같이 값이 실제로 바뀐 경우에만 갱신해 captured_at 을 보존한다.
+                stmt = stmt.on_conflict_do_update(
+                    index_elements=["video_id", "snapshot_date", "platform"],
+                    set_={
+                        **{name: stmt.excluded[name] for name in counters},
+                        "captured_at": stmt.excluded.captured_at,
+                    },
+                    where=or_(*(snapshot_table.c[name].is_distinct_from(stmt.excluded[name]) for name in counters)),
+                )
+                self.db.execute(stmt)
+            self._commit()
+        except Exception:
+            self._rollback()
+            raise
+        return len(rows)
+
+    def upsert_video_sentiments(self, sentiments: Iterable[VideoSentiment]) -> int:
+        # 분석/점수/키워드 매핑의 갱신 시각은 증분 트렌드 집계의 변경 기준이므로 비어 있으면 현재 시각으로 채운다.
+        now = datetime.utcnow()
+        return self._bulk_upsert(
+            VideoSentimentORM,
+            [
+                {**self._row(VideoSentimentORM, sentiment), "analyzed_at": sentiment.analyzed_at or now}
+                for sentiment in sentiments
+            ],
+            key_columns=("video_id",),
+        )
+
+    def upsert_video_scores(self, scores: Iterable[VideoScore]) -> int:
+        now = datetime.utcnow()
+        return self._bulk_upsert(
+            VideoScoreORM,
+            [{**self._row(VideoScoreORM, score), "updated_at": score.updated_at or now} for score in scores],
+            key_columns=("video_id",),
+        )
+
+    def upsert_keyword_mappings(self, mappings: Iterable[KeywordMapping]) -> int:
+        now = datetime.utcnow()
+        rows = [
+            {**self._row(KeywordMappingORM, mapping, exclude=("mapping_id",)), "updated_at": now}
+            for mapping in mappings
+            if mapping.video_id and mapping.keyword
+        ]
+        return self._bulk_upsert(
+            KeywordMappingORM,
+            rows,
+            key_columns=("video_id", "keyword", "platform"),
+            update_columns=("channel_id", "weight", "updated_at"),
+        )
+
+    @staticmethod
+    def _row(orm_cls, entity, default_platform: bool = True, exclude: tuple[str, ...] = ()) -> dict:
+        """
+        도메인 객체를 테이블 컬럼 기준 dict 로 변환한다(생성 컬럼/제외 컬럼 제외).
+        platform 이 비어 있으면 단건 메서드와 같이 "youtube" 로 채운다.
+        """
+        row = {
+            col.name: getattr(entity, col.name, None)
+            for col in orm_cls.__table__.columns
+            if col.computed is None and col.name not in exclude
+        }
+        if default_platform and "platform" in row:
+            row["platform"] = row["platform"] or "youtube"
+        return row
+
+    @staticmethod
+    def _dedupe(rows: list[dict], key_columns: tuple[str, ...]) -> list[dict]:
+        unique: dict[tuple, dict] = {}
+        for row in rows:
+            unique[tuple(row[k] for k in key_columns)] = row
+        return list(unique.values())
+
+    def _bulk_upsert(
+        self,
+        orm_cls,
+        rows: list[dict],
+        key_columns: tuple[str, ...],
+        update_columns: tuple[str, ...] | None = None,
+    ) -> int:
+        rows = self._dedupe(rows, key_columns)
+        if not rows:
+            return 0
+        try:
+            self._execute_bulk_upsert(orm_cls, rows, key_columns, update_columns)
+            self._commit()
+        except Exception:
+            self._rollback()
+            raise
+        return len(rows)
+
+    def _execute_bulk_upsert(
+        self,
+        orm_cls,
+        rows: list[dict],
+        key_columns: tuple[str, ...],
+        update_columns: tuple[str, ...] | None = None,
+    ) -> None:
+        """
+        update_columns 가 None 이면 키를 제외한 모든 컬럼을 갱신한다. commit 은 호출자가 한다.
+        """
+        table = orm_cls.__table__
+        chunk_size = max(int(os.getenv("BULK_UPSERT_CHUNK_SIZE", "500")), 1)
+        for i in range(0, len(rows), chunk_size):
+            stmt = pg_insert(table).values(rows[i : i + chunk_size])
+            columns = update_columns if update_columns is not None else [
+                name for name in rows[0] if name not in key_columns
+            ]
+            stmt = stmt.on_conflict_do_update(
+                index_elements=list(key_columns),
+                set_={name: stmt.excluded[name] for name in columns},
+            )
+            self.db.execute(stmt)
 
     def upsert_keyword_trend(self, trend: KeywordTrend) -> KeywordTrend:
         orm = (
@@ -175,7 +441,8 @@ class ContentRepositoryImpl(ContentRepositoryPort):
         orm.avg_total_score = trend.avg_total_score
         orm.growth_rate = trend.growth_rate
         orm.rank = trend.rank
-        self.db.commit()
+        orm.view_velocity = trend.view_velocity
+        self._commit()
         return trend
 
     def upsert_category_trend(self, trend: CategoryTrend) -> CategoryTrend:
@@ -202,9 +469,53 @@ class ContentRepositoryImpl(ContentRepositoryPort):
         orm.search_volume_prev = trend.search_volume_prev
         orm.growth_rate = trend.growth_rate
         orm.rank = trend.rank
-        self.db.commit()
+        orm.view_velocity = trend.view_velocity
+        self._commit()
         return trend
 
+    def bulk_upsert_keyword_trends(self, trends: Iterable[KeywordTrend]) -> dict:
+        """
+        keyword_trend 행을 다중 행 INSERT ... ON CONFLICT (keyword, date, platform) DO UPDATE 로 한 트랜잭션에 적재한다.
+        """
+        return self._bulk_upsert_trends(KeywordTrendORM, ("keyword", "date", "platform"), trends)
+
+    def bulk_upsert_category_trends(self, trends: Iterable[CategoryTrend]) -> dict:
+        """
+        category_trend 행을 다중 행 INSERT ... ON CONFLICT (category, date, platform) DO UPDATE 로 한 트랜잭션에 적재한다.
+        """
+        return self._bulk_upsert_trends(CategoryTrendORM, ("category", "date", "platform"), trends)
+
+    def _bulk_upsert_trends(self, orm_cls, key_columns: tuple[str, ...], trends: Iterable) -> dict:
+        """
+        행 단위 SELECT/commit 대신 청크(TREND_BULK_CHUNK_SIZE, 기본 1000행)별 multi-row upsert 를 실행하고
+        마지막에 한 번만 commit 한다. 적재 행 수와 소요 시간(ms)을 반환한다.
+        """
+        started = time.perf_counter()
+        rows = [asdict(t) for t in trends]
+        chunk_size = max(int(os.getenv("TREND_BULK_CHUNK_SIZE", "1000")), 1)
+        table = orm_cls.__table__
+        try:
+            for i in range(0, len(rows), chunk_size):
+                stmt = pg_insert(table).values(rows[i : i + chunk_size])
+                stmt = stmt.on_conflict_do_update(
+                    index_elements=list(key_columns),
+                    set_={
+                        col.name: stmt.excluded[col.name]
+                        for col in table.columns
+                        if col.name not in key_columns
+                    },
+                )
+                self.db.execute(stmt)
+            self._commit()
+        except Exception:
+            self._rollback()
+            raise
+        return {
+            "table": table.name,
+            "rows": len(rows),
+            "elapsed_ms": round((time.perf_counter() - started) * 1000, 1),
+        }
+
     def upsert_keyword_mapping(self, mapping: KeywordMapping) -> KeywordMapping:
         # 동일 (video_id, keyword, platform) 조합 중복 삽입을 막기 위해 조회 후 갱신/신규 생성
         platform = mapping.platform or "youtube"
@@ -227,7 +538,8 @@ class ContentRepositoryImpl(ContentRepositoryPort):
         orm.channel_id = mapping.channel_id
         orm.keyword = mapping.keyword
         orm.weight = mapping.weight
-        self.db.commit()
+        orm.updated_at = datetime.utcnow()
+        self._commit()
         mapping.mapping_id = getattr(orm, "mapping_id", None)
         return mapping
 
@@ -241,8 +553,8 @@ class ContentRepositoryImpl(ContentRepositoryPort):
         orm.sentiment_score = score.sentiment_score
         orm.trend_score = score.trend_score
         orm.total_score = score.total_score
-        orm.updated_at = score.updated_at
-        self.db.commit()
+        orm.updated_at = score.updated_at or datetime.utcnow()
+        self._commit()
         return score
 
     def log_crawl(self, log: CrawlLog) -> CrawlLog:
@@ -254,14 +566,20 @@ class ContentRepositoryImpl(ContentRepositoryPort):
             crawled_at=log.crawled_at,
         )
         self.db.add(orm)
-        self.db.commit()
+        self.db.flush()
+        self._commit()
         log.id = orm.id
         return log
 
     def upsert_video_metrics_snapshot(self, snapshot: VideoMetricsSnapshot) -> None:
         """
         일별 영상 지표 스냅샷을 upsert합니다. 동일 (video_id, snapshot_date, platform) 키에 대해서는 값을 갱신합니다.
+        값이 실제로 바뀐 경우에만 갱신하여 captured_at(증분 집계의 변경 감지 기준)이 불필요하게 움직이지 않게 합니다.
         """
+        self._upsert_snapshot_row(snapshot)
+        self._commit()
+
+    def _upsert_snapshot_row(self, snapshot: VideoMetricsSnapshot) -> None:
         # NOTE: SQLAlchemy ORM보다 ON CONFLICT가 명확한 raw SQL을 사용합니다.
         self.db.execute(
             text(
@@ -272,7 +590,10 @@ class ContentRepositoryImpl(ContentRepositoryPort):
                 DO UPDATE SET
                     view_count = EXCLUDED.view_count,
                     like_count = EXCLUDED.like_count,
-                    comment_count = EXCLUDED.comment_count
+                    comment_count = EXCLUDED.comment_count,
+                    captured_at = EXCLUDED.captured_at
+                WHERE (video_metrics_snapshot.view_count, video_metrics_snapshot.like_count, video_metrics_snapshot.comment_count)
+                      IS DISTINCT FROM (EXCLUDED.view_count, EXCLUDED.like_count, EXCLUDED.comment_count)
                 """
             ),
             {
@@ -284,7 +605,6 @@ class ContentRepositoryImpl(ContentRepositoryPort):
                 "comment_count": snapshot.comment_count,
             },
         )
-        self.db.commit()
 
     def fetch_videos_by_category(self, category: str, limit: int = 20) -> list[dict]:
         """
@@ -496,7 +816,7 @@ class ContentRepositoryImpl(ContentRepositoryPort):
         except Exception:
             pass
         # days 파라미터는 "최근 N일간 게시된 영상"을 의미하도록, 수집 시점(crawled_at)이 아닌 게시 시점(published_at)으로 필터링한다.
-            # days 파라미터는 "최근 N일간 게시된 영상"을 의미하도록, 수집 시점(crawled_at)이 아닌 게시 시점(published_at)으로 필터링한다.
+        # published_at 이 있으면 activity_date 가 게시일과 같으므로, 인덱스가 있는 activity_date 로 범위를 건다.
         since_date = (datetime.utcnow() - timedelta(days=days)).date()
         until_date = datetime.utcnow().date()
         rows = self.db.execute(
@@ -532,7 +852,8 @@ class ContentRepositoryImpl(ContentRepositoryPort):
                 LEFT JOIN creator_account ca ON ca.account_id = v.channel_id AND ca.platform = v.platform
                 LEFT JOIN channel ch ON ch.channel_id = v.channel_id
                 WHERE vs.category = :category
-                AND v.published_at::date BETWEEN :since_date AND :until_date
+                  AND v.activity_date BETWEEN :since_date AND :until_date
+                  AND v.published_at IS NOT NULL
                   AND (:platform IS NULL OR v.platform = :platform)
                 ORDER BY COALESCE(sc.total_score, sc.sentiment_score, sc.trend_score, v.view_count) DESC NULLS LAST,
                          v.crawled_at DESC
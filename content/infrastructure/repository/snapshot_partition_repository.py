@@ -0,0 +1,332 @@
+import os
+import re
+from datetime import date
+
+from sqlalchemy import text
+
+from config.database.session import SCHEMA_LOCK_KEY, SessionLocal
+
+PARENT_TABLE = "video_metrics_snapshot"
+DEFAULT_PARTITION = f"{PARENT_TABLE}_default"
+# 파티션 도입 이전 일반 테이블을 옮기는 동안 원본을 보관하는 이름 (migrate_unpartitioned)
+LEGACY_TABLE = f"{PARENT_TABLE}_unpartitioned"
+_PARTITION_NAME = re.compile(rf"^{PARENT_TABLE}_(\d{{4}})(\d{{2}})$")
+
+
+def _month_start(value: date) -> date:
+    return value.replace(day=1)
+
+
+def _add_months(month_start: date, months: int) -> date:
+    index = month_start.year * 12 + (month_start.month - 1) + months
+    return date(index // 12, index % 12 + 1, 1)
+
+
+def partition_name(month_start: date) -> str:
+    return f"{PARENT_TABLE}_{month_start:%Y%m}"
+
+
+class SnapshotPartitionRepository:
+    """
+    video_metrics_snapshot 월별 파티션 관리.
+    - ensure_partitions: 기준 월부터 SNAPSHOT_PARTITION_MONTHS_AHEAD 개월 뒤까지 파티션을 미리 만든다.
+      DEFAULT 파티션에 이미 들어간 행이 있으면 새 파티션으로 옮긴 뒤 ATTACH 한다.
+    - apply_retention: SNAPSHOT_RETENTION_MONTHS 개월보다 오래된 파티션을 DROP(또는 SNAPSHOT_ARCHIVE_SCHEMA 로 이동)한다.
+
+    트렌드 쿼리의 "기준일 이전 최신 스냅샷" LATERAL 조회는 snapshot_date 상한 조건으로 상한 이후 파티션이
+    실행 시점에 제외되고, snapshot_date DESC 정렬이 파티션 키와 같아 최신 파티션부터 읽다가 LIMIT 1 에서 멈춘다.
+    오래된 파티션을 지울 때는 영상별 마지막 값을 보존 구간 첫날로 옮겨(carry-forward 체크포인트) 결과가 바뀌지 않게 한다.
+    - migrate_unpartitioned: 파티션 도입 이전의 일반 테이블을 파티션 테이블로 옮기는 1회성 마이그레이션.
+      앱 기동이 아니라 운영자가 명시적으로 실행한다(python -m app.batch.snapshot_partition_batch --migrate-legacy).
+    """
+
+    def __init__(
+        self,
+        session_factory=SessionLocal,
+        months_ahead: int | None = None,
+        retention_months: int | None = None,
+        archive_schema: str | None = None,
+    ):
+        self.session_factory = session_factory
+        self.months_ahead = (
+            months_ahead if months_ahead is not None else int(os.getenv("SNAPSHOT_PARTITION_MONTHS_AHEAD", "3"))
+        )
+        self.retention_months = (
+            retention_months if retention_months is not None else int(os.getenv("SNAPSHOT_RETENTION_MONTHS", "13"))
+        )
+        self.archive_schema = archive_schema if archive_schema is not None else os.getenv("SNAPSHOT_ARCHIVE_SCHEMA")
+
+    def list_partitions(self, db) -> dict[date, str]:
+        rows = db.execute(
+            text(
+                """
+                SELECT c.relname
+                FROM pg_inherits i
+                JOIN pg_class c ON c.oid = i.inhrelid
+                WHERE i.inhparent = CAST(:parent AS regclass)
+                """
+            ),
+            {"parent": PARENT_TABLE},
+        ).scalars()
+        partitions: dict[date, str] = {}
+        for name in rows:
+            matched = _PARTITION_NAME.match(name)
+            if matched:
+                partitions[date(int(matched.group(1)), int(matched.group(2)), 1)] = name
+        return partitions
+
+    def relkind(self, db, table: str) -> str | None:
+        """
+        현재 스키마의 테이블 종류('p': 파티션 테이블, 'r': 일반 테이블). 없으면 None.
+        """
+        return db.execute(
+            text(
+                """
+                SELECT c.relkind
+                FROM pg_class c
+                JOIN pg_namespace n ON n.oid = c.relnamespace
+                WHERE c.relname = :name AND n.nspname = current_schema()
+                """
+            ),
+            {"name": table},
+        ).scalar()
+
+    def _require_partitioned(self, db) -> bool:
+        if self.relkind(db, PARENT_TABLE) == "p":
+            return True
+        print(
+            f"[SNAPSHOT-PARTITION] {PARENT_TABLE} is not partitioned; skipped. "
+            "run: python -m app.batch.snapshot_partition_batch --migrate-legacy"
+        )
+        return False
+
+    def ensure_partitions(self, as_of: date | None = None) -> list[str]:
+        first = _month_start(as_of or date.today())
+        created: list[str] = []
+        with self.session_factory() as db:
+            if not self._require_partitioned(db):
+                return created
+            existing = self.list_partitions(db)
+            for offset in range(self.months_ahead + 1):
+                month_start = _add_months(first, offset)
+                if month_start in existing:
+                    continue
+                self._create_partition(db, month_start)
+                created.append(partition_name(month_start))
+            db.commit()
+        if created:
+            print(f"[SNAPSHOT-PARTITION] partitions created: {created}")
+        return created
+
+    def _create_partition(self, db, month_start: date) -> None:
+        name = partition_name(month_start)
+        bounds = {"lo": month_start, "hi": _add_months(month_start, 1)}
+        bound_sql = f"FROM ('{bounds['lo']:%Y-%m-%d}') TO ('{bounds['hi']:%Y-%m-%d}')"
+        stray_rows = db.execute(
+            text(f"SELECT COUNT(*) FROM {DEFAULT_PARTITION} WHERE snapshot_date >= :lo AND snapshot_date < :hi"),
+            bounds,
+        ).scalar()
+        if not stray_rows:
+            db.execute(text(f"CREATE TABLE {name} PARTITION OF {PARENT_TABLE} FOR VALUES {bound_sql}"))
+            return
+
+        # DEFAULT 파티션에 같은 범위의 행이 있으면 PARTITION OF 생성이 실패하므로, 행을 옮긴 뒤 ATTACH 한다.
+        db.execute(text(f"CREATE TABLE {name} (LIKE {PARENT_TABLE} INCLUDING DEFAULTS INCLUDING CONSTRAINTS)"))
+        db.execute(
+            text(
+                f"""
+                WITH moved AS (
+                    DELETE FROM {DEFAULT_PARTITION}
+                    WHERE snapshot_date >= :lo AND snapshot_date < :hi
+                    RETURNING *
+                )
+                INSERT INTO {name} SELECT * FROM moved
+                """
+            ),
+            bounds,
+        )
+        db.execute(text(f"ALTER TABLE {PARENT_TABLE} ATTACH PARTITION {name} FOR VALUES {bound_sql}"))
+        print(f"[SNAPSHOT-PARTITION] moved {stray_rows} rows from default partition into {name}")
+
+    def apply_retention(self, as_of: date | None = None) -> dict:
+        """
+        보존 기간이 지난 파티션을 정리한다. SNAPSHOT_RETENTION_MONTHS <= 0 이면 아무것도 하지 않는다.
+        """
+        if self.retention_months <= 0:
+            return {"cutoff": None, "checkpoint_rows": 0, "dropped": [], "archived": []}
+
+        cutoff = _add_months(_month_start(as_of or date.today()), -self.retention_months)
+        with self.session_factory() as db:
+            if not self._require_partitioned(db):
+                return {"cutoff": None, "checkpoint_rows": 0, "dropped": [], "archived": []}
+            expired = sorted(
+                name for month_start, name in self.list_partitions(db).items() if _add_months(month_start, 1) <= cutoff
+            )
+            if not expired:
+                return {"cutoff": cutoff.isoformat(), "checkpoint_rows": 0, "dropped": [], "archived": []}
+
+            # 보존 구간 첫날에 영상별 마지막 값을 남겨, 이후 날짜의 "이전 최신 스냅샷" 조회 결과를 유지한다.
+            # captured_at 은 원래 값을 그대로 옮겨 증분 집계의 변경 감지에 걸리지 않게 한다.
+            checkpoint = db.execute(
+                text(
+                    f"""
+                    INSERT INTO {PARENT_TABLE}
+                        (video_id, platform, snapshot_date, view_count, like_count, comment_count, captured_at)
+                    SELECT DISTINCT ON (video_id, platform)
+                        video_id, platform, :cutoff, view_count, like_count, comment_count, captured_at
+                    FROM {PARENT_TABLE}
+                    WHERE snapshot_date < :cutoff
+                    ORDER BY video_id, platform, snapshot_date DESC
+                    ON CONFLICT (video_id, snapshot_date, platform) DO NOTHING
+                    """
+                ),
+                {"cutoff": cutoff},
+            ).rowcount
+            db.execute(text(f"DELETE FROM {DEFAULT_PARTITION} WHERE snapshot_date < :cutoff"), {"cutoff": cutoff})
+
+            dropped: list[str] = []
+            archived: list[str] = []
+            if self.archive_schema:
+                db.execute(text(f'CREATE SCHEMA IF NOT EXISTS "{self.archive_schema}"'))
+            for name in expired:
+                db.execute(text(f"ALTER TABLE {PARENT_TABLE} DETACH PARTITION {name}"))
+                if self.archive_schema:
+                    db.execute(text(f'ALTER TABLE {name} SET SCHEMA "{self.archive_schema}"'))
+                    archived.append(name)
+                else:
+                    db.execute(text(f"DROP TABLE {name}"))
+                    dropped.append(name)
+            db.commit()
+
+        print(
+            f"[SNAPSHOT-PARTITION] retention applied | cutoff={cutoff}, checkpoint_rows={checkpoint}, "
+            f"dropped={dropped}, archived={archived}"
+        )
+        return {"cutoff": cutoff.isoformat(), "checkpoint_rows": checkpoint, "dropped": dropped, "archived": archived}
+
+    def migrate_unpartitioned(self) -> dict:
+        """
+        파티션 도입 이전의 일반 video_metrics_snapshot 을 월별 파티션 테이블로 옮긴다. 중단되어도 다시 실행하면 이어서 진행한다.
+        1) 전환: advisory lock(SCHEMA_LOCK_KEY) 안에서 원본을 LEGACY_TABLE 로 이름만 바꾸고 빈 파티션 테이블을 만든다.
+           카탈로그 작업뿐이라 ACCESS EXCLUSIVE 는 잠깐만 잡히고, 이후 적재는 새 테이블로 들어간다.
+        2) 복사: 월 단위 트랜잭션으로 최신 월부터 옮기고 옮긴 월은 원본에서 지운다(최근 스냅샷을 읽는 속도 계산이 먼저 복구된다).
+           platform 이 NULL 인 행은 'youtube' 로 채우되, 같은 (video_id, snapshot_date) 에 platform 이 있는 행이 있으면 그 행을,
+           아니면 captured_at 이 최신인 행을 남긴다. 전환 뒤 새로 적재된 행과 겹치면 새 행을 유지한다.
+        3) 원본이 비면(video_id/snapshot_date 가 NULL 인 행은 버린다) LEGACY_TABLE 을 지운다.
+        """
+        with self.session_factory() as db:
+            if self.relkind(db, PARENT_TABLE) == "r":
+                self._cut_over_legacy_table(db)
+            if self.relkind(db, LEGACY_TABLE) is None:
+                return {"migrated": False, "months": [], "rows": 0}
+            months = list(
+                db.execute(
+                    text(
+                        f"""
+                        SELECT DISTINCT date_trunc('month', snapshot_date)::date
+                        FROM {LEGACY_TABLE}
+                        WHERE snapshot_date IS NOT NULL
+                        ORDER BY 1 DESC
+                        """
+                    )
+                ).scalars()
+            )
+
+            copied = legacy_rows = 0
+            for month_start in months:
+                month_copied, month_rows = self._copy_legacy_month(db, month_start)
+                copied += month_copied
+                legacy_rows += month_rows
+
+            legacy_rows += db.execute(text(f"SELECT COUNT(*) FROM {LEGACY_TABLE}")).scalar() or 0
+            db.execute(text(f"DROP TABLE {LEGACY_TABLE}"))
+            db.commit()
+
+        # 중복 키, video_id/snapshot_date 누락, 전환 뒤 새로 적재된 행과 겹쳐 옮기지 않은 행 수
+        discarded = legacy_rows - copied
+
+        print(
+            f"[SNAPSHOT-PARTITION] legacy table migrated | months={len(months)}, rows={copied}, "
+            f"discarded_rows={discarded}"
+        )
+        return {"migrated": True, "months": [m.isoformat() for m in months], "rows": copied, "discarded_rows": discarded}
+
+    def _cut_over_legacy_table(self, db) -> None:
+        db.execute(text("SET LOCAL lock_timeout = '10s'"))
+        db.execute(text("SELECT pg_advisory_xact_lock(:key)"), {"key": SCHEMA_LOCK_KEY})
+        if self.relkind(db, PARENT_TABLE) != "r":
+            db.rollback()
+            return
+
+        # 인덱스 이름은 스키마 전체에서 유일하므로, 새 테이블의 PK/인덱스와 겹치지 않게 원본 쪽 인덱스 이름을 바꾼다.
+        legacy_indexes = db.execute(
+            text(
+                """
+                SELECT ic.relname
+                FROM pg_index i
+                JOIN pg_class ic ON ic.oid = i.indexrelid
+                WHERE i.indrelid = CAST(:table AS regclass)
+                """
+            ),
+            {"table": PARENT_TABLE},
+        ).scalars()
+        for index_name in list(legacy_indexes):
+            db.execute(text(f'ALTER INDEX "{index_name}" RENAME TO "{(index_name + "_legacy")[:63]}"'))
+        db.execute(text(f"ALTER TABLE {PARENT_TABLE} RENAME TO {LEGACY_TABLE}"))
+        db.execute(
+            text(
+                f"""
+                CREATE TABLE {PARENT_TABLE} (
+                    video_id VARCHAR(100) NOT NULL,
+                    platform VARCHAR(50) NOT NULL DEFAULT 'youtube',
+                    snapshot_date DATE NOT NULL,
+                    view_count BIGINT,
+                    like_count BIGINT,
+                    comment_count BIGINT,
+                    captured_at TIMESTAMP DEFAULT (now() AT TIME ZONE 'utc'),
+                    CONSTRAINT pk_video_metrics_snapshot PRIMARY KEY (video_id, snapshot_date, platform)
+                ) PARTITION BY RANGE (snapshot_date)
+                """
+            )
+        )
+        db.execute(
+            text(
+                f"CREATE INDEX ix_video_metrics_snapshot_latest ON {PARENT_TABLE} (video_id, platform, snapshot_date DESC)"
+            )
+        )
+        db.execute(text(f"CREATE TABLE {DEFAULT_PARTITION} PARTITION OF {PARENT_TABLE} DEFAULT"))
+        first = _month_start(date.today())
+        for offset in range(self.months_ahead + 1):
+            self._create_partition(db, _add_months(first, offset))
+        db.commit()
+        print(f"[SNAPSHOT-PARTITION] {PARENT_TABLE} renamed to {LEGACY_TABLE}; partitioned table created")
+
+    def _copy_legacy_month(self, db, month_start: date) -> tuple[int, int]:
+        bounds = {"lo": month_start, "hi": _add_months(month_start, 1)}
+        if month_start not in self.list_partitions(db):
+            self._create_partition(db, month_start)
+        copied = db.execute(
+            text(
+                f"""
+                INSERT INTO {PARENT_TABLE}
+                    (video_id, platform, snapshot_date, view_count, like_count, comment_count, captured_at)
+                SELECT DISTINCT ON (video_id, COALESCE(platform, 'youtube'), snapshot_date)
+                    video_id, COALESCE(platform, 'youtube'), snapshot_date,
+                    view_count, like_count, comment_count, captured_at
+                FROM {LEGACY_TABLE}
+                WHERE snapshot_date >= :lo AND snapshot_date < :hi
+                  AND video_id IS NOT NULL
+                ORDER BY video_id, COALESCE(platform, 'youtube'), snapshot_date,
+                         platform IS NULL, captured_at DESC NULLS LAST
+                ON CONFLICT (video_id, snapshot_date, platform) DO NOTHING
+                """
+            ),
+            bounds,
+        ).rowcount or 0
+        removed = db.execute(
+            text(f"DELETE FROM {LEGACY_TABLE} WHERE snapshot_date >= :lo AND snapshot_date < :hi"),
+            bounds,
+        ).rowcount or 0
+        db.commit()
+        print(f"[SNAPSHOT-PARTITION] migrated {month_start:%Y-%m} | rows={copied}, legacy_rows={removed}")
+        return copied, removed
@@ -1,6 +1,12 @@
+DROP TABLE IF EXISTS trend_watermark CASCADE;
+DROP TABLE IF EXISTS trend_video_key CASCADE;
+DROP TABLE IF EXISTS keyword_daily_fact CASCADE;
+DROP TABLE IF EXISTS category_daily_fact CASCADE;
+DROP TABLE IF EXISTS batch_run CASCADE;
 DROP TABLE IF EXISTS crawl_log CASCADE;
 DROP TABLE IF EXISTS video_score CASCADE;
 DROP TABLE IF EXISTS keyword_mapping CASCADE;
+DROP TABLE IF EXISTS video_velocity CASCADE;
 DROP TABLE IF EXISTS video_metrics_snapshot CASCADE;
 DROP TABLE IF EXISTS keyword_trend CASCADE;
 DROP TABLE IF EXISTS category_trend CASCADE;
@@ -73,7 +79,9 @@ CREATE TABLE video (
     like_count BIGINT,
     comment_count BIGINT,
     thumbnail_url VARCHAR(500),
-    crawled_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+    crawled_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    -- 게시일(없으면 수집일). 기간 필터용 저장형 생성 컬럼
+    activity_date DATE GENERATED ALWAYS AS (COALESCE(published_at::date, crawled_at::date)) STORED
 );
 
 CREATE TABLE video_comment (
@@ -119,6 +127,7 @@ CREATE TABLE keyword_trend (
     avg_total_score DECIMAL(6,3),
     growth_rate DECIMAL(18,4),
     rank INT,
+    view_velocity DECIMAL(20,4),
     PRIMARY KEY(keyword, date, platform)
 );
 
@@ -135,6 +144,7 @@ CREATE TABLE category_trend (
     search_volume_prev BIGINT,
     growth_rate DECIMAL(18,4),
     rank INT,
+    view_velocity DECIMAL(20,4),
     PRIMARY KEY(category, date, platform)
 );
 
@@ -145,6 +155,7 @@ CREATE TABLE keyword_mapping (
     platform VARCHAR(50) DEFAULT 'youtube',
     keyword VARCHAR(100),
     weight DECIMAL(5,4),
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
     CONSTRAINT pk_keyword_mapping PRIMARY KEY (video_id, keyword, platform)
 );
 
@@ -158,14 +169,38 @@ CREATE TABLE video_score (
     updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
 );
 
+-- snapshot_date 기준 월별 RANGE 파티션. 월 파티션(video_metrics_snapshot_YYYYMM)은
+-- app/batch/snapshot_partition_batch.py 가 미리 만들고 보존 기간이 지나면 정리한다.
+-- 파티션 도입 이전의 일반 테이블은 python -m app.batch.snapshot_partition_batch --migrate-legacy 로 월 단위로 옮긴다.
 CREATE TABLE video_metrics_snapshot (
+    video_id VARCHAR(100) NOT NULL,
+    platform VARCHAR(50) NOT NULL DEFAULT 'youtube',
+    snapshot_date DATE NOT NULL,
+    view_count BIGINT,
+    like_count BIGINT,
+    comment_count BIGINT,
+    captured_at TIMESTAMP DEFAULT (now() AT TIME ZONE 'utc'),
+    CONSTRAINT pk_video_metrics_snapshot PRIMARY KEY (video_id, snapshot_date, platform)
+) PARTITION BY RANGE (snapshot_date);
+
+CREATE TABLE video_metrics_snapshot_default PARTITION OF video_metrics_snapshot DEFAULT;
+
+CREATE TABLE video_velocity (
+    as_of DATE,
+    velocity_days INT,
     video_id VARCHAR(100),
     platform VARCHAR(50) DEFAULT 'youtube',
-    snapshot_date DATE,
     view_count BIGINT,
     like_count BIGINT,
     comment_count BIGINT,
-    PRIMARY KEY (video_id, snapshot_date, platform)
+    anchor_view_count BIGINT,
+    anchor_like_count BIGINT,
+    anchor_comment_count BIGINT,
+    view_velocity DECIMAL(20,4),
+    like_velocity DECIMAL(20,4),
+    comment_velocity DECIMAL(20,4),
+    computed_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    PRIMARY KEY (as_of, velocity_days, video_id, platform)
 );
 
 CREATE TABLE crawl_log (
@@ -176,3 +211,79 @@ CREATE TABLE crawl_log (
     message TEXT,
     crawled_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
 );
+
+CREATE TABLE trend_watermark (
+    job_name VARCHAR(100),
+    platform VARCHAR(50),
+    as_of DATE,
+    window_days INT,
+    velocity_days INT,
+    watermark TIMESTAMP,
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    PRIMARY KEY (job_name, platform)
+);
+
+-- 증분 트렌드 집계: 마지막 집계 때 영상이 기여한 키워드/카테고리(key_type = keyword | category)
+CREATE TABLE trend_video_key (
+    video_id VARCHAR(100),
+    platform VARCHAR(50),
+    key_type VARCHAR(20),
+    group_key VARCHAR(100),
+    CONSTRAINT pk_trend_video_key PRIMARY KEY (video_id, platform, key_type, group_key)
+);
+
+CREATE TABLE keyword_daily_fact (
+    date DATE,
+    platform VARCHAR(50),
+    keyword VARCHAR(100),
+    video_count INT,
+    view_sum BIGINT,
+    like_sum BIGINT,
+    comment_sum BIGINT,
+    view_velocity_sum DECIMAL(20,4),
+    like_velocity_sum DECIMAL(20,4),
+    comment_velocity_sum DECIMAL(20,4),
+    sentiment_sum DECIMAL(18,4),
+    trend_sum DECIMAL(18,4),
+    total_score_sum DECIMAL(18,3),
+    computed_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    PRIMARY KEY (date, platform, keyword)
+);
+
+CREATE TABLE category_daily_fact (
+    date DATE,
+    platform VARCHAR(50),
+    category VARCHAR(100),
+    video_count INT,
+    view_sum BIGINT,
+    like_sum BIGINT,
+    comment_sum BIGINT,
+    view_velocity_sum DECIMAL(20,4),
+    like_velocity_sum DECIMAL(20,4),
+    comment_velocity_sum DECIMAL(20,4),
+    sentiment_sum DECIMAL(18,4),
+    trend_sum DECIMAL(18,4),
+    total_score_sum DECIMAL(18,3),
+    computed_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    PRIMARY KEY (date, platform, category)
+);
+
+CREATE TABLE batch_run (
+    id BIGSERIAL PRIMARY KEY,
+    job_name VARCHAR(100),
+    status VARCHAR(20),
+    started_at TIMESTAMP,
+    finished_at TIMESTAMP,
+    duration_ms INT,
+    message TEXT,
+    quota_units INT
+);
+
+-- 보조 인덱스 (content/infrastructure/orm/models.py 의 Index 선언과 동일하게 유지)
+CREATE INDEX ix_video_activity_date ON video (activity_date, platform);
+CREATE INDEX ix_video_sentiment_category ON video_sentiment (category, video_id);
+CREATE INDEX ix_keyword_mapping_keyword ON keyword_mapping (keyword, video_id);
+CREATE INDEX ix_video_metrics_snapshot_latest ON video_metrics_snapshot (video_id, platform, snapshot_date DESC);
+CREATE INDEX ix_keyword_trend_date_platform_rank ON keyword_trend (date, platform, rank);
+CREATE INDEX ix_category_trend_date_platform_rank ON category_trend (date, platform, rank);
+CREATE INDEX ix_category_trend_latest ON category_trend (platform, category, date DESC);
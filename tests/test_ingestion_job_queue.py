@@ -0,0 +1,130 @@
+import threading
+import time
+
+import fakeredis
+import pytest
+
+from content.application.usecase.ingestion_job_queue import IngestionJobQueue, IngestionJobQueueFull
+
+
+def wait_done(queue, job_id, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        job = queue.get(job_id)
+        if job is not None and job.done:
+            return job
+        time.sleep(0.01)
+    raise AssertionError(f"job {job_id} did not finish")
+
+
+@pytest.fixture
+def client():
+    return fakeredis.FakeRedis(decode_responses=True)
+
+
+def make_queue(client, **kwargs):
+    kwargs.setdefault("inflight_ttl_seconds", 5)
+    return IngestionJobQueue(client=client, key_prefix="test:job", **kwargs)
+
+
+def test_job_state_is_visible_from_another_worker(client):
+    worker_a, worker_b = make_queue(client), make_queue(client)
+
+    def run(progress):
+        progress("fetched")
+        return {"videos": 3}
+
+    job, coalesced = worker_a.submit("youtube", "channel", "UC1", run, {"max_videos": 3})
+    assert not coalesced
+
+    done = wait_done(worker_b, job.job_id)
+    assert done.status == "succeeded"
+    assert done.result == {"videos": 3}
+    assert done.progress == ["fetched"]
+    assert done.params == {"max_videos": 3}
+    assert worker_b.get("missing") is None
+    worker_a.shutdown()
+
+
+def test_same_target_and_params_coalesce_across_workers(client):
+    worker_a, worker_b = make_queue(client), make_queue(client)
+    release = threading.Event()
+    calls = []
+
+    def run(progress):
+        calls.append(1)
+        release.wait(5)
+        return {}
+
+    first, _ = worker_a.submit("youtube", "channel", "UC1", run, {"max_videos": 3})
+    second, coalesced = worker_b.submit("youtube", "channel", "UC1", run, {"max_videos": 3})
+    assert coalesced
+    assert second.job_id == first.job_id
+    assert second.coalesced_submissions == 1
+
+    other, other_coalesced = worker_b.submit("youtube", "channel", "UC1", run, {"max_videos": 10})
+    assert not other_coalesced
+    assert other.job_id != first.job_id
+
+    release.set()
+    wait_done(worker_a, first.job_id)
+    wait_done(worker_a, other.job_id)
+    assert len(calls) == 2
+
+    # 끝난 작업의 진행 중 키는 풀리므로 같은 요청은 새 작업이 된다.
+    again, again_coalesced = worker_b.submit("youtube", "channel", "UC1", run, {"max_videos": 3})
+    assert not again_coalesced
+    assert again.job_id != first.job_id
+    wait_done(worker_b, again.job_id)
+    worker_a.shutdown()
+    worker_b.shutdown()
+
+
+def test_failed_job_records_error(client):
+    queue = make_queue(client)
+
+    def run(progress):
+        raise RuntimeError("boom")
+
+    job, _ = queue.submit("youtube", "video", "v1", run, {})
+    done = wait_done(queue, job.job_id)
+    assert done.status == "failed"
+    assert done.error == "RuntimeError: boom"
+    queue.shutdown()
+
+
+def test_job_of_a_dead_worker_is_reported_failed_and_can_be_resubmitted(client):
+    queue = make_queue(client)
+    release = threading.Event()
+    job, _ = queue.submit("youtube", "channel", "UC1", lambda progress: release.wait(5), {})
+
+    # 실행 프로세스가 죽어 진행 중 키가 만료된 상황
+    client.delete(queue._inflight_key(job.key))
+    lost = queue.get(job.job_id)
+    assert lost.status == "failed"
+    assert "stopped before the job finished" in lost.error
+
+    retry, coalesced = make_queue(client).submit("youtube", "channel", "UC1", lambda progress: {}, {})
+    assert not coalesced
+    assert retry.job_id != job.job_id
+    release.set()
+    queue.shutdown()
+
+
+def test_pending_limit_is_enforced(client):
+    queue = make_queue(client, max_workers=1, max_pending=1)
+    release = threading.Event()
+    started = threading.Event()
+
+    def blocking(progress):
+        started.set()
+        release.wait(5)
+        return {}
+
+    queue.submit("youtube", "channel", "UC1", blocking, {})
+    assert started.wait(5)
+    queue.submit("youtube", "channel", "UC2", lambda progress: {}, {})
+    with pytest.raises(IngestionJobQueueFull):
+        queue.submit("youtube", "channel", "UC3", lambda progress: {}, {})
+    release.set()
+    queue.shutdown()
@@ -0,0 +1,180 @@
+"""
+IngestionPipeline 단위 테스트. 가짜 플랫폼 클라이언트/저장소/감정 분석기를 쓰므로 DB, 네트워크가 필요 없다.
+"""
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime
+
+import pytest
+
+from content.application.usecase.ingestion_pipeline import IngestionPipeline, IngestionPipelineError
+from content.domain.channel import Channel
+from content.domain.comment_sentiment import CommentSentiment
+from content.domain.video import Video
+from content.domain.video_comment import VideoComment
+from content.domain.video_sentiment import VideoSentiment
+
+
+class FakeClient:
+    platform = "youtube"
+
+    def fetch_channel(self, channel_id):
+        if channel_id == "UC_missing":
+            raise ValueError("channel not found")
+        return Channel(channel_id=channel_id, title=channel_id)
+
+    def fetch_videos(self, channel_id, max_results=10, published_after=None):
+        return [
+            Video(video_id=f"{channel_id}-v{i}", channel_id=channel_id, title="t", published_at=datetime.utcnow())
+            for i in range(max_results)
+        ]
+
+    def fetch_video(self, video_id):
+        return Video(video_id=video_id, channel_id="UC_other", title="t", published_at=datetime.utcnow())
+
+    def fetch_comments(self, video_id, max_results=50):
+        return [VideoComment(f"{video_id}-c{i}", video_id, None, "author", "good", 0, None) for i in range(max_results)]
+
+
+class FakeRepository:
+    """워커마다 하나씩 만들어지는 저장소. gate 가 주어지면 적재가 gate 가 열릴 때까지 막힌다."""
+
+    def __init__(self, registry: list, gate: threading.Event | None = None):
+        self.closed = False
+        self.videos: list[str] = []
+        self.sentiments: list[str] = []
+        self.gate = gate
+        registry.append(self)
+
+    @contextmanager
+    def unit_of_work(self):
+        if self.gate is not None:
+            self.gate.wait()
+        yield self
+
+    def upsert_videos(self, videos):
+        self.videos.extend(video.video_id for video in videos)
+
+    def upsert_video_sentiments(self, sentiments):
+        self.sentiments.extend(sentiment.video_id for sentiment in sentiments)
+
+    def close(self):
+        self.closed = True
+
+    def __getattr__(self, name):
+        # upsert_accounts / upsert_channels / upsert_comments / log_crawl 등은 기록하지 않는다.
+        return lambda *args, **kwargs: None
+
+
+class SlowSentiment:
+    def analyze_video(self, video):
+        time.sleep(0.05)
+        return VideoSentiment(video_id=video.video_id, sentiment_score=0.5, trend_score=1.0)
+
+    def analyze_comment(self, comment):
+        return CommentSentiment(comment_id=comment.comment_id, sentiment_score=0.5)
+
+
+def test_persists_before_analysis_and_isolates_item_failures():
+    repositories: list[FakeRepository] = []
+    lines: list[dict] = []
+    persisted_before_analysis: list[bool] = []
+
+    def on_item(line: dict) -> None:
+        lines.append(line)
+        if line["status"] == "succeeded":
+            analyzed = {video for repo in repositories for video in repo.sentiments}
+            persisted_before_analysis.append(not set(line["result"]["videos"]) <= analyzed)
+
+    client = FakeClient()
+    pipeline = IngestionPipeline(
+        lambda: FakeRepository(repositories),
+        SlowSentiment(),
+        fetch_workers=2,
+        persist_workers=1,
+        analyze_workers=2,
+        queue_size=1,
+        on_item=on_item,
+    ).start()
+    for channel_id in ("UC_a", "UC_b", "UC_missing"):
+        pipeline.submit_channel(client, channel_id, include_comments=True, max_videos=3, max_comments=2)
+    pipeline.submit_video(client, "v_single", include_comments=False)
+    stats = pipeline.close()
+
+    assert stats.fetched == 3
+    assert stats.persisted_videos == 7
+    assert stats.persisted_comments == 12
+    assert stats.analyzed_videos == 7
+    assert stats.analyzed_comments == 12
+    assert [f["target_id"] for f in stats.failures] == ["UC_missing"]
+    assert sorted((line["id"], line["status"]) for line in lines) == [
+        ("UC_a", "succeeded"),
+        ("UC_b", "succeeded"),
+        ("UC_missing", "failed"),
+        ("v_single", "succeeded"),
+    ]
+    assert all(persisted_before_analysis), "videos should be visible before their analysis is stored"
+    assert repositories and all(repo.closed for repo in repositories), "worker repositories must be closed"
+
+
+def test_submit_blocks_while_persist_stage_is_stalled():
+    repositories: list[FakeRepository] = []
+    gate = threading.Event()
+    submitted: list[str] = []
+    pipeline = IngestionPipeline(
+        lambda: FakeRepository(repositories, gate), fetch_workers=1, persist_workers=1, queue_size=1
+    ).start()
+    client = FakeClient()
+
+    def produce():
+        for index in range(10):
+            pipeline.submit_channel(client, f"UC_{index}", max_videos=1)
+            submitted.append(f"UC_{index}")
+
+    producer = threading.Thread(target=produce, daemon=True)
+    producer.start()
+    time.sleep(0.5)
+    # persist 워커 1건 + persist 큐 1건 + fetch 워커 1건 + fetch 큐 1건 이상은 받아들이지 않는다.
+    assert len(submitted) <= 4
+    assert producer.is_alive()
+
+    gate.set()
+    producer.join(timeout=5)
+    stats = pipeline.close()
+    assert len(submitted) == 10
+    assert stats.fetched == 10
+    assert stats.persisted_videos == 10
+
+
+def test_worker_failure_aborts_without_hanging():
+    def broken_factory():
+        raise ConnectionError("database unavailable")
+
+    started = time.monotonic()
+    pipeline = IngestionPipeline(broken_factory, fetch_workers=1, persist_workers=1, queue_size=1).start()
+    with pytest.raises(IngestionPipelineError) as raised:
+        for index in range(10):
+            pipeline.submit_channel(FakeClient(), f"UC_{index}", max_videos=1)
+        pipeline.close()
+    assert isinstance(raised.value.__cause__, ConnectionError)
+    # 중단된 뒤의 close 도 막히지 않고 같은 오류를 올린다.
+    with pytest.raises(IngestionPipelineError):
+        pipeline.close()
+    assert time.monotonic() - started < 5
+
+
+def test_cancel_discards_pending_work():
+    repositories: list[FakeRepository] = []
+    gate = threading.Event()
+    pipeline = IngestionPipeline(
+        lambda: FakeRepository(repositories, gate), fetch_workers=1, persist_workers=1, queue_size=1
+    ).start()
+    pipeline.submit_channel(FakeClient(), "UC_a", max_videos=1)
+    pipeline.cancel()
+    gate.set()
+    with pytest.raises(IngestionPipelineError):
+        pipeline.submit_channel(FakeClient(), "UC_b", max_videos=1)
+    with pytest.raises(IngestionPipelineError):
+        pipeline.close()
+    assert all(repo.closed for repo in repositories)
@@ -0,0 +1,95 @@
+import time
+
+import fakeredis
+import pytest
+
+from app.batch.leader_lease import RedisLeaderLease
+from app.batch.scheduler import BatchScheduler
+
+
+@pytest.fixture
+def client():
+    return fakeredis.FakeRedis(decode_responses=True)
+
+
+def make_lease(client, owner_id, ttl_seconds=60):
+    return RedisLeaderLease(client=client, key="test:leader", ttl_seconds=ttl_seconds, owner_id=owner_id)
+
+
+def test_only_one_instance_holds_the_lease(client):
+    first, second = make_lease(client, "a"), make_lease(client, "b")
+
+    assert first.try_acquire_or_renew()
+    assert not second.try_acquire_or_renew()
+    assert first.try_acquire_or_renew()  # 리더는 연장
+    assert second.current_holder() == "a"
+
+
+def test_renew_extends_ttl(client):
+    lease = make_lease(client, "a", ttl_seconds=10)
+    lease.try_acquire_or_renew()
+    client.pexpire("test:leader", 100)
+
+    assert lease.try_acquire_or_renew()
+    assert client.pttl("test:leader") > 5000
+
+
+def test_lease_fails_over_after_expiry_and_old_leader_steps_down(client):
+    first, second = make_lease(client, "a"), make_lease(client, "b")
+    first.try_acquire_or_renew()
+
+    client.delete("test:leader")  # 리더가 연장하지 못해 TTL 이 지난 상황
+    assert second.try_acquire_or_renew()
+    assert not first.try_acquire_or_renew()
+    assert not first.is_leader
+
+    # 리더가 아닌 인스턴스의 release 는 다른 인스턴스의 리스를 지우지 않는다.
+    first.release()
+    assert client.get("test:leader") == "b"
+    second.release()
+    assert client.get("test:leader") is None
+
+
+def test_redis_unavailable_means_not_leader():
+    server = fakeredis.FakeServer()
+    client = fakeredis.FakeRedis(server=server, decode_responses=True)
+    lease = make_lease(client, "a")
+    assert lease.try_acquire_or_renew()
+
+    server.connected = False
+    assert not lease.try_acquire_or_renew()
+    assert not lease.is_leader
+    assert not lease.job_lock("job").acquire()
+
+
+def test_job_lock_excludes_other_instances_until_released(client):
+    first, second = make_lease(client, "a"), make_lease(client, "b")
+    lock = first.job_lock("trend")
+    assert lock.acquire()
+    assert not second.job_lock("trend").acquire()
+    assert second.job_lock("other").acquire()
+
+    lock.release()
+    assert client.get("test:leader:run:trend") is None
+    assert second.job_lock("trend").acquire()
+
+
+def test_job_lock_is_renewed_while_running(client):
+    lock = make_lease(client, "a", ttl_seconds=1.5).job_lock("trend")
+    assert lock.acquire()
+    time.sleep(2.0)
+    assert client.get("test:leader:run:trend") == "a"
+    lock.release()
+    assert client.get("test:leader:run:trend") is None
+
+
+def test_scheduler_skips_run_held_by_another_instance(client):
+    held = make_lease(client, "b").job_lock("trend")
+    assert held.acquire()
+    scheduler = BatchScheduler(leader=make_lease(client, "a"))
+    calls = []
+
+    record = scheduler._execute("trend", lambda: calls.append(1))
+    assert record["status"] == "skipped"
+    assert calls == []
+    held.release()
@@ -0,0 +1,113 @@
+import time
+
+import fakeredis
+import pytest
+
+from content.infrastructure.queue.redis_work_queue import RedisWorkQueue
+
+
+@pytest.fixture
+def queue():
+    return RedisWorkQueue(
+        client=fakeredis.FakeRedis(decode_responses=True),
+        prefix="test:wq",
+        shards=2,
+        visibility_timeout_seconds=60,
+        max_attempts=2,
+        retry_backoff_seconds=0.001,
+        result_ttl_seconds=60,
+    )
+
+
+def by_channel(payload: dict) -> str:
+    return payload["channel_id"]
+
+
+def claim_all(queue, worker="w1"):
+    items = []
+    while (item := queue.claim(worker)) is not None:
+        items.append(item)
+    return items
+
+
+def test_claim_and_ack_completes_batch(queue):
+    batch = queue.enqueue([{"channel_id": "a"}, {"channel_id": "b"}], dedupe_key=by_channel)
+    assert len(batch["enqueued"]) == 2
+
+    items = claim_all(queue)
+    assert sorted(item.payload["channel_id"] for item in items) == ["a", "b"]
+    assert all(item.attempts == 1 for item in items)
+    assert queue.claim("w1") is None
+
+    for item in items:
+        assert queue.ack(item, {"channel_id": item.payload["channel_id"], "video_count": 1})
+    status = queue.batch_status(batch["batch_id"])
+    assert status["done"] and status["succeeded"] == 2
+    assert {record["result"]["channel_id"] for record in status["results"]} == {"a", "b"}
+
+
+def test_failed_item_is_retried_then_dead_lettered(queue):
+    batch = queue.enqueue([{"channel_id": "a"}], dedupe_key=by_channel)
+
+    item = queue.claim("w1")
+    assert queue.fail(item, "boom") == "retry"
+    time.sleep(0.01)
+    retried = queue.claim("w1")
+    assert retried.item_id == item.item_id
+    assert retried.attempts == 2
+    assert queue.fail(retried, "boom again") == "dead"
+
+    status = queue.batch_status(batch["batch_id"])
+    assert status["done"] and status["dead"] == 1
+    assert status["results"][0]["error"] == "boom again"
+
+
+def test_expired_claim_is_redelivered_and_stale_ack_is_ignored(queue):
+    batch = queue.enqueue([{"channel_id": "a"}], dedupe_key=by_channel)
+    stale = queue.claim("w1")
+    # 워커가 멈춰 가시성 마감이 지난 상황
+    queue.client.zadd(queue._processing_key(stale.shard), {stale.item_id: 0})
+
+    fresh = queue.claim("w2")
+    assert fresh.item_id == stale.item_id
+    assert fresh.token != stale.token
+    assert not queue.ack(stale, {"channel_id": "a", "video_count": 0})
+    assert not queue.extend(stale)
+    assert queue.fail(stale, "late") == "stale"
+    assert queue.ack(fresh, {"channel_id": "a", "video_count": 5})
+
+    status = queue.batch_status(batch["batch_id"])
+    assert status["succeeded"] == 1
+    assert status["results"][0]["worker"] == "w2"
+
+
+def test_expired_claim_on_last_attempt_is_dead_lettered(queue):
+    batch = queue.enqueue([{"channel_id": "a"}], dedupe_key=by_channel)
+    first = queue.claim("w1")
+    queue.client.zadd(queue._processing_key(first.shard), {first.item_id: 0})
+    second = queue.claim("w1")
+    queue.client.zadd(queue._processing_key(second.shard), {second.item_id: 0})
+
+    assert queue.claim("w1") is None
+    status = queue.batch_status(batch["batch_id"])
+    assert status["done"] and status["dead"] == 1
+
+
+def test_coalesced_item_is_awaited_by_the_new_batch(queue):
+    first = queue.enqueue([{"channel_id": "a"}], dedupe_key=by_channel)
+    second = queue.enqueue([{"channel_id": "a"}, {"channel_id": "b"}], dedupe_key=by_channel)
+    assert second["coalesced"] == {"a": first["enqueued"][0]}
+
+    status = queue.batch_status(second["batch_id"], include_results=False)
+    assert status["total"] == 2 and status["coalesced"] == 1
+
+    for item in claim_all(queue):
+        queue.ack(item, {"channel_id": item.payload["channel_id"], "video_count": 7})
+    assert queue.batch_status(first["batch_id"])["done"]
+    status = queue.batch_status(second["batch_id"])
+    assert status["done"] and status["succeeded"] == 2
+    assert {record["result"]["channel_id"] for record in status["results"]} == {"a", "b"}
+
+    # 끝난 항목은 중복 방지 키가 풀려 다시 넣을 수 있다.
+    third = queue.enqueue([{"channel_id": "a"}], dedupe_key=by_channel)
+    assert len(third["enqueued"]) == 1 and not third["coalesced"]
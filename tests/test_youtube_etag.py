@@ -0,0 +1,104 @@
+import fakeredis
+import httplib2
+import pytest
+from googleapiclient.errors import HttpError
+
+from content.infrastructure.client.youtube_client import YouTubeClient
+from content.infrastructure.client.youtube_etag_cache import ETagCache
+
+CHANNEL_RESPONSE = {
+    "etag": "etag-1",
+    "items": [
+        {
+            "id": "UC1",
+            "snippet": {"title": "channel", "publishedAt": "2024-01-01T00:00:00Z"},
+            "statistics": {"subscriberCount": "10", "viewCount": "100", "videoCount": "3"},
+        }
+    ],
+}
+
+
+class FakeKeyPool:
+    def __init__(self):
+        self.acquired = []
+
+    def acquire(self, method):
+        self.acquired.append(method)
+        return object()
+
+    def mark_exhausted(self, key):
+        raise AssertionError("unexpected quotaExceeded")
+
+
+class FakeRequest:
+    def __init__(self, uri, outcome):
+        self.uri = uri
+        self.headers = {}
+        self.outcome = outcome
+
+    def execute(self):
+        return self.outcome(self.headers)
+
+
+@pytest.fixture
+def client():
+    etag_cache = ETagCache(client=fakeredis.FakeRedis(decode_responses=True), key_prefix="test:etag", enabled=True)
+    youtube = YouTubeClient(settings=None, key_pool=FakeKeyPool(), channel_id_cache=object(), etag_cache=etag_cache)
+    youtube._service = lambda key: None
+    return youtube
+
+
+def not_modified_if_matched(headers):
+    if headers.get("If-None-Match") == "etag-1":
+        raise HttpError(httplib2.Response({"status": 304}), b"")
+    return CHANNEL_RESPONSE
+
+
+def execute(client, outcome, api_key="k1"):
+    requests = []
+
+    def build(service):
+        requests.append(FakeRequest(f"https://youtube/channels?id=UC1&part=snippet&key={api_key}", outcome))
+        return requests[-1]
+
+    return client._execute("channels.list", build, conditional=True), requests[-1]
+
+
+def test_304_reuses_stored_response_and_marks_items_not_modified(client):
+    first, first_request = execute(client, not_modified_if_matched)
+    assert "If-None-Match" not in first_request.headers
+    assert not client._parse_channel(client._items(first)[0]).not_modified
+
+    # 다른 API 키로 보낸 같은 요청도 같은 캐시 항목을 쓴다.
+    second, second_request = execute(client, not_modified_if_matched, api_key="k2")
+    assert second_request.headers["If-None-Match"] == "etag-1"
+    channel = client._parse_channel(client._items(second)[0])
+    assert channel.not_modified
+    assert channel.subscriber_count == 10
+    assert client.key_pool.acquired == ["channels.list", "channels.list"]
+
+
+def test_changed_response_replaces_stored_etag(client):
+    execute(client, not_modified_if_matched)
+    changed = {**CHANNEL_RESPONSE, "etag": "etag-2"}
+    response, _ = execute(client, lambda headers: changed)
+    assert not client._items(response)[0].get("_not_modified")
+
+    _, request = execute(client, lambda headers: changed)
+    assert request.headers["If-None-Match"] == "etag-2"
+
+
+def test_304_without_stored_response_is_raised(client):
+    def always_304(headers):
+        raise HttpError(httplib2.Response({"status": 304}), b"")
+
+    with pytest.raises(HttpError):
+        execute(client, always_304)
+
+
+def test_disabled_cache_sends_unconditional_requests(client):
+    client.etag_cache.enabled = False
+    execute(client, not_modified_if_matched)
+    response, request = execute(client, not_modified_if_matched)
+    assert "If-None-Match" not in request.headers
+    assert not response.get("_not_modified")
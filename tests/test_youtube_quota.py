@@ -0,0 +1,85 @@
+import fakeredis
+import pytest
+
+from content.infrastructure.client.youtube_quota import QuotaExhaustedError, YouTubeQuotaGovernor, quota_scope
+
+
+@pytest.fixture(autouse=True)
+def default_reserves(monkeypatch):
+    monkeypatch.setenv("YOUTUBE_QUOTA_RESERVE_CRITICAL", "0.2")
+    monkeypatch.setenv("YOUTUBE_QUOTA_RESERVE_NORMAL", "0.1")
+
+
+def make_governor(client=None, **kwargs):
+    kwargs.setdefault("daily_limit", 1000)
+    kwargs.setdefault("burst", 100_000)
+    kwargs.setdefault("max_wait_seconds", 0)
+    return YouTubeQuotaGovernor(
+        client=client or fakeredis.FakeRedis(decode_responses=True), key_prefix="test:quota", **kwargs
+    )
+
+
+def spend_until_refused(governor, method, priority):
+    calls = 0
+    while governor.try_acquire(method, priority)[0] == 1:
+        calls += 1
+    return calls
+
+
+def test_lower_priorities_stop_before_the_daily_limit():
+    governor = make_governor()
+    assert governor.priority_limits == {"critical": 1000, "normal": 800, "discovery": 700}
+
+    # search.list 는 100 unit
+    assert spend_until_refused(governor, "search.list", "discovery") == 7
+    assert spend_until_refused(governor, "search.list", "normal") == 1
+    assert spend_until_refused(governor, "search.list", "critical") == 2
+    status = governor.status()
+    assert status["spent"] == 1000
+    assert status["by_priority"] == {"discovery": 700, "normal": 100, "critical": 200}
+
+    with pytest.raises(QuotaExhaustedError):
+        governor.acquire("videos.list", "critical")
+
+
+def test_token_bucket_keeps_headroom_for_higher_priorities():
+    governor = make_governor(burst=200)
+
+    # discovery 는 버킷의 절반, normal 은 1/4 을 남겨 두고 멈춘다.
+    assert spend_until_refused(governor, "videos.list", "discovery") == 100
+    status, wait_ms = governor.try_acquire("videos.list", "discovery")
+    assert status == 0 and wait_ms > 0
+    assert spend_until_refused(governor, "videos.list", "normal") == 50
+    assert spend_until_refused(governor, "videos.list", "critical") == 50
+
+    with pytest.raises(QuotaExhaustedError):
+        governor.acquire("videos.list", "discovery")
+
+
+def test_mark_exhausted_stops_every_priority():
+    governor = make_governor()
+    governor.acquire("videos.list", "critical")
+    governor.mark_exhausted()
+    assert governor.try_acquire("videos.list", "critical")[0] == -1
+
+
+def test_quota_scope_sets_priority_and_collects_spend():
+    governor = make_governor()
+    with quota_scope("batch", priority="discovery") as outer:
+        with quota_scope("inner") as inner:
+            assert inner.priority == "discovery"
+            governor.acquire("search.list")
+            governor.acquire("videos.list")
+    assert inner.total == 101
+    assert outer.total == 101
+    assert outer.by_method == {"search.list": 100, "videos.list": 1}
+    assert governor.status()["by_priority"] == {"discovery": 101}
+
+
+def test_falls_back_to_in_process_accounting_without_redis():
+    server = fakeredis.FakeServer()
+    server.connected = False
+    governor = make_governor(client=fakeredis.FakeRedis(server=server, decode_responses=True))
+
+    assert spend_until_refused(governor, "search.list", "discovery") == 7
+    assert governor.status()["spent"] == 700